@@ -0,0 +1,249 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Ağır modüller (numpy, zamanlayıcılar) argümanlar çözüldükten sonra yüklenir;
+# --help ve hatalı kullanım anında döner.
+
+# runner.ALGORITHMS + EXTRA_ALGORITHMS sırasıyla; runner'ı yüklememek için burada tutulur
+METHODS = ['fcfs', 'sjf_non_preemptive', 'sjf_preemptive', 'round_robin', 'priority_non_preemptive',
+           'priority_preemptive', 'mlfq', 'cfs']
+DEFAULT_METHODS = METHODS[:6]
+RESULT_FORMAT_CHOICES = ['csv', 'jsonl', 'npz', 'none']
+# Yapılandırma dosyasında kullanılabilecek anahtarlar (komut satırı seçenekleriyle aynı)
+CONFIG_KEYS = ('workloads', 'algorithms', 'quantum', 'aging', 'switch_cost', 'cores', 'smp_mode', 'output_dir',
+               'report_dir', 'results_format', 'jobs', 'concurrent', 'cache', 'checkpoints', 'profile',
+               'time_points', 'window', 'window_edges')
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+def default_workloads(data_dir="data"):
+    # Aynı adlı .csv ve .wl (ör. convert_csv çıktısı) aynı çıktı klasörüne
+    # yazacağından yalnızca biri alınır: .wl, CSV ondan sonra
+    # değiştirilmemişse; aksi halde güncel olan CSV
+    found = {}
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.csv")) + glob.glob(os.path.join(data_dir, "*.wl"))):
+        stem = os.path.splitext(path)[0]
+        other = found.get(stem)
+        if other is None:
+            found[stem] = path
+        elif path.endswith(".wl") and os.path.getmtime(path) >= os.path.getmtime(other):
+            found[stem] = path
+    return sorted(found.values())
+
+def build_algorithms(methods, quantum=None, aging=0):
+    # runner.ALGORITHMS biçiminde liste; quantum ve aging varsayılanların üzerine yazılır
+    from runner import ALGORITHMS, EXTRA_ALGORITHMS
+    known = {algorithm[0]: algorithm for algorithm in ALGORITHMS + EXTRA_ALGORITHMS}
+    algorithms = []
+    for method in methods:
+        method, label, prefix, params = known[method]
+        params = dict(params)
+        if method == 'round_robin' and quantum is not None:
+            params['quantum'] = quantum
+            label = f"Round Robin (Q={quantum})"
+        if method.startswith('priority_') and aging:
+            params['aging'] = aging
+            label = f"{label} (aging={aging})"
+        algorithms.append((method, label, prefix, params))
+    return algorithms
+
+def stats_options(args):
+    # calculate_statistics ayarları; yalnızca verilenler (varsayılanlar önbellek anahtarını değiştirmesin)
+    options = {}
+    if args.time_points:
+        options['time_points'] = tuple(args.time_points)
+    if args.window is not None:
+        options['window'] = args.window
+    if args.window_edges:
+        options['window_edges'] = list(args.window_edges)
+    return options or None
+
+def run_workload(path, algorithms, args, pool):
+    # Tek bir iş yükünü çalıştırır: yükleme, algoritmalar (ortak süreç
+    # havuzunda), rapor ve profil. (case, sonuçlar, hata mesajı) döndürür.
+    from cache import RESULT_CACHE_DIR
+    from profiler import Profiler, parse_profile_spec
+    from runner import run_algorithms
+    from utils import generate_report
+    from workload import load_processes
+    
+    case_name = os.path.splitext(os.path.basename(path))[0]
+    profiler = Profiler()
+    with profiler.phase('load'):
+        processes = load_processes(path)
+    if not processes:
+        return case_name, [], f"no processes loaded from {path}"
+    
+    output_dir = os.path.join(args.output_dir, case_name)
+    os.makedirs(output_dir, exist_ok=True)
+    with profiler.phase('schedule'):
+        results = run_algorithms(processes, path, case_name, output_dir, algorithms,
+                                 switch_cost=args.switch_cost, cores=args.cores, smp_mode=args.smp_mode,
+                                 checkpoint_dir=f"{output_dir}/.checkpoints" if args.checkpoints else None,
+                                 profile=parse_profile_spec(args.profile),
+                                 results_format=None if args.results_format == 'none' else args.results_format,
+                                 cache_dir=os.path.join(args.output_dir, os.path.basename(RESULT_CACHE_DIR))
+                                 if args.cache else None,
+                                 pool=pool, stats=stats_options(args))
+    for result in results:
+        profiler.add(result['algorithm'], result.pop('profile'))
+    with profiler.phase('report'):
+        generate_report(results, case_name, args.report_dir)
+    profiler.save(f"{output_dir}/profile.json")
+    
+    error = None
+    if len(results) < len(algorithms):
+        error = f"{len(algorithms) - len(results)} of {len(algorithms)} algorithms failed"
+    return case_name, results, error
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        description="Run the scheduling algorithms on one or more workloads without prompting. "
+                    "Exits with 1 if any workload or algorithm fails.")
+    parser.add_argument('workloads', nargs='*', help="CSV or .wl workloads (default: data/*.csv and data/*.wl)")
+    parser.add_argument('--config', help="JSON file with default values for the options below")
+    parser.add_argument('-a', '--algorithms', nargs='+', choices=METHODS, default=DEFAULT_METHODS, metavar='ALGORITHM',
+                        help=f"algorithms to run: {', '.join(METHODS)} (default: the first six)")
+    parser.add_argument('-q', '--quantum', type=positive_int, default=None, help="Round Robin quantum (default: 4)")
+    parser.add_argument('-g', '--aging', type=int, default=0, help="priority aging interval, 0 disables (default: 0)")
+    parser.add_argument('-s', '--switch-cost', type=int, default=0, help="context switch cost (default: 0)")
+    parser.add_argument('-c', '--cores', type=positive_int, default=1, help="number of CPU cores (default: 1)")
+    parser.add_argument('--smp-mode', choices=['global', 'per_core'], default='global', help="multi-core queueing")
+    parser.add_argument('-o', '--output-dir', default="outputs", help="output root (default: outputs)")
+    parser.add_argument('--report-dir', default="reports", help="report directory (default: reports)")
+    parser.add_argument('-f', '--results-format', choices=RESULT_FORMAT_CHOICES, default='csv',
+                        help="per-process results file format (default: csv)")
+    parser.add_argument('-j', '--jobs', type=positive_int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('-w', '--concurrent', type=positive_int, default=2,
+                        help="workloads processed at the same time (default: 2)")
+    parser.add_argument('--no-cache', dest='cache', action='store_false', help="do not use the result cache")
+    parser.add_argument('--no-checkpoints', dest='checkpoints', action='store_false',
+                        help="do not resume from or write checkpoints")
+    parser.add_argument('--profile', default=None, help="e.g. cprofile:sjf_preemptive or tracemalloc")
+    parser.add_argument('-t', '--time-points', nargs='+', type=int, default=None,
+                        help="throughput checkpoints (default: 50 100 150 200)")
+    parser.add_argument('--window', type=int, default=None,
+                        help="width of the windowed metrics (default: ten equal windows)")
+    parser.add_argument('--window-edges', nargs='+', type=int, default=None, help="explicit window boundaries")
+    return parser
+
+def _check_config(parser, config):
+    # Yapılandırma değerleri komut satırıyla aynı tip ve seçenek
+    # kontrollerinden geçer; dönüştürülmüş değerler döner
+    actions = {action.dest: action for action in parser._actions}
+    checked = {}
+    for key, value in config.items():
+        action = actions[key]
+        if value is None:
+            checked[key] = None
+            continue
+        if isinstance(action.default, bool):
+            # --no-cache gibi bayraklar: değer true/false olmalı
+            if not isinstance(value, bool):
+                parser.error(f"config value for {key} must be true or false")
+            checked[key] = value
+            continue
+        many = action.nargs in ('+', '*')
+        if many and not isinstance(value, list):
+            parser.error(f"config value for {key} must be a list")
+        values = []
+        for item in value if many else [value]:
+            if isinstance(item, (bool, list, dict)):
+                parser.error(f"invalid config value for {key}: {item!r}")
+            try:
+                # JSON'daki 2.5 ya da "abc" komut satırındaki gibi reddedilir
+                item = action.type(str(item)) if action.type else str(item)
+            except (ValueError, argparse.ArgumentTypeError) as e:
+                parser.error(f"invalid config value for {key}: {e}")
+            if action.choices is not None and item not in action.choices:
+                parser.error(f"invalid config value for {key}: {item!r} (choose from {', '.join(action.choices)})")
+            values.append(item)
+        checked[key] = values if many else values[0]
+    return checked
+
+def parse_args(argv=None):
+    # Yapılandırma dosyası varsayılanları belirler; komut satırı önceliklidir
+    parser = _parser()
+    args, _ = parser.parse_known_args(argv)
+    if args.config:
+        try:
+            with open(args.config) as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read config {args.config}: {e}")
+        unknown = sorted(set(config) - set(CONFIG_KEYS))
+        if unknown:
+            parser.error(f"unknown config keys: {', '.join(unknown)}")
+        parser.set_defaults(**_check_config(parser, config))
+    args = parser.parse_args(argv)
+    if not args.workloads:
+        args.workloads = default_workloads()
+    if args.window is not None and args.window <= 0:
+        parser.error("--window must be positive")
+    if args.window_edges is not None and len(set(args.window_edges)) < 2:
+        parser.error("--window-edges needs at least two distinct values")
+    if args.aging < 0 or args.switch_cost < 0:
+        parser.error("--aging and --switch-cost cannot be negative")
+    if args.cores > 1 and args.switch_cost:
+        parser.error("switch cost is not modelled in multi-core mode")
+    if args.cores > 1 and args.aging:
+        parser.error("aging is not modelled in multi-core mode")
+    if args.cores > 1 and set(args.algorithms) & {'mlfq', 'cfs'}:
+        parser.error("mlfq and cfs run on a single core only")
+    cases = [os.path.splitext(os.path.basename(path))[0] for path in args.workloads]
+    duplicates = sorted({case for case in cases if cases.count(case) > 1})
+    if duplicates:
+        parser.error(f"workloads share an output name: {', '.join(duplicates)}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.workloads:
+        print("ERROR: no workloads given and none found in data/", file=sys.stderr)
+        return 1
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from profiler import parse_profile_spec
+    try:
+        parse_profile_spec(args.profile)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    algorithms = build_algorithms(args.algorithms, args.quantum, args.aging)
+    
+    # Tüm iş yükleri tek bir süreç havuzunu paylaşır; iş parçacıkları yükleme,
+    # önbellek ve dosya yazımını yürütürken algoritmalar havuzda çalışır
+    failures = []
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool, \
+            ThreadPoolExecutor(max_workers=max(args.concurrent, 1)) as threads:
+        futures = [(path, threads.submit(run_workload, path, algorithms, args, pool)) for path in args.workloads]
+        for path, future in futures:
+            try:
+                case_name, results, error = future.result()
+            except Exception as e:
+                case_name, results, error = os.path.splitext(os.path.basename(path))[0], [], str(e)
+            outcomes.append((case_name, results))
+            if error:
+                failures.append(f"{path}: {error}")
+    
+    print(f"\n{'Workload':<20} {'Algorithm':<32} {'Avg Wait':>10} {'Avg Turn':>10} {'CPU Eff%':>9}")
+    print("-" * 85)
+    for case_name, results in outcomes:
+        for result in results:
+            print(f"{case_name:<20} {result['algorithm']:<32} {result['avg_waiting']:>10.2f} "
+                  f"{result['avg_turnaround']:>10.2f} {result['cpu_efficiency']:>9.2f}")
+    for failure in failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
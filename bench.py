@@ -0,0 +1,252 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from process import ProcessTable
+from runner import ALGORITHMS, EXTRA_ALGORITHMS
+from scheduler import Scheduler
+from utils import calculate_statistics
+from workload import WORKLOAD_SUFFIX, load_workload, save_workload
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_VERSION = 1
+BENCH_SIZES = (100, 1000, 10000, 100000)
+BURST_DISTRIBUTIONS = ('exponential', 'pareto', 'uniform')
+# Süre karşılaştırmasında çok kısa hücrelerin gürültüsü için mutlak pay (saniye)
+BENCH_SLACK = 0.01
+
+def generate_workload(n, seed=0, load=0.9, mean_burst=5, burst='exponential', alpha=1.5, max_burst=10 ** 6,
+                      priority_mix=(0.2, 0.5, 0.3)):
+    # Tohumlu sentetik iş yükü. Varışlar Poisson sürecidir: ardışık varış
+    # aralıkları üstel dağılımlı, ortalaması mean_burst / load (load ~ CPU
+    # kullanım oranı). burst: 'exponential', 'pareto' (ağır kuyruklu, Lomax;
+    # alpha küçüldükçe kuyruk kalınlaşır) ya da 'uniform'. Süreler en az 1,
+    # en çok max_burst'tür. priority_mix high/normal/low olasılıklarıdır.
+    if burst not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"unknown burst distribution: {burst}")
+    if load <= 0 or mean_burst < 1:
+        raise ValueError("load must be positive and mean_burst at least 1")
+    if burst == 'pareto' and alpha <= 1:
+        raise ValueError("pareto bursts need alpha > 1 for a finite mean")
+    rng = np.random.default_rng(seed)
+    arrival = np.floor(np.cumsum(rng.exponential(mean_burst / load, n)))
+    if n and arrival[-1] > np.iinfo(np.int32).max:
+        raise ValueError("arrival times do not fit in 32 bits; raise load or lower mean_burst")
+    if burst == 'exponential':
+        bursts = np.ceil(rng.exponential(mean_burst, n))
+    elif burst == 'pareto':
+        # Lomax ortalaması scale / (alpha - 1)
+        bursts = np.ceil(rng.pareto(alpha, n) * mean_burst * (alpha - 1))
+    else:
+        bursts = rng.integers(1, 2 * mean_burst, n, endpoint=True)
+    bursts = np.clip(bursts, 1, max_burst)
+    mix = np.asarray(priority_mix, dtype=np.float64)
+    priority_num = rng.choice(np.array([1, 2, 3], dtype=np.int32), n, p=mix / mix.sum())
+    width = len(str(max(n - 1, 0))) + 1
+    pids = np.char.add('P', np.char.zfill(np.arange(n).astype(str), width - 1)).astype(f'U{width}')
+    return ProcessTable(pids, arrival.astype(np.int32), bursts.astype(np.int32), priority_num)
+
+def _rss_kb():
+    # Sürecin şimdiye kadarki en yüksek bellek kullanımı (KB); macOS bayt verir
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def _bench_cell(workload_path, method, params, repeat, use_tracemalloc):
+    # Ayrı bir süreçte çalışır; böylece en yüksek bellek yalnızca bu hücreye aittir
+    processes = load_workload(workload_path)
+    seconds = []
+    rss_before = _rss_kb()
+    peak_mb = None
+    if use_tracemalloc:
+        # İzleme çalıştırmayı birkaç kat yavaşlattığından ayrı ve zamanlanmaz
+        tracemalloc.start()
+        getattr(Scheduler(), method)(processes, **params)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    for k in range(repeat):
+        started = time.perf_counter()
+        timeline, result = getattr(Scheduler(), method)(processes, **params)
+        seconds.append(time.perf_counter() - started)
+        if k < repeat - 1:
+            del timeline, result
+    if peak_mb is None and rss_before is not None:
+        peak_mb = (_rss_kb() - rss_before) / 1024
+    
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = calculate_statistics(result, method, "bench", timeline=timeline)
+    stats_seconds = time.perf_counter() - started
+    return {
+        'seconds': round(min(seconds), 6),
+        'stats_seconds': round(stats_seconds, 6),
+        'peak_mb': round(peak_mb, 2) if peak_mb is not None else None,
+        'slices': len(timeline),
+        'avg_waiting': results['avg_waiting'],
+        # Sonuç değişirse (ör. sıralama hatası) karşılaştırma bunu da yakalar
+        'checksum': int(result.completion.sum(dtype=np.int64)),
+    }
+
+def run_benchmarks(sizes=BENCH_SIZES, methods=None, config=None, repeat=1, use_tracemalloc=False, workdir=None):
+    # Her (boyut, algoritma) hücresi taze bir işçi süreçte çalışır. İş yükü
+    # her boyut için bir kez üretilip ikili dosyaya yazılır.
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    config = dict(config or {})
+    algorithms = {method: (label, params) for method, label, _, params in ALGORITHMS + EXTRA_ALGORITHMS}
+    if methods is None:
+        methods = [method for method, _, _, _ in ALGORITHMS]
+    rows = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"bench_{size}{WORKLOAD_SUFFIX}")
+            started = time.perf_counter()
+            save_workload(generate_workload(size, **config), path)
+            print(f"Generated {size} processes in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+            for method in methods:
+                label, params = algorithms[method]
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    row = pool.submit(_bench_cell, path, method, params, repeat, use_tracemalloc).result()
+                row = dict(size=size, method=method, algorithm=label, **row)
+                print(f"  {label:<25} n={size:<9} {row['seconds']:>10.4f}s  "
+                      f"peak={row['peak_mb'] if row['peak_mb'] is not None else '-'} MB", file=sys.stderr)
+                rows.append(row)
+    return rows
+
+def compare(rows, baseline, tolerance=0.25, memory_tolerance=0.5):
+    # Taban çizgisine göre gerilemeleri döndürür: süre tolerance, bellek
+    # memory_tolerance oranında artmışsa ya da sonuç özeti değişmişse
+    reference = {(row['size'], row['method']): row for row in baseline['results']}
+    problems = []
+    for row in rows:
+        base = reference.get((row['size'], row['method']))
+        if base is None:
+            continue
+        cell = f"{row['algorithm']} n={row['size']}"
+        if row['checksum'] != base['checksum']:
+            problems.append(f"{cell}: results changed (checksum {base['checksum']} -> {row['checksum']})")
+        if row['seconds'] > base['seconds'] * (1 + tolerance) + BENCH_SLACK:
+            problems.append(f"{cell}: {base['seconds']:.4f}s -> {row['seconds']:.4f}s")
+        if (row['peak_mb'] is not None and base.get('peak_mb') is not None
+                and row['peak_mb'] > base['peak_mb'] * (1 + memory_tolerance) + 1):
+            problems.append(f"{cell}: peak {base['peak_mb']} MB -> {row['peak_mb']} MB")
+    return problems
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+def _size(text):
+    # 1e6 gibi yazımlar da kabul edilir
+    return int(float(text))
+
+def _add_workload_arguments(parser):
+    parser.add_argument('--seed', type=int, default=0, help="generator seed (default: 0)")
+    parser.add_argument('--load', type=float, default=0.9, help="offered CPU load, mean burst / mean gap (default: 0.9)")
+    parser.add_argument('--mean-burst', type=int, default=5, help="mean CPU burst (default: 5)")
+    parser.add_argument('--burst', choices=BURST_DISTRIBUTIONS, default='exponential',
+                        help="burst distribution (default: exponential)")
+    parser.add_argument('--alpha', type=float, default=1.5, help="pareto tail index (default: 1.5)")
+    parser.add_argument('--max-burst', type=int, default=10 ** 6, help="burst cap (default: 1000000)")
+    parser.add_argument('--mix', nargs=3, type=float, default=[0.2, 0.5, 0.3], metavar=('HIGH', 'NORMAL', 'LOW'),
+                        help="priority mix (default: 0.2 0.5 0.3)")
+
+def _workload_config(args):
+    return {'seed': args.seed, 'load': args.load, 'mean_burst': args.mean_burst, 'burst': args.burst,
+            'alpha': args.alpha, 'max_burst': args.max_burst, 'priority_mix': list(args.mix)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling engines on synthetic workloads.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    run = commands.add_parser('run', help="time every algorithm at each size")
+    run.add_argument('-n', '--sizes', nargs='+', type=_size, default=list(BENCH_SIZES),
+                     help="workload sizes, e.g. 1e2 1e4 1e6 (default: 1e2..1e5)")
+    run.add_argument('-a', '--algorithms', nargs='+', default=None,
+                     choices=[method for method, _, _, _ in ALGORITHMS + EXTRA_ALGORITHMS])
+    run.add_argument('-r', '--repeat', type=positive_int, default=1, help="runs per cell, the fastest counts (default: 1)")
+    run.add_argument('--tracemalloc', action='store_true',
+                     help="measure peak memory with tracemalloc in an extra untimed run")
+    run.add_argument('-o', '--output', default=None, help="save results as a baseline JSON file")
+    run.add_argument('--compare', default=None, help="baseline JSON to compare against; regressions exit with 1")
+    run.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown ratio (default: 0.25)")
+    run.add_argument('--memory-tolerance', type=float, default=0.5, help="allowed memory growth ratio (default: 0.5)")
+    _add_workload_arguments(run)
+    
+    generate = commands.add_parser('generate', help="write a synthetic workload to a CSV or .wl file")
+    generate.add_argument('-n', '--size', type=_size, required=True)
+    generate.add_argument('-o', '--output', required=True, help="output file (.csv or .wl)")
+    _add_workload_arguments(generate)
+    args = parser.parse_args(argv)
+    config = _workload_config(args)
+    
+    if args.command == 'generate':
+        table = generate_workload(args.size, **config)
+        if args.output.endswith(WORKLOAD_SUFFIX):
+            save_workload(table, args.output)
+        else:
+            names = np.array(['', 'high', 'normal', 'low'])[table.priority_num]
+            with open(args.output, 'w') as f:
+                f.write("Process_ID,Arrival_Time,CPU_Burst_Time,Priority\n")
+                for start in range(0, len(table), 1 << 16):
+                    end = start + (1 << 16)
+                    f.write("".join([f"{p},{a},{b},{q}\n" for p, a, b, q in
+                                     zip(table.pids[start:end].tolist(), table.arrival[start:end].tolist(),
+                                         table.burst[start:end].tolist(), names[start:end].tolist())]))
+        print(f"Generated {len(table)} processes: {args.output}")
+        return 0
+    
+    # Bellek ölçüm yöntemi de karşılaştırılabilirliği etkiler
+    recorded = dict(config, tracemalloc=args.tracemalloc)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BENCH_VERSION or baseline.get('config') != recorded:
+            print("ERROR: baseline was recorded with a different version, workload configuration or "
+                  "memory measurement (--tracemalloc)", file=sys.stderr)
+            return 2
+    
+    rows = run_benchmarks(args.sizes, args.algorithms, config, args.repeat, args.tracemalloc)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'version': BENCH_VERSION,
+                'created': datetime.datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.platform(),
+                'config': recorded,
+                'results': rows,
+            }, f, indent=2)
+        print(f"Baseline saved: {args.output}")
+    else:
+        print(json.dumps(rows, indent=2))
+    
+    if baseline is not None:
+        problems = compare(rows, baseline, args.tolerance, args.memory_tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
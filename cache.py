@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+# Önbellek anahtarına girer; sonuçları ya da dosya biçimlerini etkileyen bir
+# değişiklikte artırılmalı
+RESULT_CACHE_VERSION = 3
+RESULT_CACHE_DIR = "outputs/.cache"
+RESULT_CACHE_LIMIT = 1 << 30
+_STATS_FILE = 'results.pkl'
+
+# Her girdi anahtar adlı bir klasördür: istatistik sözlüğü (sonuç sütunları
+# dahil) ve algoritmanın yazdığı çıktı dosyalarının kopyaları. Son kullanım
+# zamanı klasörün mtime'ıdır; toplam boyut sınırı aşılınca en eski
+# kullanılan girdiler silinir.
+
+class ResultCache:
+    def __init__(self, directory=RESULT_CACHE_DIR, limit=RESULT_CACHE_LIMIT):
+        self.directory = directory
+        self.limit = limit
+        os.makedirs(directory, exist_ok=True)
+    
+    @staticmethod
+    def key(workload_digest, method, params, **settings):
+        # İş yükü içeriğinin özeti + algoritma + parametreler + diğer ayarlar
+        raw = json.dumps([RESULT_CACHE_VERSION, workload_digest, method, params, settings], sort_keys=True)
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+    
+    def get(self, key):
+        # (istatistik sözlüğü, girdi klasörü) ya da bulunamazsa None
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, _STATS_FILE), 'rb') as f:
+                results = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        os.utime(entry)
+        return results, entry
+    
+    def put(self, key, results, files=()):
+        # Girdi önce geçici klasörde hazırlanıp tek adımda yerine konur;
+        # yarım bir girdi hiçbir zaman görünmez
+        staging = tempfile.mkdtemp(prefix=key + '.', suffix='.tmp', dir=self.directory)
+        try:
+            for path in files:
+                shutil.copy2(path, os.path.join(staging, os.path.basename(path)))
+            with open(os.path.join(staging, _STATS_FILE), 'wb') as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry = self._entry(key)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except OSError as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            print(f"Error writing result cache: {e}")
+            return
+        self.evict()
+    
+    def add_file(self, key, path):
+        # Sonradan yazılan bir çıktı dosyasını (ör. süreç sonuçları) girdiye ekler
+        entry = self._entry(key)
+        if not os.path.isdir(entry):
+            return
+        target = os.path.join(entry, os.path.basename(path))
+        try:
+            shutil.copy2(path, target + '.tmp')
+            os.replace(target + '.tmp', target)
+        except OSError as e:
+            print(f"Error writing result cache: {e}")
+            return
+        self.evict()
+    
+    def evict(self):
+        # Toplam boyut sınırın altına inene kadar en eski kullanılan girdileri sil
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            entry = self._entry(name)
+            if name.endswith('.tmp') or not os.path.isdir(entry):
+                continue
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+                entries.append((os.path.getmtime(entry), size, entry))
+            except OSError:
+                # Başka bir iş parçacığı tarafından o sırada silinmiş
+                continue
+            total += size
+        for _, size, entry in sorted(entries):
+            if total <= self.limit:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+def install(entry, name, target):
+    # Önbellekteki dosyayı çıktı klasörüne kopyalar. copy2 değiştirilme
+    # zamanını koruduğundan hedef zaten aynı kopyaysa yeniden yazılmaz.
+    source = os.path.join(entry, name)
+    if not os.path.exists(source):
+        return False
+    try:
+        stat = os.stat(target)
+        cached = os.stat(source)
+        if stat.st_size == cached.st_size and stat.st_mtime_ns == cached.st_mtime_ns:
+            return True
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    shutil.copy2(source, target + '.tmp')
+    os.replace(target + '.tmp', target)
+    return True
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import pickle
+import numpy as np
+from process import ProcessTable
+from utils import THROUGHPUT_TIME_POINTS, aggregate_statistics, merge_statistics
+
+# Dosya biçimi değiştiğinde artırılmalı; eski kontrol noktaları yok sayılır
+CHECKPOINT_VERSION = 2
+CHECKPOINT_SUFFIX = '.ckpt'
+
+# Kontrol noktası, bir algoritmanın bilinen son varışı kuyruğa aldığı
+# andaki motor durumu (zaman, hazır kuyruğu, süreç sütunları, zaman
+# çizelgesi) ile o ana kadar biten süreçlerin istatistik özetidir. İş
+# yüküne sonradan eklenen satırların varışları bu anda ya da sonrasındaysa
+# yalnızca kuyruk simüle edilir ve istatistikler özetle birleştirilir.
+
+def workload_digest(table, count):
+    # İlk `count` satırın özeti; önceki satırlar değişmişse devam edilmez
+    digest = hashlib.sha256()
+    for column in (table.arrival, table.burst, table.priority_num):
+        digest.update(np.ascontiguousarray(column[:count], dtype='<i4').tobytes())
+    # PID'ler tablonun sütun genişliğinden bağımsız olsun diye en kısa genişliğe getirilir
+    pids = np.asarray(table.pids[:count], dtype=str)
+    width = max(int(np.char.str_len(pids).max()), 1) if count else 1
+    digest.update(pids.astype(f'<U{width}').tobytes())
+    return digest.hexdigest()
+
+def load_checkpoint(path):
+    try:
+        with open(path, 'rb') as f:
+            checkpoint = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get('version') != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+def save_checkpoint(checkpoint, path):
+    # Yarım yazılmış bir dosya bırakmamak için önce geçici dosyaya yazılır
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+def _resumable(checkpoint, key, table):
+    count = checkpoint['count']
+    if checkpoint['key'] != key or count > len(table):
+        return False
+    if count < len(table) and int(table.arrival[count:].min()) < checkpoint['horizon']:
+        return False
+    return workload_digest(table, count) == checkpoint['digest']
+
+def run_checkpointed(scheduler, method, processes, params, path, time_points=THROUGHPUT_TIME_POINTS):
+    # scheduler.method(processes, **params) çalıştırır; geçerli bir kontrol
+    # noktası varsa oradan devam eder ve yenisini yazar. (timeline, sonuç
+    # tablosu, calculate_statistics için base) döndürür; base None ise
+    # istatistikler baştan hesaplanmalıdır. Özetteki throughput anları
+    # time_points'tir; calculate_statistics'e de aynıları verilmelidir.
+    table = ProcessTable.of(processes)
+    if not hasattr(scheduler, 'capture'):
+        # Çok çekirdekli motor devam etmeyi desteklemez
+        timeline, result = getattr(scheduler, method)(table, **params)
+        return timeline, result, None
+    
+    key = [method, params, scheduler.switch_cost, list(time_points)]
+    checkpoint = load_checkpoint(path) if os.path.exists(path) else None
+    if checkpoint is not None and not _resumable(checkpoint, key, table):
+        print(f"Checkpoint {path} does not match the workload, simulating from t=0")
+        checkpoint = None
+    if checkpoint is not None:
+        scheduler.resume = checkpoint['state']
+        print(f"Resuming from checkpoint: {checkpoint['count']} processes already simulated, "
+              f"{len(table) - checkpoint['count']} new")
+    
+    scheduler.capture = True
+    timeline, result = getattr(scheduler, method)(table, **params)
+    state = scheduler.checkpoint
+    scheduler.capture = False
+    
+    # Durum motor tarafından kullanılmadıysa (devam desteklenmiyor) baştan hesaplanır
+    if checkpoint is not None and scheduler.resume is None:
+        summary = checkpoint['summary']
+        rows = np.concatenate((checkpoint['pending'], np.arange(checkpoint['count'], len(table))))
+        base = (summary, rows)
+    else:
+        scheduler.resume = None
+        summary = None
+        rows = np.arange(len(table))
+        base = None
+    
+    if state is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return timeline, result, base
+    
+    # Kontrol noktasında bitmiş olan süreçlerin sonuçları artık değişmez;
+    # özete eklenir, kalanlar bir sonraki çalıştırmada yeniden özetlenir
+    completion = state['completion']
+    finished = np.array([completion[i] > 0 for i in rows.tolist()], dtype=bool)
+    finished_summary = aggregate_statistics(result, rows[finished], time_points)
+    save_checkpoint({
+        'version': CHECKPOINT_VERSION,
+        'key': key,
+        'count': len(table),
+        'horizon': int(table.arrival.max()) if len(table) else 0,
+        'digest': workload_digest(table, len(table)),
+        'state': state,
+        'summary': finished_summary if summary is None else merge_statistics(summary, finished_summary),
+        'pending': rows[~finished],
+    }, path)
+    return timeline, result, base
@@ -1,8 +1,13 @@
 import os
-import time
+import sys
+from batch import default_workloads
+from cache import RESULT_CACHE_DIR
 from process import Process
-from scheduler import Scheduler
-from utils import read_csv, save_timeline, calculate_statistics, save_results, generate_report
+from profiler import PROFILE_ENV, Profiler, parse_profile_spec
+from runner import ALGORITHMS, run_algorithms
+from utils import generate_report
+from workload import load_processes
+from writer import RESULT_FORMATS
 
 def main():
     print("\n" + "="*60)
@@ -12,6 +17,15 @@ def main():
     print("="*60)
     
     try:
+        # Aşama süreleri her çalıştırmada toplanır; SCHED_PROFILE ile seçilen
+        # algoritmalar ayrıca cProfile/tracemalloc altında çalışır
+        profiler = Profiler()
+        profile = parse_profile_spec(os.environ.get(PROFILE_ENV))
+        # Tüm süreçlerin sonuçları bu biçimde yazılır (csv, jsonl, npz)
+        results_format = os.environ.get('SCHED_RESULTS_FORMAT', 'csv')
+        if results_format not in RESULT_FORMATS:
+            raise ValueError(f"unknown results format: {results_format}")
+        
         # data klasörünü kontrol et
         if not os.path.exists("data"):
             print("\nCreating data folder...")
@@ -20,8 +34,8 @@ def main():
             input("\nPress Enter to exit...")
             return
         
-        # CSV dosyalarını listele
-        csv_files = [f for f in os.listdir("data") if f.endswith('.csv')]
+        # CSV ve ikili iş yükü dosyalarını listele (aynı adlı çiftten yalnızca biri)
+        csv_files = [os.path.basename(path) for path in default_workloads("data")]
         if not csv_files:
             print("\nNo CSV files found in data folder!")
             print("Please add case1.csv and case2.csv")
@@ -43,13 +57,14 @@ def main():
             choice = 1
         
         selected_file = csv_files[choice-1]
-        case_name = selected_file.replace('.csv', '')
+        case_name = os.path.splitext(selected_file)[0]
         csv_path = f"data/{selected_file}"
         
         print(f"\nSelected: {selected_file}")
         
-        # CSV'yi oku
-        processes = read_csv(csv_path)
+        # CSV'yi veya ikili iş yükünü oku
+        with profiler.phase('load'):
+            processes = load_processes(csv_path)
         
         if not processes:
             print("\n❌ ERROR: No processes loaded!")
@@ -78,102 +93,34 @@ def main():
         
         input("\nPress Enter to start simulation...")
         
-        # Scheduler'ı başlat
-        scheduler = Scheduler()
-        
         print("\n" + "="*60)
         print("RUNNING SCHEDULING ALGORITHMS")
         print("="*60)
         
-        start_time = time.time()
-        
         # Çıktı klasörlerini oluştur
         output_dir = f"outputs/{case_name}"
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs("reports", exist_ok=True)
         
-        all_results = []
-        
-        # 1. FCFS
-        print("\n1️⃣  Running FCFS (First Come First Served)...")
-        try:
-            timeline, result_procs = scheduler.fcfs(processes)
-            results = calculate_statistics(result_procs, "FCFS", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/FCFS_timeline.txt")
-            save_results(results, f"{output_dir}/FCFS_results.txt")
-            print("   ✅ FCFS completed")
-        except Exception as e:
-            print(f"   ❌ FCFS failed: {e}")
-        
-        # 2. Non-Preemptive SJF
-        print("\n2️⃣  Running Non-Preemptive SJF...")
-        try:
-            timeline, result_procs = scheduler.sjf_non_preemptive(processes)
-            results = calculate_statistics(result_procs, "Non-Preemptive SJF", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/SJF_NonPreemptive_timeline.txt")
-            save_results(results, f"{output_dir}/SJF_NonPreemptive_results.txt")
-            print("   ✅ Non-Preemptive SJF completed")
-        except Exception as e:
-            print(f"   ❌ Non-Preemptive SJF failed: {e}")
-        
-        # 3. Preemptive SJF
-        print("\n3️⃣  Running Preemptive SJF...")
-        try:
-            timeline, result_procs = scheduler.sjf_preemptive(processes)
-            results = calculate_statistics(result_procs, "Preemptive SJF", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/SJF_Preemptive_timeline.txt")
-            save_results(results, f"{output_dir}/SJF_Preemptive_results.txt")
-            print("   ✅ Preemptive SJF completed")
-        except Exception as e:
-            print(f"   ❌ Preemptive SJF failed: {e}")
-        
-        # 4. Round Robin
-        print("\n4️⃣  Running Round Robin (Quantum=4)...")
-        try:
-            timeline, result_procs = scheduler.round_robin(processes, quantum=4)
-            results = calculate_statistics(result_procs, "Round Robin (Q=4)", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/RoundRobin_timeline.txt")
-            save_results(results, f"{output_dir}/RoundRobin_results.txt")
-            print("   ✅ Round Robin completed")
-        except Exception as e:
-            print(f"   ❌ Round Robin failed: {e}")
-        
-        # 5. Non-Preemptive Priority
-        print("\n5️⃣  Running Non-Preemptive Priority...")
-        try:
-            timeline, result_procs = scheduler.priority_non_preemptive(processes)
-            results = calculate_statistics(result_procs, "Non-Preemptive Priority", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/Priority_NonPreemptive_timeline.txt")
-            save_results(results, f"{output_dir}/Priority_NonPreemptive_results.txt")
-            print("   ✅ Non-Preemptive Priority completed")
-        except Exception as e:
-            print(f"   ❌ Non-Preemptive Priority failed: {e}")
-        
-        # 6. Preemptive Priority
-        print("\n6️⃣  Running Preemptive Priority...")
-        try:
-            timeline, result_procs = scheduler.priority_preemptive(processes)
-            results = calculate_statistics(result_procs, "Preemptive Priority", case_name)
-            all_results.append(results)
-            save_timeline(timeline, f"{output_dir}/Priority_Preemptive_timeline.txt")
-            save_results(results, f"{output_dir}/Priority_Preemptive_results.txt")
-            print("   ✅ Preemptive Priority completed")
-        except Exception as e:
-            print(f"   ❌ Preemptive Priority failed: {e}")
-        
-        execution_time = time.time() - start_time
+        # Altı algoritma süreç havuzunda paralel çalışır
+        print(f"\nRunning {len(ALGORITHMS)} algorithms in parallel...")
+        # Değişmeyen algoritmaların sonuçları önbellekten gelir; kontrol
+        # noktaları sayesinde sonuna satır eklenmiş bir iş yükünde yalnızca
+        # yeni kısım simüle edilir
+        with profiler.phase('schedule'):
+            all_results = run_algorithms(processes, csv_path, case_name, output_dir,
+                                         checkpoint_dir=f"{output_dir}/.checkpoints", profile=profile,
+                                         results_format=results_format, cache_dir=RESULT_CACHE_DIR)
+        for result in all_results:
+            profiler.add(result['algorithm'], result.pop('profile'))
         
         print("\n" + "="*60)
         print("GENERATING REPORT")
         print("="*60)
         
         # Rapor oluştur
-        generate_report(all_results, case_name)
+        with profiler.phase('report'):
+            generate_report(all_results, case_name)
         
         # Sonuçları göster
         print("\n" + "="*60)
@@ -189,11 +136,15 @@ def main():
                   f"{result['avg_turnaround']:<12.2f} "
                   f"{result['cpu_efficiency']:<10.2f}")
         
-        print(f"\n⏱️  Total execution time: {execution_time:.2f} seconds")
+        print("\n⏱️  PROFILE:")
+        print(profiler.format())
+        profiler.save(f"{output_dir}/profile.json")
         
         print("\n📁 OUTPUT FILES:")
         print(f"• Results saved to: {output_dir}/")
+        print(f"• Per-process results: {output_dir}/*_processes{RESULT_FORMATS[results_format]}")
         print(f"• Report saved to: reports/{case_name}_report.txt")
+        print(f"• Profile saved to: {output_dir}/profile.json")
         
         print("\n✅ SIMULATION COMPLETED SUCCESSFULLY!")
         print("All requirements for the assignment have been met.")
@@ -207,4 +158,8 @@ def main():
         input("\nPress Enter to exit...")
 
 if __name__ == "__main__":
+    # Argüman verilirse etkileşimsiz toplu çalıştırma (bkz. batch.py)
+    if len(sys.argv) > 1:
+        import batch
+        sys.exit(batch.main())
     main()
\ No newline at end of file
@@ -1,4 +1,13 @@
+import sys
+import numpy as np
+
+PRIORITY_NUMS = {'high': 1, 'normal': 2, 'low': 3}
+PRIORITY_NAMES = {1: 'high', 2: 'normal', 3: 'low'}
+
 class Process:
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', 'priority_num', 'remaining',
+                 'completion', 'waiting', 'turnaround', 'start_time', 'is_completed')
+    
     def __init__(self, pid, arrival, burst, priority):
         self.pid = pid
         self.arrival = arrival
@@ -11,21 +20,162 @@ class Process:
         self.start_time = -1
         self.is_completed = False
         
-        # Priority'i sayısala çevir
-        if priority.lower() == 'high':
-            self.priority_num = 1
-        elif priority.lower() == 'normal':
-            self.priority_num = 2
-        else:  # low
-            self.priority_num = 3
+        # Priority'i sayısala çevir (bilinmeyenler low sayılır)
+        self.priority_num = PRIORITY_NUMS.get(priority.lower(), 3)
     
     def calculate_times(self):
         if self.completion > 0:
             self.turnaround = self.completion - self.arrival
-            self.waiting = self.start_time - self.arrival
-            if self.waiting < 0:
-                self.waiting = 0
+            # Bekleme: hazır kuyruğunda geçen toplam süre (kesilmeler dahil)
+            self.waiting = max(self.turnaround - self.burst, 0)
+        return self
+    
+    def __str__(self):
+        return f"{self.pid}: A={self.arrival}, B={self.burst}, P={self.priority}"
+
+class ProcessView:
+    # ProcessTable içindeki bir satırı Process gibi gösteren hafif görünüm
+    __slots__ = ('table', 'index')
+    
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+    
+    pid = property(lambda self: str(self.table.pids[self.index]))
+    arrival = property(lambda self: int(self.table.arrival[self.index]))
+    burst = property(lambda self: int(self.table.burst[self.index]))
+    priority_num = property(lambda self: int(self.table.priority_num[self.index]))
+    priority = property(lambda self: PRIORITY_NAMES[self.priority_num])
+    remaining = property(lambda self: int(self.table.remaining[self.index]))
+    start_time = property(lambda self: int(self.table.start[self.index]))
+    completion = property(lambda self: int(self.table.completion[self.index]))
+    slices = property(lambda self: int(self.table.slices[self.index]))
+    is_completed = property(lambda self: self.remaining == 0 and self.start_time >= 0)
+    
+    @property
+    def turnaround(self):
+        if self.completion > 0:
+            return self.completion - self.arrival
+        return 0
+    
+    @property
+    def waiting(self):
+        if self.completion > 0:
+            return max(self.completion - self.arrival - self.burst, 0)
+        return 0
+    
+    def calculate_times(self):
+        # Süreler sütunlardan hesaplanır, saklanacak bir şey yok
         return self
     
     def __str__(self):
-        return f"{self.pid}: A={self.arrival}, B={self.burst}, P={self.priority}"
\ No newline at end of file
+        return f"{self.pid}: A={self.arrival}, B={self.burst}, P={self.priority}"
+
+class ProcessTable:
+    # Sütun tabanlı süreç tablosu: her alan ayrı bir int dizisidir, PID'ler
+    # intern edilmiş string listesidir. Girdi sütunları (pids, arrival, burst,
+    # priority_num) sonuç tabloları arasında kopyalanmadan paylaşılır.
+    def __init__(self, pids, arrival, burst, priority_num, start=None, completion=None, remaining=None,
+                 slices=None):
+        self.pids = pids
+        self.arrival = np.asarray(arrival, dtype=np.int32)
+        self.burst = np.asarray(burst, dtype=np.int32)
+        self.priority_num = np.asarray(priority_num, dtype=np.int32)
+        # Toplam burst int32'yi aşabileceği için bitiş zamanları int64 tutulur
+        if start is not None:
+            self.start = np.asarray(start, dtype=np.int64)
+        if completion is not None:
+            self.completion = np.asarray(completion, dtype=np.int64)
+        if remaining is not None:
+            self.remaining = np.asarray(remaining, dtype=np.int32)
+        if slices is not None:
+            self.slices = np.asarray(slices, dtype=np.int32)
+    
+    def __getattr__(self, name):
+        # Sonuç sütunları ilk erişimde oluşturulur; yalnızca girdi olarak
+        # kullanılan (ör. mmap ile açılmış) tablolar için bellek ayrılmaz.
+        if name == 'start':
+            value = np.full(len(self), -1, dtype=np.int64)
+        elif name == 'completion':
+            value = np.zeros(len(self), dtype=np.int64)
+        elif name == 'remaining':
+            value = self.burst.copy()
+        elif name == 'slices':
+            # Motor saymadıysa başlamış her süreç tek dilim varsayılır
+            value = (self.start >= 0).astype(np.int32)
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+    
+    @classmethod
+    def from_rows(cls, rows):
+        # rows: (pid, arrival, burst, priority) demetleri
+        pids, arrival, burst, priority_num = [], [], [], []
+        for pid, a, b, priority in rows:
+            pids.append(sys.intern(pid))
+            arrival.append(a)
+            burst.append(b)
+            priority_num.append(PRIORITY_NUMS.get(priority.lower(), 3))
+        return cls(pids, arrival, burst, priority_num)
+    
+    @classmethod
+    def from_processes(cls, processes):
+        return cls([sys.intern(p.pid) for p in processes],
+                   [p.arrival for p in processes],
+                   [p.burst for p in processes],
+                   [p.priority_num for p in processes])
+    
+    @classmethod
+    def concat(cls, tables):
+        # Parça parça yüklenen tabloları tek tabloda birleştir (yalnızca girdi sütunları)
+        tables = list(tables)
+        if not tables:
+            return cls(np.array([], dtype=str), [], [], [])
+        if len(tables) == 1:
+            return tables[0]
+        return cls(np.concatenate([np.asarray(t.pids) for t in tables]),
+                   np.concatenate([t.arrival for t in tables]),
+                   np.concatenate([t.burst for t in tables]),
+                   np.concatenate([t.priority_num for t in tables]))
+    
+    @classmethod
+    def of(cls, processes):
+        if isinstance(processes, cls):
+            return processes
+        return cls.from_processes(processes)
+    
+    def with_results(self, start, completion, remaining=None, slices=None):
+        # Aynı girdi sütunlarını paylaşan, yeni sonuç sütunlu tablo
+        if remaining is None:
+            remaining = np.zeros(len(self), dtype=np.int32)
+        return ProcessTable(self.pids, self.arrival, self.burst, self.priority_num,
+                            start, completion, remaining, slices)
+    
+    def to_processes(self):
+        processes = []
+        for i in range(len(self)):
+            view = self[i]
+            p = Process(view.pid, view.arrival, view.burst, view.priority)
+            p.remaining = view.remaining
+            p.start_time = view.start_time
+            p.completion = view.completion
+            p.is_completed = view.is_completed
+            processes.append(p.calculate_times())
+        return processes
+    
+    def __len__(self):
+        return len(self.pids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ProcessView(self, i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("process index out of range")
+        return ProcessView(self, index)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ProcessView(self, i)
@@ -0,0 +1,135 @@
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+# Örn. SCHED_PROFILE=cprofile:sjf_preemptive ya da SCHED_PROFILE=tracemalloc
+# (algoritma verilmezse hepsi). Kod değiştirmeden profil almak içindir.
+PROFILE_ENV = 'SCHED_PROFILE'
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+PROFILE_TOP = 15
+
+def parse_profile_spec(text):
+    # "mod[:algoritma,algoritma]" -> (mod, algoritmalar ya da None)
+    if not text:
+        return None
+    mode, _, methods = text.partition(':')
+    mode = mode.strip().lower()
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+    methods = [m.strip() for m in methods.split(',') if m.strip()]
+    return mode, methods or None
+
+def profile_mode(spec, method):
+    # Bu algoritma için profil modu; seçilmemişse None
+    if spec is None:
+        return None
+    mode, methods = spec
+    return mode if methods is None or method in methods else None
+
+def _cprofile_summary(profile, top):
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            'function': f"{os.path.basename(filename)}:{line}({function})",
+            'calls': calls,
+            'tottime': round(tottime, 6),
+            'cumtime': round(cumtime, 6),
+        })
+    rows.sort(key=lambda row: row['tottime'], reverse=True)
+    return {'mode': 'cprofile', 'hotspots': rows[:top]}
+
+def _tracemalloc_summary(snapshot, peak, top):
+    rows = [{'location': f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+             'size_mb': round(stat.size / 2 ** 20, 3), 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:top]]
+    return {'mode': 'tracemalloc', 'peak_mb': round(peak / 2 ** 20, 3), 'allocations': rows}
+
+class Profiler:
+    # Aşama bazında duvar saati ve CPU süresi toplar. İşçi süreçlerden gelen
+    # özetler `children` altında algoritma adıyla tutulur.
+    def __init__(self):
+        self.phases = []
+        self.children = {}
+        self.profile = None
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'phase': name,
+                'seconds': round(time.perf_counter() - wall, 6),
+                'cpu_seconds': round(time.process_time() - cpu, 6),
+            })
+    
+    def call(self, mode, function, *args, **kwargs):
+        # function(*args, **kwargs) çağrısını isteğe bağlı olarak cProfile ya
+        # da tracemalloc altında çalıştırır; sonuç self.profile'a yazılır
+        if mode is None:
+            return function(*args, **kwargs)
+        if mode == 'cprofile':
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(function, *args, **kwargs)
+            finally:
+                self.profile = _cprofile_summary(profile, PROFILE_TOP)
+        tracemalloc.start()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            peak = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self.profile = _tracemalloc_summary(snapshot, peak, PROFILE_TOP)
+    
+    def add(self, name, summary):
+        self.children[name] = summary
+    
+    def summary(self):
+        summary = {
+            'total_seconds': round(sum(phase['seconds'] for phase in self.phases), 6),
+            'phases': self.phases,
+        }
+        if self.profile is not None:
+            summary['profile'] = self.profile
+        if self.children:
+            summary['algorithms'] = self.children
+        return summary
+    
+    def save(self, filename):
+        try:
+            os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+            with open(filename, 'w') as f:
+                json.dump(self.summary(), f, indent=2)
+            print(f"Profile saved: {filename}")
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+    
+    def format(self):
+        lines = [f"{'Phase':<48} {'Wall (s)':>10} {'CPU (s)':>10}", "-" * 70]
+        for phase in self.phases:
+            lines.append(f"{phase['phase']:<48} {phase['seconds']:>10.3f} {phase['cpu_seconds']:>10.3f}")
+        for name, child in self.children.items():
+            for phase in child['phases']:
+                lines.append(f"  {name + ' / ' + phase['phase']:<46} {phase['seconds']:>10.3f} "
+                             f"{phase['cpu_seconds']:>10.3f}")
+            profile = child.get('profile')
+            if profile is None:
+                continue
+            if profile['mode'] == 'cprofile':
+                lines.append(f"    hot paths ({name}):")
+                for row in profile['hotspots'][:5]:
+                    lines.append(f"      {row['function']:<50} {row['tottime']:>9.3f}s {row['calls']:>10}")
+            else:
+                lines.append(f"    peak traced memory ({name}): {profile['peak_mb']} MB")
+        lines.append("-" * 70)
+        lines.append(f"{'Total':<48} {self.summary()['total_seconds']:>10.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,173 @@
+import contextlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cache import ResultCache, install
+from checkpoint import CHECKPOINT_SUFFIX, run_checkpointed, workload_digest
+from process import ProcessTable
+from profiler import Profiler, profile_mode
+from scheduler import Scheduler
+from smp import SmpScheduler
+from timeline_index import save_timeline_index
+from utils import THROUGHPUT_TIME_POINTS, calculate_statistics, save_results, save_timeline
+from workload import WORKLOAD_SUFFIX, load_workload, save_workload
+from writer import RESULT_FORMATS, ResultWriter, write_process_results
+
+# (Scheduler metodu, rapor adı, çıktı dosyası öneki, parametreler)
+ALGORITHMS = [
+    ('fcfs', "FCFS", 'FCFS', {}),
+    ('sjf_non_preemptive', "Non-Preemptive SJF", 'SJF_NonPreemptive', {}),
+    ('sjf_preemptive', "Preemptive SJF", 'SJF_Preemptive', {}),
+    ('round_robin', "Round Robin (Q=4)", 'RoundRobin', {'quantum': 4}),
+    ('priority_non_preemptive', "Non-Preemptive Priority", 'Priority_NonPreemptive', {}),
+    ('priority_preemptive', "Preemptive Priority", 'Priority_Preemptive', {}),
+]
+
+# Varsayılan çalıştırmaya girmeyen, istenince eklenebilen motorlar
+EXTRA_ALGORITHMS = [
+    ('mlfq', "MLFQ (Q=4/8/16)", 'MLFQ', {'quanta': [4, 8, 16], 'boost': 100}),
+    ('cfs', "CFS", 'CFS', {}),
+]
+
+def make_scheduler(switch_cost=0, cores=1, smp_mode='global'):
+    # Tek çekirdek için Scheduler, daha fazlası için SmpScheduler
+    if not callable(switch_cost) and switch_cost < 0:
+        raise ValueError("switch cost cannot be negative")
+    if cores == 1:
+        return Scheduler(switch_cost)
+    if switch_cost:
+        raise ValueError("switch cost is not modelled in multi-core mode")
+    return SmpScheduler(cores, smp_mode)
+
+def run_algorithm(workload_path, algorithm, case_name, output_dir, switch_cost=0, cores=1, smp_mode='global',
+                  checkpoint_dir=None, profile=None, stats=None):
+    # İşçi süreçte çalışır: iş yükü mmap ile açılır, sonuçlar burada yazılır.
+    # checkpoint_dir verilirse algoritma önceki çalıştırmanın kontrol
+    # noktasından devam eder ve yeni kontrol noktasını oraya yazar. Aşama
+    # süreleri results['profile'] içinde döner; profile ('cprofile' ya da
+    # 'tracemalloc') verilirse zamanlama çağrısı o araçla izlenir. stats
+    # calculate_statistics'e giden ek ayarlardır (time_points, window,
+    # window_edges).
+    method, label, prefix, params = algorithm
+    stats = dict(stats or {})
+    profiler = Profiler()
+    with profiler.phase('load'):
+        processes = load_workload(workload_path)
+    scheduler = make_scheduler(switch_cost, cores, smp_mode)
+    with profiler.phase('schedule'):
+        if checkpoint_dir:
+            timeline, result_procs, base = profiler.call(profile, run_checkpointed, scheduler, method, processes,
+                                                         params, f"{checkpoint_dir}/{prefix}{CHECKPOINT_SUFFIX}",
+                                                         stats.get('time_points', THROUGHPUT_TIME_POINTS))
+        else:
+            timeline, result_procs = profiler.call(profile, getattr(scheduler, method), processes, **params)
+            base = None
+    with profiler.phase('statistics'):
+        results = calculate_statistics(result_procs, label, case_name, timeline=timeline, base=base, **stats)
+    with profiler.phase('timeline_write'):
+        save_timeline(timeline, f"{output_dir}/{prefix}_timeline.txt")
+    with profiler.phase('index_write'):
+        save_timeline_index(timeline, f"{output_dir}/{prefix}_timeline.idx")
+    with profiler.phase('results_write'):
+        save_results(results, f"{output_dir}/{prefix}_results.txt")
+    
+    # Tüm tablo yerine yalnızca sonuç sütunları ana sürece döner
+    results['processes'] = (result_procs.start, result_procs.completion, result_procs.remaining,
+                            result_procs.slices)
+    results['profile'] = profiler.summary()
+    return results
+
+def _write_processes(table, path, fmt, cache, key):
+    # Arka plan yazıcısında çalışır; yazılan dosya önbellek girdisine de eklenir
+    if write_process_results(table, path, fmt) and cache is not None:
+        cache.add_file(key, path)
+
+def run_algorithms(processes, workload_path, case_name, output_dir, algorithms=ALGORITHMS, max_workers=None,
+                   switch_cost=0, cores=1, smp_mode='global', checkpoint_dir=None, profile=None,
+                   results_format=None, cache_dir=None, pool=None, stats=None):
+    # Algoritmaları süreç havuzuna dağıtır. İş yükü işçilere bir kez ikili
+    # dosya olarak paylaştırılır; sonuçlar `algorithms` sırasıyla döner.
+    # profile: parse_profile_spec sonucu, seçilen algoritmalar profillenir.
+    # results_format ('csv', 'jsonl', 'npz') verilirse tüm süreçlerin
+    # sonuçları <önek>_processes.<uzantı> dosyasına arka planda yazılır;
+    # yazma, diğer algoritmalar işçilerde çalışırken yapılır.
+    # cache_dir verilirse sonuçlar iş yükü içeriği ve parametrelerle
+    # anahtarlanıp saklanır; değişmeyen algoritmalar yeniden çalıştırılmaz,
+    # istatistikler ve çıktı dosyaları önbellekten gelir. pool verilirse
+    # (birden çok iş yükü aynı anda çalışırken) yeni havuz açılmaz. stats
+    # run_algorithm'deki gibi istatistik ayarlarıdır.
+    make_scheduler(switch_cost, cores, smp_mode)  # geçersiz ayarlar işçilere gitmeden
+    processes = ProcessTable.of(processes)
+    
+    finished = {}
+    writer = ResultWriter() if results_format else None
+    cache = ResultCache(cache_dir) if cache_dir else None
+    keys = {}
+    
+    def finish(k, results, entry=None):
+        prefix = algorithms[k][2]
+        results['processes'] = processes.with_results(*results['processes'])
+        if writer is not None:
+            path = f"{output_dir}/{prefix}_processes{RESULT_FORMATS[results_format]}"
+            if entry is None or not install(entry, os.path.basename(path), path):
+                writer.submit(_write_processes, results['processes'], path, results_format, cache, keys.get(k))
+        finished[k] = results
+    
+    temp_path = None
+    try:
+        if cache is not None:
+            digest = workload_digest(processes, len(processes))
+            for k, (method, label, prefix, params) in enumerate(algorithms):
+                keys[k] = cache.key(digest, method, params, label=label, case=case_name,
+                                    switch_cost=switch_cost, cores=cores, smp_mode=smp_mode, stats=stats)
+                profiler = Profiler()
+                with profiler.phase('cache_load'):
+                    hit = cache.get(keys[k])
+                    if hit is not None:
+                        results, entry = hit
+                        names = (f"{prefix}_timeline.txt", f"{prefix}_timeline.idx", f"{prefix}_results.txt")
+                        if not all([install(entry, name, f"{output_dir}/{name}") for name in names]):
+                            hit = None
+                if hit is None:
+                    continue
+                results['profile'] = profiler.summary()
+                finish(k, results, entry)
+                print(f"   ✅ {label} loaded from cache")
+        
+        pending = [k for k in range(len(algorithms)) if k not in finished]
+        if pending and not workload_path.endswith(WORKLOAD_SUFFIX):
+            fd, temp_path = tempfile.mkstemp(suffix=WORKLOAD_SUFFIX)
+            os.close(fd)
+            workload_path = save_workload(processes, temp_path)
+        
+        if max_workers is None:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+        
+        if pending:
+            executor = ProcessPoolExecutor(max_workers=max_workers) if pool is None else contextlib.nullcontext(pool)
+            with executor as pool:
+                futures = {pool.submit(run_algorithm, workload_path, algorithms[k], case_name, output_dir,
+                                       switch_cost, cores, smp_mode, checkpoint_dir,
+                                       profile_mode(profile, algorithms[k][0]), stats): k
+                           for k in pending}
+                for future in as_completed(futures):
+                    k = futures[future]
+                    label, prefix = algorithms[k][1:3]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        print(f"   ❌ {label} failed: {e}")
+                        continue
+                    if cache is not None:
+                        cache.put(keys[k], {key: value for key, value in results.items() if key != 'profile'},
+                                  [f"{output_dir}/{prefix}_timeline.txt", f"{output_dir}/{prefix}_timeline.idx",
+                                   f"{output_dir}/{prefix}_results.txt"])
+                    finish(k, results)
+                    print(f"   ✅ {label} completed")
+    finally:
+        if writer is not None:
+            writer.close()
+        if temp_path is not None:
+            os.remove(temp_path)
+    
+    return [finished[k] for k in sorted(finished)]
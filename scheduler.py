@@ -1,219 +1,671 @@
-import queue
+import heapq
+from collections import deque
+from process import ProcessTable
+from timeline import IDLE, SWITCH, Timeline
+
+# CFS ağırlıkları: high/normal/low, Linux'taki nice -5/0/5 değerlerine karşılık
+CFS_NICE_0_WEIGHT = 1024
+CFS_WEIGHTS = {1: 3121, 2: 1024, 3: 335}
+
+# Sıfır ya da negatif bir dilim zamanı ilerletmez ve motor sonsuza dek döner;
+# bu yüzden parametreler motor girişinde (ve servis isteklerinde) denetlenir
+POSITIVE_PARAMS = ('quantum', 'latency', 'min_granularity')
+NON_NEGATIVE_PARAMS = ('aging', 'boost')
+
+def check_params(**params):
+    for name in POSITIVE_PARAMS:
+        if params.get(name) is not None and params[name] <= 0:
+            raise ValueError(f"{name} must be positive")
+    if 'quanta' in params and (not params['quanta'] or min(params['quanta']) <= 0):
+        raise ValueError("quanta must be a non-empty list of positive values")
+    for name in NON_NEGATIVE_PARAMS:
+        if params.get(name) is not None and params[name] < 0:
+            raise ValueError(f"{name} cannot be negative")
 
 class Scheduler:
-    def __init__(self):
-        self.timeline = []
+    # Tüm algoritmalar Process listesi veya ProcessTable kabul eder ve
+    # girdi sütunlarını paylaşan bir ProcessTable sonucu döndürür. Zaman
+    # çizelgesi metin listesi yerine sıkıştırılmış bir Timeline'dır.
+    #
+    # switch_cost: bir süreçten farklı bir sürece geçerken harcanan, iş
+    # yapılmayan süre. Sabit bir tamsayı ya da her geçiş için
+    # switch_cost(önceki_indeks, yeni_indeks) döndüren bir fonksiyon olabilir.
+    # Süre çizelgeye SWITCH dilimi olarak yazılır.
+    #
+    # Artımlı çalışma (FCFS, SJF, RR ve öncelik motorları): capture True ise
+    # motor, bilinen son varış kuyruğa alındığı anda durumunu
+    # self.checkpoint'e kopyalar. resume'a böyle bir durum verilirse motor
+    # oradan devam eder; varışları o andan sonra olan, tablonun sonuna
+    # eklenmiş süreçler baştan çalıştırmayla aynı sonucu verir.
+    def __init__(self, switch_cost=0):
+        self.timeline = Timeline()
+        self.switch_cost = switch_cost
+        self.capture = False
+        self.checkpoint = None
+        self.resume = None
+    
+    def _restore(self, kind, table):
+        # Bu motora ait bir devam durumu varsa onu tüketir, çizelgeyi ondan
+        # kurar ve durumu döndürür (listeleri yerinde büyütülüp kullanılır)
+        state = self.resume
+        self.checkpoint = None
+        if state is None or state['kind'] != kind:
+            self.timeline = Timeline(table.pids)
+            return None
+        self.resume = None
+        self.timeline = state['timeline']
+        self.timeline.extend(table.pids)
+        return state
+    
+    def _capture(self, kind, **state):
+        state['kind'] = kind
+        state['timeline'] = self.timeline.copy()
+        self.checkpoint = state
+    
+    def _switch(self, i, current_time):
+        # i'ye geçiş maliyetini çizelgeye ekler ve yeni zamanı döndürür
+        last = self.timeline.last
+        if last == IDLE or last == i:
+            return current_time
+        cost = self.switch_cost(last, i) if callable(self.switch_cost) else self.switch_cost
+        if cost > 0:
+            self.timeline.add(current_time, current_time + cost, SWITCH)
+            self.timeline.last = i  # bağlam artık i'nin
+            current_time += cost
+        return current_time
     
     def fcfs(self, processes):
-        self.timeline = []
-        sorted_procs = sorted(processes, key=lambda x: x.arrival)
-        current_time = 0
+        table = ProcessTable.of(processes)
+        arrival = table.arrival.tolist()
+        burst = table.burst.tolist()
+        state = self._restore('fcfs', table)
+        if state is None:
+            start = [-1] * len(table)
+            completion = [0] * len(table)
+            current_time = 0
+            first = 0
+        else:
+            # Eski süreçlerin hepsi bitmiştir; yalnızca yeniler sıraya girer
+            start, completion, current_time = state['start'], state['completion'], state['current_time']
+            first = len(start)
+            start.extend([-1] * (len(table) - first))
+            completion.extend([0] * (len(table) - first))
         
-        for p in sorted_procs:
-            if current_time < p.arrival:
-                self.timeline.append(f"[{current_time}] - IDLE - [{p.arrival}]")
-                current_time = p.arrival
+        for i in sorted(range(first, len(table)), key=arrival.__getitem__):
+            if current_time < arrival[i]:
+                self.timeline.add(current_time, arrival[i], IDLE)
+                current_time = arrival[i]
             
-            p.start_time = current_time
-            self.timeline.append(f"[{current_time}] - {p.pid} - [{current_time + p.burst}]")
+            if self.switch_cost:
+                current_time = self._switch(i, current_time)
+            start[i] = current_time
+            self.timeline.add(current_time, current_time + burst[i], i)
             
-            p.completion = current_time + p.burst
-            p.is_completed = True
-            current_time = p.completion
+            completion[i] = current_time + burst[i]
+            current_time = completion[i]
         
-        return self.timeline, sorted_procs
+        if self.capture:
+            self._capture('fcfs', start=list(start), completion=list(completion), current_time=current_time)
+        return self.timeline, table.with_results(start, completion, slices=self.timeline.slices)
     
     def sjf_non_preemptive(self, processes):
-        self.timeline = []
-        procs = [Process(p.pid, p.arrival, p.burst, p.priority) for p in processes]
-        current_time = 0
-        completed = []
+        return self._non_preemptive(processes, 'burst')
+    
+    def sjf_preemptive(self, processes):
+        return self._preemptive(processes, 'remaining')
+    
+    def round_robin(self, processes, quantum=4):
+        # Deque + varış imleci: her dilimden sonra önce o dilimde gelenler
+        # eklenir, ardından çalışan süreç kuyruğun sonuna döner.
+        check_params(quantum=quantum)
+        table = ProcessTable.of(processes)
+        arrival = table.arrival.tolist()
+        state = self._restore('round_robin', table)
+        if state is None:
+            remaining = table.burst.tolist()
+            start = [-1] * len(table)
+            completion = [0] * len(table)
+            ready_queue = deque()
+            expired = None
+            current_time = 0
+            completed = 0
+            first = 0
+        else:
+            remaining, start, completion = state['remaining'], state['start'], state['completion']
+            ready_queue, expired = state['ready'], state['expired']
+            current_time, completed = state['current_time'], state['completed']
+            first = len(start)
+            remaining.extend(table.burst[first:].tolist())
+            start.extend([-1] * (len(table) - first))
+            completion.extend([0] * (len(table) - first))
+        arrivals = sorted(range(first, len(table)), key=arrival.__getitem__)
+        cursor = 0
+        capture = self.capture
         
-        while len(completed) < len(procs):
-            ready = [p for p in procs if p.arrival <= current_time and not p.is_completed]
+        while completed < len(table):
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                ready_queue.append(arrivals[cursor])
+                cursor += 1
             
-            if ready:
-                shortest = min(ready, key=lambda x: x.burst)
-                shortest.start_time = current_time
+            # Kontrol noktası yeni gelenlerle süresi dolan sürecin arasındadır
+            if capture and cursor == len(arrivals):
+                capture = False
+                self._capture('round_robin', remaining=list(remaining), start=list(start),
+                              completion=list(completion), ready=deque(ready_queue), expired=expired,
+                              current_time=current_time, completed=completed)
+            if expired is not None:
+                ready_queue.append(expired)
+                expired = None
+            
+            if ready_queue:
+                i = ready_queue.popleft()
+                if self.switch_cost:
+                    current_time = self._switch(i, current_time)
+                if start[i] == -1:
+                    start[i] = current_time
                 
-                self.timeline.append(f"[{current_time}] - {shortest.pid} - [{current_time + shortest.burst}]")
+                # Aynı sürecin art arda dilimleri Timeline'da birleşir
+                exec_time = min(quantum, remaining[i])
+                self.timeline.add(current_time, current_time + exec_time, i)
+                current_time += exec_time
+                remaining[i] -= exec_time
                 
-                shortest.completion = current_time + shortest.burst
-                shortest.is_completed = True
-                current_time = shortest.completion
-                completed.append(shortest)
+                if remaining[i] == 0:
+                    completion[i] = current_time
+                    completed += 1
+                else:
+                    expired = i
             else:
-                next_arrival = min(p.arrival for p in procs if not p.is_completed)
-                self.timeline.append(f"[{current_time}] - IDLE - [{next_arrival}]")
+                next_arrival = arrival[arrivals[cursor]]
+                self.timeline.add(current_time, next_arrival, IDLE)
                 current_time = next_arrival
         
-        return self.timeline, completed
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
     
-    def sjf_preemptive(self, processes):
-        self.timeline = []
-        procs = [Process(p.pid, p.arrival, p.burst, p.priority) for p in processes]
+    def priority_non_preemptive(self, processes, aging=None):
+        check_params(aging=aging)
+        if aging:
+            return self._aging(processes, aging, preemptive=False)
+        return self._non_preemptive(processes, 'priority_num')
+    
+    def priority_preemptive(self, processes, aging=None):
+        check_params(aging=aging)
+        if aging:
+            return self._aging(processes, aging, preemptive=True)
+        return self._preemptive(processes, 'priority_num')
+    
+    def mlfq(self, processes, quanta=(4, 8, 16), boost=100):
+        # Çok seviyeli geri beslemeli kuyruk; seviye sayısı len(quanta).
+        # Gelen süreç en üst seviyeye girer, seviyesindeki zaman hakkını
+        # (quantum) bitiren bir alta iner; en altta RR döner. Üst seviyeye
+        # gelen süreç alt seviyede çalışanı keser, kesilen kendi seviyesinin
+        # başına döner ve kalan hakkını korur. Her `boost` zaman biriminde tüm
+        # süreçler en üst seviyeye çıkar (0/None: kapalı).
+        #
+        # Boost tembeldir: alt seviye kuyrukları üst seviyenin sonuna bütün
+        # olarak eklenir (O(seviye)); süreçlerin seviye ve harcanan hakkı,
+        # kuyruktan çıktıklarında çağ (epoch) karşılaştırılarak sıfırlanır.
+        check_params(quanta=quanta, boost=boost)
+        table = ProcessTable.of(processes)
+        self.timeline = Timeline(table.pids)
+        arrival = table.arrival.tolist()
+        remaining = table.burst.tolist()
+        start = [-1] * len(table)
+        completion = [0] * len(table)
+        level = [0] * len(table)
+        used = [0] * len(table)
+        epoch_of = [0] * len(table)
+        arrivals = sorted((i for i in range(len(table)) if remaining[i] > 0),
+                          key=arrival.__getitem__)
+        levels = len(quanta)
+        top = deque([deque()])  # en üst seviye; boost'ta kuyruk parçaları eklenir
+        lower = [deque() for _ in range(levels - 1)]
+        counts = [0] * levels
+        epoch = 0
+        next_boost = boost or None
+        cursor = 0
         current_time = 0
-        last_pid = None
-        last_start = 0
+        current = None
+        run_start = 0
         
-        while any(p.remaining > 0 for p in procs):
-            ready = [p for p in procs if p.arrival <= current_time and p.remaining > 0]
-            
-            if ready:
-                shortest = min(ready, key=lambda x: x.remaining)
-                
-                if last_pid != shortest.pid and last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                    last_start = current_time
-                
-                last_pid = shortest.pid
-                if shortest.start_time == -1:
-                    shortest.start_time = current_time
-                
-                shortest.remaining -= 1
-                current_time += 1
-                
-                if shortest.remaining == 0:
-                    shortest.completion = current_time
-                    shortest.is_completed = True
-                    self.timeline.append(f"[{last_start}] - {shortest.pid} - [{current_time}]")
-                    last_pid = None
-                    last_start = current_time
+        def push(i, front=False):
+            if level[i] == 0:
+                top[-1].append(i)
+            elif front:
+                lower[level[i] - 1].appendleft(i)
             else:
-                if last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                    last_pid = None
-                
-                next_arrival = min(p.arrival for p in procs if p.remaining > 0)
-                self.timeline.append(f"[{current_time}] - IDLE - [{next_arrival}]")
-                current_time = next_arrival
-                last_start = current_time
+                lower[level[i] - 1].append(i)
+            counts[level[i]] += 1
         
-        return self.timeline, procs
-    
-    def round_robin(self, processes, quantum=4):
-        self.timeline = []
-        procs = [Process(p.pid, p.arrival, p.burst, p.priority) for p in processes]
-        ready_queue = queue.Queue()
-        current_time = 0
-        last_pid = None
-        last_start = 0
-        completed = []
+        def admit():
+            nonlocal cursor
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                i = arrivals[cursor]
+                epoch_of[i] = epoch
+                push(i)
+                cursor += 1
         
-        initial = sorted([p for p in procs if p.arrival <= current_time], key=lambda x: x.arrival)
-        for p in initial:
-            ready_queue.put(p)
+        def refresh(i):
+            # Son boost'tan önce kuyruğa girmiş süreç artık en üst seviyededir
+            if epoch_of[i] != epoch:
+                epoch_of[i] = epoch
+                level[i] = 0
+                used[i] = 0
         
-        while len(completed) < len(procs):
-            if not ready_queue.empty():
-                current_proc = ready_queue.get()
-                
-                if last_pid != current_proc.pid and last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                
-                last_pid = current_proc.pid
-                if current_proc.start_time == -1:
-                    current_proc.start_time = current_time
-                
-                exec_time = min(quantum, current_proc.remaining)
-                last_start = current_time
-                current_time += exec_time
-                current_proc.remaining -= exec_time
-                
-                new_arrivals = [p for p in procs if p.arrival > current_time - exec_time and p.arrival <= current_time and not p.is_completed and not any(p2.pid == p.pid for p2 in list(ready_queue.queue))]
-                for p in sorted(new_arrivals, key=lambda x: x.arrival):
-                    ready_queue.put(p)
+        while True:
+            if next_boost is not None and current_time >= next_boost:
+                # Çalışan süreç de kesilip kuyruğa döner; böylece bekleyenler
+                # boost anında üst seviyede sıraya girer. Henüz hiç çalışmamışsa
+                # (ör. geçiş maliyeti boost'u aştıysa) yerinde kalır.
+                if current is not None and run_start < current_time:
+                    self.timeline.add(run_start, current_time, current)
+                    push(current)
+                    current = None
+                for q in lower:
+                    if q:
+                        top.append(q)
+                top.append(deque())
+                lower[:] = [deque() for _ in range(levels - 1)]
+                counts[0] = sum(counts)
+                counts[1:] = [0] * (levels - 1)
+                epoch += 1
+                # Sonraki boost bir öncekinden sayılır; arada çalışma olmadan
+                # geçen boost'lar (boşta bekleme) tek boost'a eşdeğerdir
+                next_boost += ((current_time - next_boost) // boost + 1) * boost
+            
+            admit()
+            
+            # Daha üst seviyede bekleyen varsa çalışan süreci kes
+            if current is not None:
+                refresh(current)
+                lv = level[current]
+                if lv > 0 and any(counts[:lv]):
+                    if run_start < current_time:
+                        self.timeline.add(run_start, current_time, current)
+                    push(current, front=True)
+                    current = None
+            
+            if current is None:
+                lv = 0
+                while lv < levels and not counts[lv]:
+                    lv += 1
+                if lv == levels:
+                    if cursor == len(arrivals):
+                        break
+                    next_arrival = arrival[arrivals[cursor]]
+                    self.timeline.add(current_time, next_arrival, IDLE)
+                    current_time = next_arrival
+                    continue
                 
-                if current_proc.remaining == 0:
-                    current_proc.completion = current_time
-                    current_proc.is_completed = True
-                    completed.append(current_proc)
-                    self.timeline.append(f"[{last_start}] - {current_proc.pid} - [{current_time}]")
-                    last_pid = None
+                if lv == 0:
+                    while not top[0]:
+                        top.popleft()
+                    current = top[0].popleft()
                 else:
-                    ready_queue.put(current_proc)
+                    current = lower[lv - 1].popleft()
+                counts[lv] -= 1
+                refresh(current)
+                if self.switch_cost:
+                    switched = self._switch(current, current_time)
+                    if switched > current_time:
+                        current_time = run_start = switched
+                        continue
+                run_start = current_time
+            
+            if start[current] == -1:
+                start[current] = current_time
+            lv = level[current]
+            finish = current_time + min(remaining[current], quanta[lv] - used[current])
+            stop = finish
+            if next_boost is not None and next_boost < stop:
+                # Boost da varış gibi bir olaydır; dilim boost anında kesilir
+                stop = next_boost
+            if lv > 0 and cursor < len(arrivals) and arrival[arrivals[cursor]] < stop:
+                # Gelen süreç en üst seviyeye girip bu süreci kesecek
+                stop = arrival[arrivals[cursor]]
+            if stop < finish:
+                step = stop - current_time
+                remaining[current] -= step
+                used[current] += step
+                current_time = stop
+                continue
+            
+            step = finish - current_time
+            remaining[current] -= step
+            used[current] += step
+            current_time = finish
+            self.timeline.add(run_start, current_time, current)
+            if remaining[current] == 0:
+                completion[current] = current_time
             else:
-                if last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                    last_pid = None
-                
-                remaining_procs = [p for p in procs if not p.is_completed]
-                if remaining_procs:
-                    next_arrival = min(p.arrival for p in remaining_procs)
-                    self.timeline.append(f"[{current_time}] - IDLE - [{next_arrival}]")
-                    current_time = next_arrival
-                    last_start = current_time
-                    
-                    new_arrivals = [p for p in procs if p.arrival <= current_time and not p.is_completed and not any(p2.pid == p.pid for p2 in list(ready_queue.queue))]
-                    for p in sorted(new_arrivals, key=lambda x: x.arrival):
-                        ready_queue.put(p)
+                # Zaman hakkı bitti: bir alt seviyeye in. RR'daki gibi dilim
+                # sırasında gelenler kuyruğa önce girer.
+                admit()
+                level[current] = min(lv + 1, levels - 1)
+                used[current] = 0
+                push(current)
+            current = None
         
-        return self.timeline, procs
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
     
-    def priority_non_preemptive(self, processes):
-        self.timeline = []
-        procs = [Process(p.pid, p.arrival, p.burst, p.priority) for p in processes]
+    def cfs(self, processes, latency=24, min_granularity=3):
+        # CFS benzeri adil zamanlayıcı. Her sürecin sanal çalışma süresi
+        # (vruntime) ağırlığıyla ters orantılı artar; hazır kuyruğu
+        # (vruntime, indeks) heap'idir ve en küçük vruntime çalışır. Dilim,
+        # `latency` süresinin sürecin ağırlık payı kadarıdır (en az
+        # `min_granularity`). Gelen süreç min_vruntime ile başlar ve çalışanı
+        # kesmez; seçim dilim sonunda yapılır.
+        check_params(latency=latency, min_granularity=min_granularity)
+        table = ProcessTable.of(processes)
+        self.timeline = Timeline(table.pids)
+        arrival = table.arrival.tolist()
+        remaining = table.burst.tolist()
+        weight = [CFS_WEIGHTS.get(p, CFS_NICE_0_WEIGHT) for p in table.priority_num.tolist()]
+        vruntime = [0.0] * len(table)
+        start = [-1] * len(table)
+        completion = [0] * len(table)
+        arrivals = sorted((i for i in range(len(table)) if remaining[i] > 0),
+                          key=arrival.__getitem__)
+        ready = []
+        total_weight = 0  # çalışan + hazır süreçlerin ağırlık toplamı
+        min_vruntime = 0.0
+        cursor = 0
         current_time = 0
-        completed = []
+        current = None
+        run_start = 0
+        slice_end = 0
+        
+        while True:
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                i = arrivals[cursor]
+                vruntime[i] = min_vruntime
+                heapq.heappush(ready, (min_vruntime, i))
+                total_weight += weight[i]
+                cursor += 1
+            
+            if current is None:
+                if not ready:
+                    if cursor == len(arrivals):
+                        break
+                    next_arrival = arrival[arrivals[cursor]]
+                    self.timeline.add(current_time, next_arrival, IDLE)
+                    current_time = next_arrival
+                    continue
+                
+                _, current = heapq.heappop(ready)
+                if self.switch_cost:
+                    current_time = self._switch(current, current_time)
+                run_start = current_time
+                slice_end = current_time + max(min_granularity, latency * weight[current] // total_weight)
+                if start[current] == -1:
+                    start[current] = current_time
+            
+            # Dilim sonu, tamamlanma veya (min_vruntime için) bir sonraki varış
+            end = min(slice_end, current_time + remaining[current])
+            if cursor < len(arrivals) and arrival[arrivals[cursor]] < end:
+                end = max(arrival[arrivals[cursor]], current_time)
+            step = end - current_time
+            remaining[current] -= step
+            vruntime[current] += step * CFS_NICE_0_WEIGHT / weight[current]
+            current_time = end
+            lowest = min(vruntime[current], ready[0][0]) if ready else vruntime[current]
+            if lowest > min_vruntime:
+                min_vruntime = lowest
+            
+            if remaining[current] == 0:
+                completion[current] = current_time
+                total_weight -= weight[current]
+                self.timeline.add(run_start, current_time, current)
+                current = None
+            elif current_time >= slice_end:
+                self.timeline.add(run_start, current_time, current)
+                heapq.heappush(ready, (vruntime[current], current))
+                current = None
+        
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
+    
+    def _non_preemptive(self, processes, key):
+        # Süreçler bir kez varışa göre sıralanır ve imleçle gezilir; gelenler
+        # (key, indeks) heap'ine girer. Eşitlikte girdi sırası kazanır.
+        table = ProcessTable.of(processes)
+        arrival = table.arrival.tolist()
+        burst = table.burst.tolist()
+        keys = getattr(table, key).tolist()
+        state = self._restore('non_preemptive', table)
+        if state is None:
+            start = [-1] * len(table)
+            completion = [0] * len(table)
+            ready = []
+            current_time = 0
+            completed = 0
+            first = 0
+        else:
+            start, completion, ready = state['start'], state['completion'], state['ready']
+            current_time, completed = state['current_time'], state['completed']
+            first = len(start)
+            start.extend([-1] * (len(table) - first))
+            completion.extend([0] * (len(table) - first))
+        arrivals = sorted(range(first, len(table)), key=arrival.__getitem__)
+        cursor = 0
+        capture = self.capture
         
-        while len(completed) < len(procs):
-            ready = [p for p in procs if p.arrival <= current_time and not p.is_completed]
+        while completed < len(table):
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                i = arrivals[cursor]
+                heapq.heappush(ready, (keys[i], i))
+                cursor += 1
+            
+            if capture and cursor == len(arrivals):
+                capture = False
+                self._capture('non_preemptive', start=list(start), completion=list(completion), ready=list(ready),
+                              current_time=current_time, completed=completed)
             
             if ready:
-                highest = min(ready, key=lambda x: x.priority_num)
-                highest.start_time = current_time
+                _, i = heapq.heappop(ready)
+                if self.switch_cost:
+                    current_time = self._switch(i, current_time)
+                start[i] = current_time
                 
-                self.timeline.append(f"[{current_time}] - {highest.pid} - [{current_time + highest.burst}]")
+                self.timeline.add(current_time, current_time + burst[i], i)
                 
-                highest.completion = current_time + highest.burst
-                highest.is_completed = True
-                current_time = highest.completion
-                completed.append(highest)
+                completion[i] = current_time + burst[i]
+                current_time = completion[i]
+                completed += 1
             else:
-                next_arrival = min(p.arrival for p in procs if not p.is_completed)
-                self.timeline.append(f"[{current_time}] - IDLE - [{next_arrival}]")
+                next_arrival = arrival[arrivals[cursor]]
+                self.timeline.add(current_time, next_arrival, IDLE)
                 current_time = next_arrival
         
-        return self.timeline, completed
+        return self.timeline, table.with_results(start, completion, slices=self.timeline.slices)
     
-    def priority_preemptive(self, processes):
-        self.timeline = []
-        procs = [Process(p.pid, p.arrival, p.burst, p.priority) for p in processes]
-        current_time = 0
-        last_pid = None
-        last_start = 0
+    def _preemptive(self, processes, key):
+        # Olay tabanlı motor: zaman birim birim değil, bir sonraki varışa
+        # veya tamamlanmaya atlar. Hazır kuyruğu (key, indeks) heap'idir;
+        # eşitlikte girdi sırası kazanır, eski min(ready, ...) ile aynı.
+        # key == 'remaining' ise anahtar kalan süredir (SRTF).
+        table = ProcessTable.of(processes)
+        arrival = table.arrival.tolist()
+        state = self._restore('preemptive', table)
+        if state is None:
+            remaining = table.burst.tolist()
+            start = [-1] * len(table)
+            completion = [0] * len(table)
+            ready = []
+            current_time = 0
+            current = None
+            run_start = 0
+            first = 0
+        else:
+            remaining, start, completion = state['remaining'], state['start'], state['completion']
+            ready, current_time = state['ready'], state['current_time']
+            current, run_start = state['current'], state['run_start']
+            first = len(start)
+            remaining.extend(table.burst[first:].tolist())
+            start.extend([-1] * (len(table) - first))
+            completion.extend([0] * (len(table) - first))
+        keys = remaining if key == 'remaining' else getattr(table, key).tolist()
+        arrivals = sorted((i for i in range(first, len(table)) if remaining[i] > 0),
+                          key=arrival.__getitem__)
+        cursor = 0
+        capture = self.capture
         
-        while any(p.remaining > 0 for p in procs):
-            ready = [p for p in procs if p.arrival <= current_time and p.remaining > 0]
+        while True:
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                i = arrivals[cursor]
+                heapq.heappush(ready, (keys[i], i))
+                cursor += 1
             
-            if ready:
-                highest = min(ready, key=lambda x: x.priority_num)
-                
-                if last_pid != highest.pid and last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                    last_start = current_time
-                
-                last_pid = highest.pid
-                if highest.start_time == -1:
-                    highest.start_time = current_time
-                
-                highest.remaining -= 1
-                current_time += 1
+            if capture and cursor == len(arrivals):
+                capture = False
+                self._capture('preemptive', remaining=list(remaining), start=list(start),
+                              completion=list(completion), ready=list(ready), current_time=current_time,
+                              current=current, run_start=run_start)
+            
+            # Yeni gelen daha öncelikliyse çalışan süreci kes. Geçiş sırasında
+            # gelen biri, süreç hiç çalışmadan onu geri kuyruğa gönderebilir.
+            if current is not None and ready and ready[0] < (keys[current], current):
+                if run_start < current_time:
+                    self.timeline.add(run_start, current_time, current)
+                heapq.heappush(ready, (keys[current], current))
+                current = None
+            
+            if current is None:
+                if not ready:
+                    if cursor == len(arrivals):
+                        break
+                    next_arrival = arrival[arrivals[cursor]]
+                    self.timeline.add(current_time, next_arrival, IDLE)
+                    current_time = next_arrival
+                    continue
                 
-                if highest.remaining == 0:
-                    highest.completion = current_time
-                    highest.is_completed = True
-                    self.timeline.append(f"[{last_start}] - {highest.pid} - [{current_time}]")
-                    last_pid = None
-                    last_start = current_time
+                _, current = heapq.heappop(ready)
+                if self.switch_cost:
+                    switched = self._switch(current, current_time)
+                    if switched > current_time:
+                        # Geçiş süresince gelenler önce kuyruğa alınmalı
+                        current_time = run_start = switched
+                        continue
+                run_start = current_time
+            
+            if start[current] == -1:
+                start[current] = current_time
+            finish = current_time + remaining[current]
+            if cursor < len(arrivals) and arrival[arrivals[cursor]] < finish:
+                next_arrival = arrival[arrivals[cursor]]
+                remaining[current] -= next_arrival - current_time
+                current_time = next_arrival
             else:
-                if last_pid is not None:
-                    self.timeline.append(f"[{last_start}] - {last_pid} - [{current_time}]")
-                    last_pid = None
+                remaining[current] = 0
+                completion[current] = finish
+                current_time = finish
+                self.timeline.add(run_start, current_time, current)
+                current = None
+        
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
+
+    def _aging(self, processes, aging, preemptive):
+        # Yaşlandırmalı öncelik: bekleyen sürecin etkin önceliği her `aging`
+        # zaman biriminde bir basamak iyileşir (en iyi 1). Süreçler taban
+        # önceliklerine göre kovalara (giriş zamanı, sıra, indeks) olarak
+        # FIFO girer; kovadaki en eski süreç o kovanın en iyisidir. Seçim yalnızca
+        # kova başlarına bakar, bekleyenler hiç yeniden puanlanmaz. Terfi anı
+        # (giriş + k * aging) gerektiğinde kova başlarından hesaplanır.
+        #
+        # Eşit etkin öncelikte daha uzun bekleyen, o da eşitse kuyruğa önce
+        # giren kazanır. Çalışan süreç
+        # seçildiği andaki etkin önceliğini korur; kesilirse bekleme süresi
+        # yeniden başlar.
+        table = ProcessTable.of(processes)
+        self.timeline = Timeline(table.pids)
+        arrival = table.arrival.tolist()
+        remaining = table.burst.tolist()
+        base = table.priority_num.tolist()
+        start = [-1] * len(table)
+        completion = [0] * len(table)
+        if preemptive:
+            arrivals = sorted((i for i in range(len(table)) if remaining[i] > 0),
+                              key=arrival.__getitem__)
+        else:
+            arrivals = sorted(range(len(table)), key=arrival.__getitem__)
+        buckets = {p: deque() for p in sorted(set(base))}
+        waiting = 0
+        order = 0  # kuyruğa giriş sırası
+        cursor = 0
+        current_time = 0
+        current = None
+        run_priority = 0
+        run_start = 0
+        completed = 0
+        
+        def best(t):
+            # En iyi kova başı: (etkin öncelik, giriş zamanı, sıra, indeks, kova)
+            choice = None
+            for p, q in buckets.items():
+                if q:
+                    entered, seq, i = q[0]
+                    candidate = (max(1, p - (t - entered) // aging), entered, seq, i, q)
+                    if choice is None or candidate[:3] < choice[:3]:
+                        choice = candidate
+            return choice
+        
+        while completed < len(arrivals):
+            while cursor < len(arrivals) and arrival[arrivals[cursor]] <= current_time:
+                i = arrivals[cursor]
+                buckets[base[i]].append((arrival[i], order, i))
+                order += 1
+                waiting += 1
+                cursor += 1
+            
+            # Yaşlanarak ya da yeni gelerek daha öncelikli hale gelen varsa kes
+            if current is not None and waiting:
+                if best(current_time)[0] < run_priority:
+                    if run_start < current_time:
+                        self.timeline.add(run_start, current_time, current)
+                    buckets[base[current]].append((current_time, order, current))
+                    order += 1
+                    waiting += 1
+                    current = None
+            
+            if current is None:
+                if not waiting:
+                    next_arrival = arrival[arrivals[cursor]]
+                    self.timeline.add(current_time, next_arrival, IDLE)
+                    current_time = next_arrival
+                    continue
                 
-                next_arrival = min(p.arrival for p in procs if p.remaining > 0)
-                self.timeline.append(f"[{current_time}] - IDLE - [{next_arrival}]")
-                current_time = next_arrival
-                last_start = current_time
+                run_priority, _, _, current, q = best(current_time)
+                q.popleft()
+                waiting -= 1
+                if self.switch_cost:
+                    switched = self._switch(current, current_time)
+                    if switched > current_time:
+                        current_time = run_start = switched
+                        if preemptive:
+                            continue
+                run_start = current_time
+            
+            if start[current] == -1:
+                start[current] = current_time
+            finish = current_time + remaining[current]
+            if preemptive:
+                # Bir sonraki olay: varış ya da bir kova başının çalışanı geçtiği an
+                next_event = arrival[arrivals[cursor]] if cursor < len(arrivals) else finish
+                if waiting and run_priority > 1:
+                    for p, q in buckets.items():
+                        if q:
+                            promoted = q[0][0] + max(p - run_priority + 1, 0) * aging
+                            if promoted < next_event:
+                                next_event = promoted
+                if next_event < finish:
+                    remaining[current] -= next_event - current_time
+                    current_time = next_event
+                    continue
+            
+            remaining[current] = 0
+            completion[current] = finish
+            current_time = finish
+            self.timeline.add(run_start, current_time, current)
+            current = None
+            completed += 1
         
-        return self.timeline, procs
\ No newline at end of file
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
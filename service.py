@@ -0,0 +1,310 @@
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from runner import ALGORITHMS, EXTRA_ALGORITHMS, make_scheduler
+from scheduler import check_params
+from utils import calculate_statistics, read_csv
+from workload import WORKLOAD_SUFFIX, load_workload, save_workload
+
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8765
+SERVICE_CACHE_SIZE = 8
+SERVICE_LINE_LIMIT = 1 << 20
+SERVICE_TIMELINE_BATCH = 4096  # yanıt satırı başına çizelge satırı; satır sınırının altında kalır
+
+# Protokol: satır başına bir JSON nesnesi (UTF-8). İstemci bir istek satırı
+# gönderir, sunucu bir ya da daha çok yanıt satırıyla cevaplar; son yanıtın
+# type alanı "done" ya da "error"dır. İstekler:
+#   {"op": "submit", "format": "csv"|"wl", "size": N}  ardından N bayt dosya
+#       -> {"type": "done", "workload": <özet>, "processes": n, "cached": bool}
+#   {"op": "run", "workload": <özet> | "path": <sunucudaki dosya>,
+#    "algorithms": [...], "params": {metot: {...}}, "switch_cost": 0,
+#    "cores": 1, "smp_mode": "global", "timeline": true}
+#       -> algoritma başına {"type": "timeline", "algorithm", "text"}
+#          parçaları ve {"type": "statistics", "algorithm", "results"},
+#          en sonda {"type": "done"}
+#   {"op": "list"}, {"op": "ping"}
+
+def _simulate(workload_path, method, label, params, switch_cost, cores, smp_mode):
+    # İşçi süreçte çalışır: iş yükü mmap ile açılır, çizelge PID'siz döner
+    processes = load_workload(workload_path)
+    scheduler = make_scheduler(switch_cost, cores, smp_mode)
+    with contextlib.redirect_stdout(sys.stderr):
+        timeline, result_procs = getattr(scheduler, method)(processes, **params)
+        results = calculate_statistics(result_procs, label, "service", timeline=timeline)
+    del results['processes']
+    for line in getattr(timeline, 'cores', [timeline]):
+        line.pids = ()
+    timeline.pids = ()
+    return results, timeline
+
+def _timeline_chunks(timeline, pids, batch=SERVICE_TIMELINE_BATCH):
+    # Çizelge metnini parça parça üretir; tümü hiçbir zaman tek metin olmaz
+    lines = getattr(timeline, 'cores', None)
+    for k, line in enumerate(lines or [timeline]):
+        line.pids = pids
+        names = line.names()
+        if lines is not None:
+            yield f"=== CPU {k} ===\n"
+        for begin in range(0, len(line), batch):
+            yield line.render(begin, begin + batch, names)
+
+def _json_default(value):
+    # numpy sayıları
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _algorithm_table():
+    return {method: (label, params) for method, label, _, params in ALGORITHMS + EXTRA_ALGORITHMS}
+
+class SimulationService:
+    # Uzun süre çalışan simülasyon sunucusu. İş yükleri içerik özetiyle
+    # anahtarlanıp bellekte tutulur (son kullanılan cache_size tanesi) ve
+    # işçilere bir kez yazılmış ikili (.wl) dosya olarak paylaştırılır;
+    # aynı iş yüküyle farklı algoritma sorguları yeniden yükleme yapmaz.
+    def __init__(self, max_workers=None, cache_size=SERVICE_CACHE_SIZE):
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # özet -> {'table', 'path', 'active'}
+        self.pool = None
+        self.temp_dir = None
+        self.loading = {}  # aynı iş yükü aynı anda iki kez yüklenmesin
+    
+    async def start(self):
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="cpu-sched-")
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+    
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+        self.cache.clear()
+    
+    async def serve_tcp(self, host=SERVICE_HOST, port=SERVICE_PORT):
+        return await asyncio.start_server(self.handle, host, port, limit=SERVICE_LINE_LIMIT)
+    
+    async def serve_unix(self, path):
+        return await asyncio.start_unix_server(self.handle, path, limit=SERVICE_LINE_LIMIT)
+    
+    def _evict(self, keep=None):
+        # En eski ve şu an kullanılmayan girdiler atılır. keep (az önce
+        # eklenen girdi) atılmaz; diğerlerinin hepsi kullanımdaysa önbellek
+        # bir girdi serbest kalana kadar sınırı aşar.
+        for digest in list(self.cache):
+            if len(self.cache) <= self.cache_size:
+                break
+            entry = self.cache[digest]
+            if entry['active'] or digest == keep:
+                continue
+            del self.cache[digest]
+            with contextlib.suppress(OSError):
+                os.remove(entry['path'])
+    
+    async def _cached(self, digest, load):
+        # load(): (ProcessTable, .wl yolu) döndüren, iş parçacığında çalışan yükleyici
+        entry = self.cache.get(digest)
+        if entry is not None:
+            self.cache.move_to_end(digest)
+            return entry, True
+        if digest not in self.loading:
+            self.loading[digest] = asyncio.get_running_loop().run_in_executor(None, load)
+        try:
+            table, path = await self.loading[digest]
+        finally:
+            self.loading.pop(digest, None)
+        entry = self.cache.get(digest)
+        if entry is None:
+            entry = self.cache[digest] = {'table': table, 'path': path, 'active': 0}
+            self._evict(keep=digest)
+        return entry, False
+    
+    def _load_bytes(self, digest, data, fmt):
+        base = os.path.join(self.temp_dir.name, digest)
+        if fmt == 'wl':
+            with open(base + WORKLOAD_SUFFIX, 'wb') as f:
+                f.write(data)
+            return load_workload(base + WORKLOAD_SUFFIX), base + WORKLOAD_SUFFIX
+        with open(base + '.csv', 'wb') as f:
+            f.write(data)
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                table = read_csv(base + '.csv')
+        finally:
+            os.remove(base + '.csv')
+        return table, save_workload(table, base + WORKLOAD_SUFFIX)
+    
+    def _load_path(self, digest, path):
+        if path.endswith(WORKLOAD_SUFFIX):
+            table = load_workload(path)
+        else:
+            with contextlib.redirect_stdout(sys.stderr):
+                table = read_csv(path)
+        return table, save_workload(table, os.path.join(self.temp_dir.name, digest + WORKLOAD_SUFFIX))
+    
+    async def handle(self, reader, writer):
+        async def send(message):
+            writer.write(json.dumps(message, default=_json_default).encode() + b"\n")
+            await writer.drain()
+        
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request.get('op')
+                    if op == 'submit':
+                        await self._submit(request, reader, send)
+                    elif op == 'run':
+                        await self._run(request, send)
+                    elif op == 'list':
+                        await send({'type': 'done', 'workloads': [
+                            {'workload': digest, 'processes': len(entry['table'])}
+                            for digest, entry in self.cache.items()]})
+                    elif op == 'ping':
+                        await send({'type': 'done'})
+                    else:
+                        raise ValueError(f"unknown op: {op}")
+                except (ValueError, KeyError, TypeError, OSError) as e:
+                    await send({'type': 'error', 'message': str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+    
+    async def _submit(self, request, reader, send):
+        fmt = request.get('format', 'csv')
+        if fmt not in ('csv', 'wl'):
+            raise ValueError(f"unknown workload format: {fmt}")
+        data = await reader.readexactly(int(request['size']))
+        digest = hashlib.sha256(data).hexdigest()
+        entry, cached = await self._cached(digest, lambda: self._load_bytes(digest, data, fmt))
+        await send({'type': 'done', 'workload': digest, 'processes': len(entry['table']), 'cached': cached})
+    
+    async def _run(self, request, send):
+        if 'workload' in request:
+            entry = self.cache.get(request['workload'])
+            if entry is None:
+                raise ValueError(f"unknown workload: {request['workload']} (submit it first)")
+            self.cache.move_to_end(request['workload'])
+        else:
+            path = request['path']
+            # Dosya değişince önbellek girdisi de değişsin diye anahtara boyut ve zaman girer
+            stat = os.stat(path)
+            digest = hashlib.sha256(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+            entry, _ = await self._cached(digest, lambda: self._load_path(digest, path))
+        
+        algorithms = _algorithm_table()
+        methods = request.get('algorithms') or [method for method, _, _, _ in ALGORITHMS]
+        overrides = request.get('params', {})
+        switch_cost = request.get('switch_cost', 0)
+        cores = request.get('cores', 1)
+        smp_mode = request.get('smp_mode', 'global')
+        make_scheduler(switch_cost, cores, smp_mode)  # geçersiz ayarlar işçilere gitmeden
+        jobs = []
+        for method in methods:
+            if method not in algorithms:
+                raise ValueError(f"unknown algorithm: {method}")
+            label, params = algorithms[method]
+            params = dict(params, **overrides.get(method, {}))
+            # Geçersiz değerler motoru sonsuz döngüye sokabilir; işçiye gitmeden reddedilir
+            check_params(**params)
+            if method == 'round_robin':
+                label = f"Round Robin (Q={params['quantum']})"
+            if method.startswith('priority_') and params.get('aging'):
+                label = f"{label} (aging={params['aging']})"
+            jobs.append((method, label, params))
+        
+        loop = asyncio.get_running_loop()
+        entry['active'] += 1
+        try:
+            futures = {loop.run_in_executor(self.pool, _simulate, entry['path'], method, label, params,
+                                            switch_cost, cores, smp_mode): label
+                       for method, label, params in jobs}
+            for future in asyncio.as_completed(list(futures)):
+                try:
+                    results, timeline = await future
+                except Exception as e:
+                    await send({'type': 'algorithm_error', 'message': str(e)})
+                    continue
+                label = results['algorithm']
+                if request.get('timeline', True):
+                    for text in _timeline_chunks(timeline, entry['table'].pids):
+                        await send({'type': 'timeline', 'algorithm': label, 'text': text})
+                await send({'type': 'statistics', 'algorithm': label, 'results': results})
+        finally:
+            entry['active'] -= 1
+            self._evict()
+        await send({'type': 'done'})
+
+async def call(request, payload=b'', host=SERVICE_HOST, port=SERVICE_PORT, unix=None):
+    # Basit istemci: isteği gönderir, yanıtları "done"/"error" gelene kadar üretir
+    if unix:
+        reader, writer = await asyncio.open_unix_connection(unix, limit=SERVICE_LINE_LIMIT)
+    else:
+        reader, writer = await asyncio.open_connection(host, port, limit=SERVICE_LINE_LIMIT)
+    try:
+        writer.write(json.dumps(request).encode() + b"\n" + payload)
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("connection closed by the service")
+            message = json.loads(line)
+            yield message
+            if message['type'] in ('done', 'error'):
+                break
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+async def serve(host=SERVICE_HOST, port=SERVICE_PORT, unix=None, max_workers=None, cache_size=SERVICE_CACHE_SIZE):
+    service = SimulationService(max_workers, cache_size)
+    await service.start()
+    try:
+        if unix:
+            server = await service.serve_unix(unix)
+            print(f"Simulation service listening on {unix}")
+        else:
+            server = await service.serve_tcp(host, port)
+            print(f"Simulation service listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+        if unix:
+            with contextlib.suppress(OSError):
+                os.remove(unix)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the scheduling simulation as a local JSON-lines service.")
+    parser.add_argument('--host', default=SERVICE_HOST, help=f"TCP address (default: {SERVICE_HOST})")
+    parser.add_argument('--port', type=int, default=SERVICE_PORT, help=f"TCP port (default: {SERVICE_PORT})")
+    parser.add_argument('--unix', default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes")
+    parser.add_argument('--cache', type=int, default=SERVICE_CACHE_SIZE,
+                        help=f"workloads kept in memory (default: {SERVICE_CACHE_SIZE})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.jobs, args.cache))
+    except KeyboardInterrupt:
+        print("\nService stopped")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+import heapq
+from array import array
+from collections import deque
+from process import ProcessTable
+from scheduler import check_params
+from timeline import IDLE, Timeline
+
+SMP_MODES = ('global', 'per_core')
+
+class SmpTimeline:
+    # Çekirdek başına bir Timeline. Dilim sayıları tek dizide ortak tutulur;
+    # diğer sayaçlar çekirdekler üzerinden toplanır.
+    def __init__(self, pids=(), cores=1):
+        self.pids = pids
+        self.slices = array('i', bytes(4 * len(pids)))
+        self.cores = [Timeline(pids, self.slices) for _ in range(cores)]
+        self.migrations = 0
+    
+    def _total(self, name):
+        return sum(getattr(core, name) for core in self.cores)
+    
+    dispatches = property(lambda self: self._total('dispatches'))
+    dispatched = property(lambda self: self._total('dispatched'))
+    idle_intervals = property(lambda self: self._total('idle_intervals'))
+    idle_time = property(lambda self: self._total('idle_time'))
+    busy_time = property(lambda self: self._total('busy_time'))
+    switch_time = property(lambda self: self._total('switch_time'))
+    preemptions = property(lambda self: self.dispatches - self.dispatched)
+    context_switches = property(lambda self: self._total('context_switches'))
+    
+    def write(self, file):
+        for k, core in enumerate(self.cores):
+            file.write(f"=== CPU {k} ===\n")
+            core.write(file)
+    
+    def __len__(self):
+        return sum(len(core) for core in self.cores)
+    
+    def __iter__(self):
+        for k, core in enumerate(self.cores):
+            yield f"=== CPU {k} ==="
+            yield from core
+
+class SmpScheduler:
+    # Çok çekirdekli (SMP) simülasyon; metotlar ve dönüş değerleri Scheduler
+    # ile aynıdır, zaman çizelgesi çekirdek başına tutulur.
+    #
+    # mode='global': tüm çekirdekler tek hazır kuyruğu paylaşır; kesmeli
+    #   algoritmalarda yeni gelen, çalışanların en kötüsünü keser.
+    # mode='per_core': her çekirdeğin kendi kuyruğu vardır, gelenler sırayla
+    #   dağıtılır; kuyruğu boşalan çekirdek en kalabalık kuyruktan iş çalar.
+    #
+    # Olay tabanlıdır: zaman yalnızca varışlara ve çekirdeklerin dilim
+    # sonlarına atlar. Tek çekirdekte Scheduler ile aynı sonucu verir.
+    def __init__(self, cores=4, mode='global'):
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        if mode not in SMP_MODES:
+            raise ValueError(f"unknown SMP mode: {mode}")
+        self.cores = cores
+        self.mode = mode
+        self.timeline = SmpTimeline((), cores)
+    
+    def fcfs(self, processes):
+        return self._run(processes, 'arrival')
+    
+    def sjf_non_preemptive(self, processes):
+        return self._run(processes, 'burst')
+    
+    def sjf_preemptive(self, processes):
+        return self._run(processes, 'remaining', preemptive=True)
+    
+    def round_robin(self, processes, quantum=4):
+        check_params(quantum=quantum)
+        return self._run(processes, None, quantum=quantum)
+    
+    def priority_non_preemptive(self, processes):
+        return self._run(processes, 'priority_num')
+    
+    def priority_preemptive(self, processes):
+        return self._run(processes, 'priority_num', preemptive=True)
+    
+    def _run(self, processes, key, preemptive=False, quantum=None):
+        # key: hazır kuyruğu sıralama sütunu; None ise Round Robin (deque).
+        # Kuyruklar (key, indeks) heap'idir, eşitlikte girdi sırası kazanır.
+        table = ProcessTable.of(processes)
+        n = len(table)
+        cores = self.cores
+        self.timeline = SmpTimeline(table.pids, cores)
+        lines = self.timeline.cores
+        arrival = table.arrival.tolist()
+        remaining = table.burst.tolist()
+        if key == 'remaining':
+            keys = remaining
+        elif key is not None:
+            keys = getattr(table, key).tolist()
+        start = [-1] * n
+        completion = [0] * n
+        last_core = [-1] * n
+        # Kesmeli motor gibi sıfır süreli süreçler hiç çalıştırılmaz
+        if preemptive:
+            arrivals = sorted((i for i in range(n) if remaining[i] > 0), key=arrival.__getitem__)
+        else:
+            arrivals = sorted(range(n), key=arrival.__getitem__)
+        
+        rr = quantum is not None
+        per_core = self.mode == 'per_core'
+        srtf = key == 'remaining'
+        queues = [deque() if rr else [] for _ in range(cores if per_core else 1)]
+        queued = 0
+        placement = 0
+        
+        running = [-1] * cores
+        run_start = [0] * cores
+        free_since = [0] * cores
+        stamp = [0] * cores  # her dağıtımda artar; eski olayları geçersiz kılar
+        idle = list(range(cores))
+        in_idle = bytearray(b'\x01' * cores)  # çekirdek idle yığınında en fazla bir kez
+        events = []
+        # Genel kuyrukta kesme adayları: (-sıra, -indeks) ile en kötü çalışan en üstte
+        victims = []
+        migrations = 0
+        cursor = 0
+        done = 0
+        total = len(arrivals)
+        expired = []
+        
+        def enqueue(i, c):
+            nonlocal queued
+            q = queues[c] if per_core else queues[0]
+            if rr:
+                q.append(i)
+            else:
+                heapq.heappush(q, (keys[i], i))
+            queued += 1
+        
+        def dispatch(c, i, t):
+            nonlocal migrations
+            if start[i] == -1:
+                start[i] = t
+            if free_since[c] < t:
+                lines[c].add(free_since[c], t, IDLE)
+            if last_core[i] != c:
+                if last_core[i] != -1:
+                    migrations += 1
+                last_core[i] = c
+            running[c] = i
+            run_start[c] = t
+            stamp[c] += 1
+            run = quantum if rr and remaining[i] > quantum else remaining[i]
+            heapq.heappush(events, (t + run, c, stamp[c]))
+            if preemptive and not per_core:
+                # SRTF'de çalışanın kalan süresi zamanla azalır; kalan + başlangıç
+                # (tahmini bitiş) ise sabittir ve aynı sıralamayı verir.
+                rank = remaining[i] + t if srtf else keys[i]
+                heapq.heappush(victims, (-rank, -i, c, stamp[c]))
+        
+        def stop(c, t):
+            i = running[c]
+            remaining[i] -= t - run_start[c]
+            lines[c].add(run_start[c], t, i)
+            running[c] = -1
+            free_since[c] = t
+            return i
+        
+        while done < total:
+            while events and events[0][2] != stamp[events[0][1]]:
+                heapq.heappop(events)
+            t = events[0][0] if events else arrival[arrivals[cursor]]
+            if cursor < total and arrival[arrivals[cursor]] < t:
+                t = arrival[arrivals[cursor]]
+            
+            # Bu anda biten dilimler
+            while events and events[0][0] == t:
+                _, c, s = heapq.heappop(events)
+                if s != stamp[c]:
+                    continue
+                i = stop(c, t)
+                if not in_idle[c]:
+                    in_idle[c] = 1
+                    heapq.heappush(idle, c)
+                if remaining[i] == 0:
+                    completion[i] = t
+                    done += 1
+                else:
+                    expired.append(i)
+            
+            # Gelenler, ardından süresi dolanlar kuyruğa (tek çekirdekli RR sırası)
+            touched = []
+            while cursor < total and arrival[arrivals[cursor]] <= t:
+                i = arrivals[cursor]
+                cursor += 1
+                enqueue(i, placement)
+                touched.append(placement)
+                if per_core:
+                    placement = (placement + 1) % cores
+            for i in expired:
+                enqueue(i, last_core[i])
+                touched.append(last_core[i])
+            expired.clear()
+            
+            # per_core: boştaki çekirdek önce kendi kuyruğundan alır. Böylece
+            # yerel işi varken başka bir çekirdek onu çalmaz. idle yığınında
+            # kalan girdiler aşağıda running kontrolüyle atlanır.
+            if per_core:
+                for c in touched:
+                    if running[c] == -1 and queues[c]:
+                        q = queues[c]
+                        i = q.popleft() if rr else heapq.heappop(q)[1]
+                        queued -= 1
+                        dispatch(c, i, t)
+            
+            # Boştaki çekirdeklere iş ver; per_core'da yerel kuyruk boşsa çal
+            while idle and queued:
+                c = heapq.heappop(idle)
+                in_idle[c] = 0
+                if running[c] != -1:
+                    continue
+                q = queues[c] if per_core else queues[0]
+                if per_core and not q:
+                    q = max(queues, key=len)
+                i = q.popleft() if rr else heapq.heappop(q)[1]
+                queued -= 1
+                dispatch(c, i, t)
+            
+            if not preemptive or not queued:
+                continue
+            
+            if per_core:
+                # Yalnızca yeni iş alan kuyruklar çalışan süreçlerini kesebilir
+                for c in touched:
+                    q = queues[c]
+                    i = running[c]
+                    if i != -1 and q and q[0] < (keys[i] - (t - run_start[c] if srtf else 0), i):
+                        stop(c, t)
+                        heapq.heappush(q, (keys[i], i))
+                        dispatch(c, heapq.heappop(q)[1], t)
+                continue
+            
+            q = queues[0]
+            while q and victims:
+                negrank, negi, c, s = victims[0]
+                if s != stamp[c] or running[c] == -1:
+                    heapq.heappop(victims)
+                    continue
+                i = -negi
+                current_key = -negrank - t if srtf else -negrank
+                if not q[0] < (current_key, i):
+                    break
+                heapq.heappop(victims)
+                stop(c, t)
+                heapq.heappush(q, (keys[i], i))
+                dispatch(c, heapq.heappop(q)[1], t)
+            # Geçersiz adaylar yığının dibinde birikmesin
+            if len(victims) > 4 * cores + 1024:
+                victims = [v for v in victims if v[3] == stamp[v[2]] and running[v[2]] != -1]
+                heapq.heapify(victims)
+        
+        self.timeline.migrations = migrations
+        return self.timeline, table.with_results(start, completion, remaining, self.timeline.slices)
@@ -0,0 +1,440 @@
+import argparse
+import heapq
+import json
+import os
+import sys
+from collections import deque, namedtuple
+from process import PRIORITY_NAMES, PRIORITY_NUMS
+from scheduler import check_params
+from timeline import IDLE, SWITCH
+from utils import CSV_CHUNK_SIZE, CsvReader
+from windows import Window, WindowMonitor
+
+STREAM_METHODS = ('fcfs', 'sjf_non_preemptive', 'sjf_preemptive', 'round_robin',
+                  'priority_non_preemptive', 'priority_preemptive')
+
+class Slice(namedtuple('Slice', 'start end pid')):
+    # Zaman çizelgesinin bir dilimi; pid IDLE ya da SWITCH de olabilir
+    __slots__ = ()
+    
+    def __str__(self):
+        return f"[{self.start}] - {self.pid} - [{self.end}]"
+
+# Biten bir sürecin sonuçları; waiting hazır kuyruğunda geçen toplam süredir (turnaround - burst)
+Completion = namedtuple('Completion', 'pid arrival burst priority start completion waiting turnaround slices')
+
+def _row(item):
+    # (pid, arrival, burst, priority) demeti ya da Process benzeri bir nesne
+    if isinstance(item, tuple):
+        pid, arrival, burst, priority = item
+        return [str(pid), int(arrival), int(burst), PRIORITY_NUMS.get(str(priority).lower(), 3)]
+    return [str(item.pid), int(item.arrival), int(item.burst), int(item.priority_num)]
+
+def csv_arrivals(filename, chunk_size=CSV_CHUNK_SIZE):
+    # CSV'yi blok blok okuyup satırları sırayla verir; dosya varışa göre sıralı olmalı
+    for table in CsvReader(filename, chunk_size):
+        yield from table
+
+class _Engine:
+    # Scheduler motorlarının itmeli (push) hali. feed() bir varışı almadan
+    # önce simülasyonu o varışın zamanına kadar ilerletir; close() kalan işi
+    # bitirir. İkisi de olayları (Slice, Completion) üreten generator'dır.
+    # Yalnızca hazır kümesindeki süreçler bellekte tutulur; biten süreç
+    # raporlanıp silinir. Sonuçlar Scheduler ile aynıdır (eşitlikte girdi
+    # sırası kazanır, dilimler Timeline gibi birleştirilir).
+    skip_empty = False
+    
+    def __init__(self, switch_cost):
+        self.switch_cost = switch_cost
+        # sıra no -> [pid, arrival, burst, priority_num, remaining, start, slices]
+        self.procs = {}
+        self.count = 0
+        self.current_time = 0
+        self.last_arrival = None
+        self.last = IDLE  # en son çalışan süreç
+        self.pending = None  # henüz birleşebilecek son dilim [start, end, owner]
+        self.out = []
+        self.dispatches = 0
+        self.dispatched = 0
+        self.idle_intervals = 0
+        self.idle_time = 0
+        self.switches = 0
+        self.switch_time = 0
+        self.busy_time = 0
+        self.completed = 0
+        self.monitor = None  # WindowMonitor verilirse pencere kayıtları da üretilir
+    
+    def feed(self, item):
+        row = _row(item)
+        if self.last_arrival is not None and row[1] < self.last_arrival:
+            raise ValueError(f"arrivals must be sorted by arrival time ({row[0]} arrives at {row[1]} "
+                             f"after {self.last_arrival})")
+        self.last_arrival = row[1]
+        i = self.count
+        self.count += 1
+        monitor = self.monitor
+        # Kesmeli motorlar sıfır süreli süreçleri hiç çalıştırmaz
+        if self.skip_empty and row[2] == 0:
+            if monitor is not None:
+                monitor.arrive(row[1], False)
+            return
+        yield from self._advance(row[1])
+        yield from self.out
+        self.out.clear()
+        row.extend((row[2], -1, 0))
+        self.procs[i] = row
+        self._admit(i)
+        if monitor is not None:
+            # Bu andan önceki varışlar ve kesinleşmiş dilimler bilindiğinden
+            # bitişi ikisini de geçmeyen pencereler kapanabilir
+            monitor.arrive(row[1])
+            yield from monitor.ready(min(row[1], self._settled()))
+    
+    def close(self):
+        yield from self._advance(None)
+        self._flush()
+        yield from self.out
+        self.out.clear()
+        if self.monitor is not None:
+            yield from self.monitor.ready(None)
+    
+    def _settled(self):
+        # Bu zamana kadarki tüm dilimler _add ile bildirilmiştir
+        return self.current_time
+    
+    def counters(self):
+        return {
+            'dispatches': self.dispatches,
+            'preemptions': self.dispatches - self.dispatched,
+            'context_switches': max(self.dispatches - 1, 0),
+            'idle_intervals': self.idle_intervals,
+            'idle_time': self.idle_time,
+            'busy_time': self.busy_time,
+            'switch_time': self.switch_time,
+            'completed': self.completed,
+        }
+    
+    def _add(self, start, end, owner):
+        # Timeline.add ile aynı kurallar; son dilim birleşemeyeceği belli
+        # olunca olay olarak çıkar
+        if self.monitor is not None and owner >= 0:
+            self.monitor.busy(start, end)
+        pending = self.pending
+        if pending is not None and pending[2] == owner and pending[1] == start and owner != SWITCH:
+            pending[1] = end
+            if owner == IDLE:
+                self.idle_time += end - start
+            else:
+                self.busy_time += end - start
+            return
+        self._flush()
+        self.pending = [start, end, owner]
+        if owner == IDLE:
+            self.idle_intervals += 1
+            self.idle_time += end - start
+        elif owner == SWITCH:
+            self.switches += 1
+            self.switch_time += end - start
+        else:
+            self.last = owner
+            self.busy_time += end - start
+            p = self.procs[owner]
+            if not p[6]:
+                self.dispatched += 1
+            p[6] += 1
+            self.dispatches += 1
+    
+    def _flush(self):
+        if self.pending is not None:
+            start, end, owner = self.pending
+            if owner == IDLE:
+                pid = "IDLE"
+            elif owner == SWITCH:
+                pid = "SWITCH"
+            else:
+                pid = self.procs[owner][0]
+            self.out.append(Slice(start, end, pid))
+            self.pending = None
+    
+    def _complete(self, i, t):
+        # Biten sürecin dilimi artık birleşemez; önce o çıkar
+        self._flush()
+        pid, arrival, burst, priority_num, _, start, slices = self.procs.pop(i)
+        self.out.append(Completion(pid, arrival, burst, PRIORITY_NAMES.get(priority_num, 'low'), start, t,
+                                   max(t - arrival - burst, 0), t - arrival, slices))
+        self.completed += 1
+        if self.monitor is not None:
+            self.monitor.complete(arrival, burst, t)
+    
+    def _switch(self, i, current_time):
+        last = self.last
+        if last == IDLE or last == i:
+            return current_time
+        cost = self.switch_cost(last, i) if callable(self.switch_cost) else self.switch_cost
+        if cost > 0:
+            self._add(current_time, current_time + cost, SWITCH)
+            self.last = i
+            current_time += cost
+        return current_time
+
+class _NonPreemptive(_Engine):
+    def __init__(self, switch_cost, key):
+        super().__init__(switch_cost)
+        self.key = key  # süreç satırındaki sıralama alanı
+        self.ready = []
+    
+    def _admit(self, i):
+        heapq.heappush(self.ready, (self.procs[i][self.key], i))
+    
+    def _advance(self, limit):
+        # limit: bir sonraki varış zamanı (None: başka varış yok)
+        ready = self.ready
+        out = self.out
+        while limit is None or self.current_time < limit:
+            if not ready:
+                if limit is None:
+                    return
+                self._add(self.current_time, limit, IDLE)
+                self.current_time = limit
+                break
+            _, i = heapq.heappop(ready)
+            t = self.current_time
+            if self.switch_cost:
+                t = self._switch(i, t)
+            p = self.procs[i]
+            p[5] = t
+            self._add(t, t + p[2], i)
+            t += p[2]
+            self._complete(i, t)
+            self.current_time = t
+            yield from out
+            out.clear()
+
+class _RoundRobin(_Engine):
+    def __init__(self, switch_cost, quantum):
+        super().__init__(switch_cost)
+        self.quantum = quantum
+        self.ready = deque()
+        self.expired = None  # süresi dolan süreç, yeni gelenlerden sonra kuyruğa döner
+    
+    def _admit(self, i):
+        self.ready.append(i)
+    
+    def _advance(self, limit):
+        ready = self.ready
+        out = self.out
+        while limit is None or self.current_time < limit:
+            if self.expired is not None:
+                ready.append(self.expired)
+                self.expired = None
+            if not ready:
+                if limit is None:
+                    return
+                self._add(self.current_time, limit, IDLE)
+                self.current_time = limit
+                break
+            i = ready.popleft()
+            t = self.current_time
+            if self.switch_cost:
+                t = self._switch(i, t)
+            p = self.procs[i]
+            if p[5] == -1:
+                p[5] = t
+            run = min(self.quantum, p[4])
+            self._add(t, t + run, i)
+            t += run
+            p[4] -= run
+            if p[4] == 0:
+                self._complete(i, t)
+            else:
+                self.expired = i
+            self.current_time = t
+            yield from out
+            out.clear()
+
+class _Preemptive(_Engine):
+    skip_empty = True
+    
+    def __init__(self, switch_cost, key):
+        super().__init__(switch_cost)
+        self.key = key  # 4 (kalan süre) ise SRTF
+        self.ready = []
+        self.current = None
+        self.run_start = 0
+    
+    def _admit(self, i):
+        heapq.heappush(self.ready, (self.procs[i][self.key], i))
+    
+    def _settled(self):
+        # Çalışan sürecin dilimi kesilene ya da bitene kadar eklenmez
+        return self.run_start if self.current is not None else self.current_time
+    
+    def _advance(self, limit):
+        ready = self.ready
+        procs = self.procs
+        key = self.key
+        out = self.out
+        while limit is None or self.current_time < limit:
+            t = self.current_time
+            current = self.current
+            if current is not None and ready and ready[0] < (procs[current][key], current):
+                if self.run_start < t:
+                    self._add(self.run_start, t, current)
+                heapq.heappush(ready, (procs[current][key], current))
+                current = self.current = None
+            
+            if current is None:
+                if not ready:
+                    if limit is None:
+                        return
+                    self._add(t, limit, IDLE)
+                    self.current_time = limit
+                    break
+                _, current = heapq.heappop(ready)
+                self.current = current
+                if self.switch_cost:
+                    switched = self._switch(current, t)
+                    if switched > t:
+                        # Geçiş süresince gelenler önce kuyruğa alınmalı
+                        self.current_time = self.run_start = switched
+                        yield from out
+                        out.clear()
+                        continue
+                self.run_start = t
+            
+            p = procs[current]
+            if p[5] == -1:
+                p[5] = t
+            finish = t + p[4]
+            if limit is not None and limit < finish:
+                p[4] -= limit - t
+                self.current_time = limit
+            else:
+                p[4] = 0
+                self._add(self.run_start, finish, current)
+                self._complete(current, finish)
+                self.current = None
+                self.current_time = finish
+            yield from out
+            out.clear()
+
+class StreamScheduler:
+    # Scheduler'ın akış hali: varışlar bir iterator'dan (stream) ya da async
+    # generator'dan (astream) varış sırasıyla tek tek çekilir, dilimler ve
+    # biten süreçler oluştukça üretilir. Bellek kullanımı izin boyuyla değil
+    # hazır kümesinin boyuyla orantılıdır. Girdi öğeleri (pid, arrival,
+    # burst, priority) demetleri ya da Process/ProcessView nesneleridir.
+    # monitor (windows.WindowMonitor) verilirse kapanan her zaman penceresi
+    # için bir Window olayı da üretilir; uzun simülasyonlar böylece
+    # ilerlerken izlenebilir.
+    def __init__(self, switch_cost=0):
+        self.switch_cost = switch_cost
+        self.engine = None  # son akışın motoru; sayaçlar için
+    
+    def fcfs(self, arrivals):
+        return self.stream('fcfs', arrivals)
+    
+    def sjf_non_preemptive(self, arrivals):
+        return self.stream('sjf_non_preemptive', arrivals)
+    
+    def sjf_preemptive(self, arrivals):
+        return self.stream('sjf_preemptive', arrivals)
+    
+    def round_robin(self, arrivals, quantum=4):
+        return self.stream('round_robin', arrivals, quantum=quantum)
+    
+    def priority_non_preemptive(self, arrivals):
+        return self.stream('priority_non_preemptive', arrivals)
+    
+    def priority_preemptive(self, arrivals):
+        return self.stream('priority_preemptive', arrivals)
+    
+    def _engine(self, method, params, monitor=None):
+        if method == 'fcfs':
+            engine = _NonPreemptive(self.switch_cost, 1)
+        elif method == 'sjf_non_preemptive':
+            engine = _NonPreemptive(self.switch_cost, 2)
+        elif method == 'priority_non_preemptive':
+            engine = _NonPreemptive(self.switch_cost, 3)
+        elif method == 'sjf_preemptive':
+            engine = _Preemptive(self.switch_cost, 4)
+        elif method == 'priority_preemptive':
+            engine = _Preemptive(self.switch_cost, 3)
+        elif method == 'round_robin':
+            check_params(**params)
+            engine = _RoundRobin(self.switch_cost, params.get('quantum', 4))
+        else:
+            raise ValueError(f"unknown streaming algorithm: {method}")
+        engine.monitor = monitor
+        self.engine = engine
+        return engine
+    
+    def stream(self, method, arrivals, monitor=None, **params):
+        engine = self._engine(method, params, monitor)
+        for item in arrivals:
+            yield from engine.feed(item)
+        yield from engine.close()
+    
+    async def astream(self, method, arrivals, monitor=None, **params):
+        # arrivals async iterable ya da düz iterable olabilir
+        engine = self._engine(method, params, monitor)
+        if hasattr(arrivals, '__aiter__'):
+            async for item in arrivals:
+                for event in engine.feed(item):
+                    yield event
+        else:
+            for item in arrivals:
+                for event in engine.feed(item):
+                    yield event
+        for event in engine.close():
+            yield event
+
+def _event_record(event):
+    if isinstance(event, Slice):
+        return {'type': 'slice', 'start': event.start, 'end': event.end, 'pid': event.pid}
+    if isinstance(event, Window):
+        return dict(event._asdict(), type='window')
+    return dict(event._asdict(), type='completion')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream a workload sorted by arrival through one algorithm and print events as they happen.")
+    parser.add_argument('workload', help="CSV file sorted by arrival time, or - for stdin")
+    parser.add_argument('-a', '--algorithm', choices=STREAM_METHODS, default='fcfs')
+    parser.add_argument('-q', '--quantum', type=int, default=4, help="Round Robin quantum (default: 4)")
+    parser.add_argument('-s', '--switch-cost', type=int, default=0, help="context switch cost (default: 0)")
+    parser.add_argument('-f', '--format', choices=('text', 'jsonl'), default='text',
+                        help="text: timeline lines and DONE lines, jsonl: one JSON object per event")
+    parser.add_argument('-w', '--window', type=int, default=None,
+                        help="also report throughput, utilization, queue length and waiting per window of this width")
+    args = parser.parse_args(argv)
+    
+    arrivals = csv_arrivals('/dev/stdin' if args.workload == '-' else args.workload)
+    params = {'quantum': args.quantum} if args.algorithm == 'round_robin' else {}
+    scheduler = StreamScheduler(args.switch_cost)
+    write = sys.stdout.write
+    try:
+        monitor = WindowMonitor(args.window) if args.window is not None else None
+        for event in scheduler.stream(args.algorithm, arrivals, monitor, **params):
+            if args.format == 'jsonl':
+                write(json.dumps(_event_record(event)) + "\n")
+            elif isinstance(event, Slice):
+                write(f"{event}\n")
+            elif isinstance(event, Window):
+                write(f"WINDOW [{event.start}, {event.end}) arrivals={event.arrivals} completed={event.completed} "
+                      f"utilization={event.utilization}% queue={event.queue_length} "
+                      f"waiting={event.avg_waiting}\n")
+            else:
+                write(f"DONE {event.pid} start={event.start} completion={event.completion} "
+                      f"waiting={event.waiting} turnaround={event.turnaround}\n")
+    except BrokenPipeError:
+        # Çıktıyı okuyan taraf erken kapandı (ör. head); kapanışta tekrar hata vermesin
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
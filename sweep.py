@@ -0,0 +1,223 @@
+import argparse
+import contextlib
+import csv
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from runner import ALGORITHMS, EXTRA_ALGORITHMS, make_scheduler
+from smp import SMP_MODES, SmpScheduler
+from utils import calculate_statistics
+from workload import WORKLOAD_SUFFIX, load_processes, load_workload, save_workload
+
+# Önbellek anahtarına girer; sonuçları etkileyen bir değişiklikte artırılmalı
+SWEEP_CACHE_VERSION = 5
+SWEEP_CACHE_DIR = "outputs/.sweep_cache"
+SWEEP_COLUMNS = ['workload', 'algorithm', 'method', 'quantum', 'aging', 'switch_cost', 'cores', 'processes', 'makespan',
+                 'avg_waiting', 'max_waiting', 'avg_turnaround', 'max_turnaround',
+                 'avg_response', 'p95_waiting', 'p99_waiting', 'p95_turnaround', 'p99_turnaround',
+                 'cpu_efficiency', 'context_switches', 'preemptions', 'idle_intervals',
+                 'switch_time', 'migrations', 'load_imbalance', 'seconds', 'cached']
+
+def file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def cell_key(workload_digest, method, params):
+    raw = json.dumps([SWEEP_CACHE_VERSION, workload_digest, method, params], sort_keys=True)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+def run_cell(workload_path, method, label, params):
+    # İşçi süreçte tek bir (iş yükü, algoritma, parametre) hücresini çalıştırır.
+    # Tanı mesajları stderr'e gider; stdout tabloya ayrılmıştır.
+    processes = load_workload(workload_path)
+    params = dict(params)
+    switch_cost = params.pop('switch_cost', 0)
+    cores = params.pop('cores', 1)
+    scheduler = make_scheduler(switch_cost, cores, params.pop('smp_mode', 'global'))
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        timeline, result_procs = getattr(scheduler, method)(processes, **params)
+        results = calculate_statistics(result_procs, label, "sweep", timeline=timeline)
+    row = {
+        'algorithm': label,
+        'method': method,
+        'quantum': params.get('quantum', ''),
+        'aging': params.get('aging', ''),
+        'switch_cost': switch_cost,
+        'cores': cores,
+        'processes': len(result_procs),
+        'makespan': int(result_procs.completion.max()) if len(result_procs) else 0,
+        'p95_waiting': results['waiting_percentiles'][95],
+        'p99_waiting': results['waiting_percentiles'][99],
+        'p95_turnaround': results['turnaround_percentiles'][95],
+        'p99_turnaround': results['turnaround_percentiles'][99],
+    }
+    for key in ('avg_waiting', 'max_waiting', 'avg_turnaround', 'max_turnaround',
+                'avg_response', 'cpu_efficiency', 'context_switches', 'preemptions', 'idle_intervals',
+                'switch_time', 'migrations', 'load_imbalance'):
+        row[key] = results[key]
+    row['seconds'] = round(time.perf_counter() - started, 4)
+    return row
+
+def sweep_cells(methods, quanta, switch_costs=(0,), cores=(1,), smp_mode='global', agings=(0,)):
+    # Round Robin her quantum için, öncelik algoritmaları her yaşlandırma
+    # aralığı için (0: yaşlandırma yok) ayrı hücre; diğerleri bunlardan
+    # bağımsız. Her hücre ayrıca her bağlam değiştirme maliyeti ve çekirdek
+    # sayısı için tekrarlanır (geçiş maliyeti ve yaşlandırma yalnızca tek
+    # çekirdekte modellenir).
+    algorithms = {method: (label, params) for method, label, _, params in ALGORITHMS + EXTRA_ALGORITHMS}
+    for method in methods:
+        if method not in algorithms:
+            raise ValueError(f"unknown algorithm: {method}")
+        label, defaults = algorithms[method]
+        for core_count in cores:
+            # MLFQ ve CFS yalnızca tek çekirdekte vardır
+            if core_count > 1 and not hasattr(SmpScheduler, method):
+                continue
+            for switch_cost in switch_costs:
+                if core_count > 1 and switch_cost:
+                    continue
+                params = dict(defaults, switch_cost=switch_cost)
+                if core_count > 1:
+                    params.update(cores=core_count, smp_mode=smp_mode)
+                if method == 'round_robin':
+                    for quantum in quanta:
+                        yield method, f"Round Robin (Q={quantum})", dict(params, quantum=quantum)
+                elif method.startswith('priority_'):
+                    for aging in agings:
+                        if not aging:
+                            yield method, label, params
+                        elif core_count == 1:
+                            yield method, f"{label} (aging={aging})", dict(params, aging=aging)
+                else:
+                    yield method, label, params
+
+def sweep(workloads, methods=None, quanta=(4,), max_workers=None, cache_dir=SWEEP_CACHE_DIR,
+          switch_costs=(0,), cores=(1,), smp_mode='global', agings=(0,), failures=None):
+    # Tüm (iş yükü x algoritma x quantum x geçiş maliyeti x çekirdek)
+    # kombinasyonlarını paralel çalıştırır; önbellekte bulunan hücreler
+    # atlanır. Her hücre tablo için bir satırdır. Hata veren hücre taramayı
+    # durdurmaz: stderr'e yazılır, tabloya girmez ve failures listesi
+    # verildiyse (iş yükü, algoritma, parametreler, hata) olarak eklenir.
+    if methods is None:
+        methods = [method for method, _, _, _ in ALGORITHMS]
+    cells = list(sweep_cells(methods, quanta, switch_costs, cores, smp_mode, agings))
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    rows = {}
+    pending = []
+    temp_paths = []
+    try:
+        for w, workload in enumerate(workloads):
+            digest = file_digest(workload)
+            binary_path = None
+            for c, (method, label, params) in enumerate(cells):
+                cache_path = os.path.join(cache_dir, cell_key(digest, method, params) + ".json") if cache_dir else None
+                if cache_path and os.path.exists(cache_path):
+                    with open(cache_path) as f:
+                        rows[w, c] = dict(json.load(f), workload=workload, cached=True)
+                    continue
+                # CSV her iş yükü için bir kez ikili biçime çevrilip işçilerle paylaşılır
+                if binary_path is None:
+                    if workload.endswith(WORKLOAD_SUFFIX):
+                        binary_path = workload
+                    else:
+                        fd, binary_path = tempfile.mkstemp(suffix=WORKLOAD_SUFFIX)
+                        os.close(fd)
+                        temp_paths.append(binary_path)
+                        with contextlib.redirect_stdout(sys.stderr):
+                            save_workload(load_processes(workload), binary_path)
+                pending.append(((w, c), workload, binary_path, method, label, params, cache_path))
+        
+        if pending:
+            if max_workers is None:
+                max_workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(run_cell, binary_path, method, label, params):
+                           (slot, workload, label, params, cache_path)
+                           for slot, workload, binary_path, method, label, params, cache_path in pending}
+                for future in as_completed(futures):
+                    slot, workload, label, params, cache_path = futures[future]
+                    try:
+                        row = future.result()
+                    except Exception as e:
+                        print(f"FAILED {workload} {label} {json.dumps(params, sort_keys=True)}: {e}",
+                              file=sys.stderr)
+                        if failures is not None:
+                            failures.append((workload, label, params, str(e)))
+                        continue
+                    if cache_path:
+                        with open(cache_path, 'w') as f:
+                            json.dump(row, f)
+                    rows[slot] = dict(row, workload=workload, cached=False)
+    finally:
+        for path in temp_paths:
+            os.remove(path)
+    
+    # Satırlar bitiş sırasından bağımsız olarak ızgara sırasıyla döner
+    return [rows[slot] for slot in sorted(rows)]
+
+def write_table(rows, file):
+    writer = csv.DictWriter(file, fieldnames=SWEEP_COLUMNS, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(rows)
+
+def positive_int(value):
+    # argparse tipi; quantum gibi sıfır ya da negatif olamayacak değerler için
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run a grid of workloads x algorithms x RR quanta x aging intervals x switch costs x core counts.")
+    parser.add_argument('workloads', nargs='+', help="CSV or .wl workload files")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=None,
+                        choices=[method for method, _, _, _ in ALGORITHMS + EXTRA_ALGORITHMS],
+                        help="scheduler methods to run (default: the six classic algorithms)")
+    parser.add_argument('-q', '--quanta', nargs='+', type=positive_int, default=[4],
+                        help="Round Robin quanta to sweep (default: 4)")
+    parser.add_argument('-g', '--aging', nargs='+', type=non_negative_int, default=[0],
+                        help="priority aging intervals to sweep, 0 disables aging (default: 0)")
+    parser.add_argument('-s', '--switch-costs', nargs='+', type=int, default=[0],
+                        help="context switch costs to sweep (default: 0)")
+    parser.add_argument('-c', '--cores', nargs='+', type=int, default=[1],
+                        help="simulated CPU core counts to sweep (default: 1)")
+    parser.add_argument('--smp-mode', choices=SMP_MODES, default='global',
+                        help="run queue layout for multi-core cells (default: global)")
+    parser.add_argument('-j', '--jobs', type=int, default=None, help="worker processes")
+    parser.add_argument('-o', '--output', default=None, help="write the table to this CSV file")
+    parser.add_argument('--cache-dir', default=SWEEP_CACHE_DIR, help="result cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="ignore and do not write the cache")
+    args = parser.parse_args(argv)
+    
+    failures = []
+    rows = sweep(args.workloads, args.algorithms, args.quanta, args.jobs,
+                 None if args.no_cache else args.cache_dir, args.switch_costs, args.cores, args.smp_mode, args.aging,
+                 failures)
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            write_table(rows, f)
+        print(f"Sweep table saved: {args.output} ({len(rows)} rows)")
+    else:
+        write_table(rows, sys.stdout)
+    # Biten hücreler yine de yazılır; hata olduysa çıkış kodu 1
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
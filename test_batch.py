@@ -0,0 +1,23 @@
+import os
+from batch import default_workloads, parse_args
+
+def test_default_workloads_prefers_converted_workload(tmp_path):
+    # convert_csv'nin yanına yazdığı .wl, aynı adlı CSV ile birlikte bulunmamalı
+    for name in ('case1.csv', 'case1.wl', 'case2.csv', 'case3.wl'):
+        (tmp_path / name).write_text("")
+    assert [os.path.basename(path) for path in default_workloads(str(tmp_path))] == \
+        ['case1.wl', 'case2.csv', 'case3.wl']
+
+def test_default_workloads_keeps_csv_edited_after_conversion(tmp_path):
+    (tmp_path / 'case1.wl').write_text("")
+    (tmp_path / 'case1.csv').write_text("")
+    os.utime(tmp_path / 'case1.wl', (1, 1))
+    assert [os.path.basename(path) for path in default_workloads(str(tmp_path))] == ['case1.csv']
+
+def test_parse_args_accepts_converted_data_dir(tmp_path, monkeypatch):
+    data = tmp_path / 'data'
+    data.mkdir()
+    for name in ('case1.csv', 'case1.wl'):
+        (data / name).write_text("")
+    monkeypatch.chdir(tmp_path)
+    assert parse_args([]).workloads == [os.path.join('data', 'case1.wl')]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from bench import generate_workload
+from process import ProcessTable
+from scheduler import Scheduler
+from smp import SmpScheduler
+from stream import StreamScheduler
+
+def test_mlfq_slices_stop_at_boost():
+    # Boost anında çalışan dilim kesilir; hiçbir dilim boost sınırını aşmaz
+    table = ProcessTable(np.array(['A', 'B', 'C']), np.array([0, 0, 0]), np.array([100, 100, 100]),
+                         np.array([1, 1, 1]))
+    timeline, result = Scheduler().mlfq(table, quanta=(2, 4, 50), boost=20)
+    for start, end in zip(timeline.starts, timeline.ends):
+        assert start // 20 == (end - 1) // 20
+    # Her boost'tan sonra bekleyen süreçler de çalışır
+    owners = {timeline.label(owner) for start, owner in zip(timeline.starts, timeline.owners) if 20 <= start < 40}
+    assert owners == {'A', 'B', 'C'}
+    assert result.completion.tolist() == [294, 298, 300]
+
+def _workloads():
+    # Küçük ve orta boy, boşluklu ve yoğun iş yükleri
+    return [generate_workload(n, seed, load, 6) for n, seed, load in ((1, 0, 0.5), (50, 1, 0.6), (300, 2, 1.2))]
+
+@pytest.mark.parametrize('method, params', [
+    ('mlfq', {}),
+    ('mlfq', {'quanta': (1, 3), 'boost': 7}),
+    ('cfs', {}),
+    ('cfs', {'latency': 5, 'min_granularity': 1}),
+    ('priority_preemptive', {'aging': 5}),
+    ('priority_non_preemptive', {'aging': 5}),
+])
+@pytest.mark.parametrize('switch_cost', [0, 2])
+def test_every_process_completes(method, params, switch_cost):
+    for table in _workloads():
+        timeline, result = getattr(Scheduler(switch_cost), method)(table, **params)
+        assert (result.remaining == 0).all()
+        assert (result.completion - result.arrival >= result.burst).all()
+        assert (result.start >= result.arrival).all()
+        assert timeline.busy_time == int(table.burst.sum())
+
+@pytest.mark.parametrize('quantum', [1, 4])
+def test_single_level_mlfq_matches_round_robin(quantum):
+    for table in _workloads():
+        mlfq_timeline, mlfq = Scheduler().mlfq(table, quanta=(quantum,), boost=None)
+        rr_timeline, rr = Scheduler().round_robin(table, quantum=quantum)
+        assert mlfq.start.tolist() == rr.start.tolist()
+        assert mlfq.completion.tolist() == rr.completion.tolist()
+        assert list(mlfq_timeline) == list(rr_timeline)
+
+@pytest.mark.parametrize('method, params', [
+    ('round_robin', {'quantum': 0}),
+    ('round_robin', {'quantum': -3}),
+    ('mlfq', {'quanta': (4, 0)}),
+    ('mlfq', {'quanta': ()}),
+    ('mlfq', {'boost': -1}),
+    ('cfs', {'latency': 0, 'min_granularity': 0}),
+    ('cfs', {'min_granularity': -1}),
+    ('priority_preemptive', {'aging': -5}),
+    ('priority_non_preemptive', {'aging': -5}),
+])
+def test_invalid_parameters_raise(method, params):
+    with pytest.raises(ValueError):
+        getattr(Scheduler(), method)(_workloads()[1], **params)
+
+def test_invalid_quantum_raises_in_other_engines():
+    with pytest.raises(ValueError):
+        SmpScheduler(2).round_robin(_workloads()[1], quantum=0)
+    with pytest.raises(ValueError):
+        list(StreamScheduler().stream('round_robin', [], quantum=0))
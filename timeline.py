@@ -0,0 +1,142 @@
+from array import array
+import numpy as np
+
+IDLE = -1
+SWITCH = -2
+TIMELINE_WRITE_BATCH = 1 << 16
+
+class Timeline:
+    # Zaman çizelgesi metin yerine üç tipli dizi olarak tutulur:
+    # başlangıç, bitiş ve süreç indeksi (IDLE için -1, bağlam değiştirme
+    # maliyeti için SWITCH = -2). Aynı sürecin art arda gelen bitişik
+    # dilimleri tek dilimde birleştirilir. Metin yalnızca yazdırılırken
+    # üretilir.
+    #
+    # Motorların sayaçları da buradadır: her add() çağrısında birkaç tamsayı
+    # güncellenir, böylece istatistikler için çizelgenin yeniden taranması
+    # gerekmez. Birleşen dilim yeni bir dağıtım sayılmaz.
+    def __init__(self, pids=(), slices=None):
+        self.pids = pids
+        self.starts = array('q')
+        self.ends = array('q')
+        self.owners = array('i')
+        # Süreç başına dilim sayısı; çok çekirdekte çekirdekler ortak kullanır
+        self.slices = array('i', bytes(4 * len(pids))) if slices is None else slices
+        self.busy_time = 0
+        self.dispatches = 0
+        self.dispatched = 0  # en az bir kez çalışmış süreç sayısı
+        self.idle_intervals = 0
+        self.idle_time = 0
+        self.switches = 0
+        self.switch_time = 0
+        self.last = IDLE  # en son çalışan süreç
+    
+    def add(self, start, end, owner):
+        # Her geçiş ayrı sayılsın diye SWITCH dilimleri birleştirilmez
+        if self.owners and self.owners[-1] == owner and self.ends[-1] == start and owner != SWITCH:
+            self.ends[-1] = end
+            if owner == IDLE:
+                self.idle_time += end - start
+            else:
+                self.busy_time += end - start
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.owners.append(owner)
+        if owner == IDLE:
+            self.idle_intervals += 1
+            self.idle_time += end - start
+        elif owner == SWITCH:
+            self.switches += 1
+            self.switch_time += end - start
+        else:
+            self.last = owner
+            self.busy_time += end - start
+            if not self.slices[owner]:
+                self.dispatched += 1
+            self.slices[owner] += 1
+            self.dispatches += 1
+    
+    @property
+    def preemptions(self):
+        # Bir sürecin son dilimi dışındaki her dilimi kesintiyle bitmiştir
+        return self.dispatches - self.dispatched
+    
+    @property
+    def context_switches(self):
+        return max(self.dispatches - 1, 0)
+    
+    def counters(self):
+        return {
+            'dispatches': self.dispatches,
+            'preemptions': self.preemptions,
+            'context_switches': self.context_switches,
+            'idle_intervals': self.idle_intervals,
+            'idle_time': self.idle_time,
+            'busy_time': self.busy_time,
+            'switch_time': self.switch_time,
+        }
+    
+    def copy(self):
+        # Kontrol noktası için PID'siz, bağımsız kopya
+        other = Timeline.__new__(Timeline)
+        other.__dict__.update(self.__dict__)
+        other.pids = ()
+        for name in ('starts', 'ends', 'owners', 'slices'):
+            column = getattr(self, name)
+            setattr(other, name, array(column.typecode, column))
+        return other
+    
+    def extend(self, pids):
+        # Sonuna süreç eklenmiş tabloyla devam etmek için dilim sayaçlarını büyüt
+        self.slices.frombytes(bytes(4 * (len(pids) - len(self.slices))))
+        self.pids = pids
+    
+    def label(self, owner):
+        if owner == IDLE:
+            return "IDLE"
+        if owner == SWITCH:
+            return "SWITCH"
+        return str(self.pids[owner])
+    
+    def line(self, k):
+        return f"[{self.starts[k]}] - {self.label(self.owners[k])} - [{self.ends[k]}]"
+    
+    def arrays(self):
+        # Kopyasız numpy görünümleri
+        return (np.frombuffer(self.starts, dtype=np.int64),
+                np.frombuffer(self.ends, dtype=np.int64),
+                np.frombuffer(self.owners, dtype=np.int32))
+    
+    def names(self):
+        # Son iki eleman SWITCH ve IDLE; böylece negatif owner doğrudan indekslenir
+        names = self.pids.tolist() if hasattr(self.pids, 'tolist') else list(self.pids)
+        names.append("SWITCH")
+        names.append("IDLE")
+        return names
+    
+    def render(self, begin=0, end=None, names=None):
+        # [begin, end) aralığındaki dilimler için satır sonlu tek bir metin
+        if names is None:
+            names = self.names()
+        return "".join([f"[{s}] - {names[k]} - [{e}]\n" for s, k, e in
+                        zip(self.starts[begin:end].tolist(), self.owners[begin:end].tolist(),
+                            self.ends[begin:end].tolist())])
+    
+    def write(self, file, batch=TIMELINE_WRITE_BATCH):
+        # Satırlar parti parti üretilip tek write çağrısıyla yazılır
+        names = self.names()
+        for begin in range(0, len(self), batch):
+            file.write(self.render(begin, begin + batch, names))
+    
+    def __len__(self):
+        return len(self.owners)
+    
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self.line(i) for i in range(len(self))[k]]
+        return self.line(range(len(self))[k])
+    
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self.line(k)
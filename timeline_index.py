@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+import numpy as np
+from timeline import IDLE, SWITCH
+
+# İkili zaman çizelgesi dizini (.idx) düzeni iş yükü dosyasıyla aynıdır:
+#   8 bayt sihirli değer, 4 bayt başlık uzunluğu, JSON başlık, ardından 64
+#   bayta hizalanmış sütunlar. Sütunlar:
+#   starts, ends, owners   tüm dilimler, çekirdek çekirdek ve zaman sırasıyla
+#   core_offsets           çekirdek k'nin dilimleri [core_offsets[k], core_offsets[k + 1])
+#   by_pid, pid_offsets    süreç başına dilim indeksleri (CSR): süreç j'nin
+#                          dilimleri by_pid[pid_offsets[j]:pid_offsets[j + 1]]
+#   names                  süreç indeksi -> PID
+#   sorted_names, sorted_owners  PID'den süreç indeksine ikili arama için
+# Bir çekirdeğin dilimleri örtüşmediğinden hem başlangıçları hem bitişleri
+# sıralıdır; zaman sorguları searchsorted ile yapılır. Dosya np.memmap ile
+# açıldığından yeniden açmak anlıktır ve sorgular yalnızca dokundukları
+# sayfaları okur.
+TIMELINE_INDEX_MAGIC = b'CPUTX\x00\x01\x00'
+TIMELINE_INDEX_SUFFIX = '.idx'
+_ALIGN = 64
+_HEADER_SPACE = _ALIGN * 16
+_COLUMNS = (('starts', '<i8'), ('ends', '<i8'), ('owners', '<i4'), ('core_offsets', '<i8'), ('by_pid', '<i8'),
+            ('pid_offsets', '<i8'), ('names', None), ('sorted_names', None), ('sorted_owners', '<i4'))
+
+TimelineSlice = namedtuple('TimelineSlice', 'core start end pid')
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def _index_columns(starts, ends, owners, core_offsets, names):
+    # Süreç başına dizin: dilimler süreç ve başlangıca göre sıralanır
+    names = np.asarray(names, dtype=str)
+    busy = np.flatnonzero(owners >= 0)
+    by_pid = busy[np.lexsort((starts[busy], owners[busy]))].astype(np.int64)
+    counts = np.bincount(owners[busy], minlength=len(names))
+    sorted_owners = np.argsort(names, kind='stable').astype(np.int32)
+    return {
+        'starts': starts,
+        'ends': ends,
+        'owners': owners,
+        'core_offsets': np.asarray(core_offsets, dtype=np.int64),
+        'by_pid': by_pid,
+        'pid_offsets': np.concatenate(([0], np.cumsum(counts, dtype=np.int64))),
+        'names': names,
+        'sorted_names': names[sorted_owners],
+        'sorted_owners': sorted_owners,
+    }
+
+def index_timeline(timeline):
+    # Timeline ya da SmpTimeline'dan bellekte bir dizin
+    cores = getattr(timeline, 'cores', [timeline])
+    columns = [core.arrays() for core in cores]
+    core_offsets = np.concatenate(([0], np.cumsum([len(core) for core in cores])))
+    starts, ends, owners = (np.concatenate([part[k] for part in columns]) for k in range(3))
+    pids = timeline.pids.tolist() if hasattr(timeline.pids, 'tolist') else list(timeline.pids)
+    return TimelineIndex(_index_columns(starts, ends, owners, core_offsets, pids))
+
+def index_timeline_text(filename):
+    # Daha önce yazılmış bir _timeline.txt dosyasından dizin. PID'ler ilk
+    # göründükleri sırayla numaralanır.
+    starts, ends, owners = [], [], []
+    core_offsets = [0]
+    ids = {'IDLE': IDLE, 'SWITCH': SWITCH}
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('==='):
+                # "=== CPU k ===" yeni bir çekirdeğin başlangıcı
+                if starts:
+                    core_offsets.append(len(starts))
+                continue
+            start, rest = line.split(' - ', 1)
+            label, end = rest.rsplit(' - ', 1)
+            starts.append(int(start.strip('[]')))
+            ends.append(int(end.strip('[]')))
+            owners.append(ids.setdefault(label, len(ids) - 2))
+    core_offsets.append(len(starts))
+    names = [label for label in ids if label not in ('IDLE', 'SWITCH')]
+    return TimelineIndex(_index_columns(np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64),
+                                        np.array(owners, dtype=np.int32), core_offsets, names))
+
+def save_timeline_index(timeline, filename):
+    # Timeline, SmpTimeline ya da TimelineIndex'i dosyaya yazar. Yarım dosya
+    # kalmaması için önce geçici dosyaya yazılır; hata olursa None döner.
+    try:
+        index = timeline if isinstance(timeline, TimelineIndex) else index_timeline(timeline)
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        pid_width = max(index.names.dtype.itemsize // 4, 1)
+        header = {'version': 1, 'slices': len(index), 'cores': index.cores, 'pids': len(index.names),
+                  'columns': []}
+        offset = _HEADER_SPACE
+        for name, dtype in _COLUMNS:
+            dtype = dtype or f'<U{pid_width}'
+            length = len(getattr(index, name))
+            header['columns'].append({'name': name, 'dtype': dtype, 'offset': offset, 'length': length})
+            offset = _aligned(offset + np.dtype(dtype).itemsize * length)
+        raw = json.dumps(header).encode()
+        if 12 + len(raw) > _HEADER_SPACE:
+            raise ValueError("timeline index header too large")
+        
+        temp_path = filename + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(TIMELINE_INDEX_MAGIC)
+            f.write(len(raw).to_bytes(4, 'little'))
+            f.write(raw)
+            for column in header['columns']:
+                f.seek(column['offset'])
+                f.write(np.ascontiguousarray(getattr(index, column['name']), dtype=column['dtype']).tobytes())
+            f.truncate(_aligned(f.tell()))
+        os.replace(temp_path, filename)
+        print(f"Timeline index saved: {filename}")
+        return filename
+    except Exception as e:
+        print(f"Error saving timeline index: {e}")
+        return None
+
+def load_timeline_index(filename):
+    # Sütunlar salt okunur np.memmap görünümleridir
+    with open(filename, 'rb') as f:
+        if f.read(len(TIMELINE_INDEX_MAGIC)) != TIMELINE_INDEX_MAGIC:
+            raise ValueError(f"'{filename}' is not a timeline index file")
+        header = json.loads(f.read(int.from_bytes(f.read(4), 'little')))
+    
+    columns = {}
+    for column in header['columns']:
+        if column['length'] == 0:
+            columns[column['name']] = np.zeros(0, dtype=column['dtype'])
+        else:
+            columns[column['name']] = np.memmap(filename, dtype=column['dtype'], mode='r',
+                                                offset=column['offset'], shape=(column['length'],))
+    return TimelineIndex(columns)
+
+class TimelineIndex:
+    # Zaman noktası, zaman aralığı ve PID sorguları. Sorgular dilim
+    # indeksleri döndürür; slices() bunları TimelineSlice kayıtlarına,
+    # lines() zaman çizelgesi satırlarına çevirir.
+    def __init__(self, columns):
+        for name, _ in _COLUMNS:
+            setattr(self, name, columns[name])
+    
+    @property
+    def cores(self):
+        return len(self.core_offsets) - 1
+    
+    @property
+    def horizon(self):
+        # En geç biten dilimin sonu
+        last = self.core_offsets[1:] - 1
+        last = last[self.core_offsets[1:] > self.core_offsets[:-1]]
+        return int(self.ends[last].max(initial=0))
+    
+    def _segments(self):
+        for k in range(self.cores):
+            yield k, int(self.core_offsets[k]), int(self.core_offsets[k + 1])
+    
+    def at(self, t):
+        # t anında her çekirdekte süren dilim (IDLE ve SWITCH dahil)
+        found = []
+        for _, begin, end in self._segments():
+            k = begin + int(np.searchsorted(self.starts[begin:end], t, side='right')) - 1
+            if k >= begin and self.ends[k] > t:
+                found.append(k)
+        return np.array(found, dtype=np.int64)
+    
+    def between(self, start, end):
+        # [start, end) ile örtüşen dilimler, çekirdek çekirdek zaman sırasıyla
+        parts = []
+        for _, begin, stop in self._segments():
+            low = begin + int(np.searchsorted(self.ends[begin:stop], start, side='right'))
+            high = begin + int(np.searchsorted(self.starts[begin:stop], end, side='left'))
+            parts.append(np.arange(low, max(low, high), dtype=np.int64))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+    
+    def owner(self, pid):
+        # PID'nin süreç indeksi; bulunamazsa None
+        k = int(np.searchsorted(self.sorted_names, pid))
+        if k < len(self.sorted_names) and self.sorted_names[k] == pid:
+            return int(self.sorted_owners[k])
+        return None
+    
+    def of(self, pid):
+        # Sürecin tüm dilimleri başlangıç sırasıyla
+        owner = self.owner(pid)
+        if owner is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.asarray(self.by_pid[self.pid_offsets[owner]:self.pid_offsets[owner + 1]])
+    
+    def label(self, owner):
+        if owner == IDLE:
+            return "IDLE"
+        if owner == SWITCH:
+            return "SWITCH"
+        return str(self.names[owner])
+    
+    def slices(self, indices):
+        indices = np.asarray(indices, dtype=np.int64)
+        cores = np.searchsorted(self.core_offsets, indices, side='right') - 1
+        return [TimelineSlice(int(core), int(self.starts[k]), int(self.ends[k]), self.label(int(self.owners[k])))
+                for core, k in zip(cores.tolist(), indices.tolist())]
+    
+    def lines(self, indices):
+        # Çok çekirdekte satırın başına çekirdek numarası eklenir
+        prefix = self.cores > 1
+        return [(f"CPU {s.core}: " if prefix else "") + f"[{s.start}] - {s.pid} - [{s.end}]"
+                for s in self.slices(indices)]
+    
+    def __len__(self):
+        return len(self.starts)
+
+def _open(path):
+    # .idx doğrudan açılır; .txt verilirse yanındaki .idx, o da yoksa metin ayrıştırılır
+    if path.endswith(TIMELINE_INDEX_SUFFIX):
+        return load_timeline_index(path)
+    index_path = os.path.splitext(path)[0] + TIMELINE_INDEX_SUFFIX
+    if os.path.exists(index_path):
+        return load_timeline_index(index_path)
+    return index_timeline_text(path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Query a saved timeline by time point, time range or PID without re-reading the text file.")
+    parser.add_argument('timeline', help="<prefix>_timeline.idx, or a _timeline.txt (its .idx is used if present)")
+    parser.add_argument('--at', type=int, default=None, help="slices running at this time")
+    parser.add_argument('--range', type=int, nargs=2, default=None, metavar=('START', 'END'),
+                        help="slices overlapping [START, END)")
+    parser.add_argument('--pid', default=None, help="all slices of this process")
+    parser.add_argument('-n', '--limit', type=int, default=100, help="print at most this many slices (default: 100)")
+    parser.add_argument('--build', action='store_true',
+                        help="write the .idx next to the given _timeline.txt and exit")
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.build:
+            if args.timeline.endswith(TIMELINE_INDEX_SUFFIX):
+                parser.error("--build needs a _timeline.txt file")
+            target = os.path.splitext(args.timeline)[0] + TIMELINE_INDEX_SUFFIX
+            return 0 if save_timeline_index(index_timeline_text(args.timeline), target) else 1
+        index = _open(args.timeline)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    
+    if args.at is not None:
+        found = index.at(args.at)
+    elif args.range is not None:
+        found = index.between(*args.range)
+    elif args.pid is not None:
+        if index.owner(args.pid) is None:
+            print(f"ERROR: unknown PID {args.pid}", file=sys.stderr)
+            return 1
+        found = index.of(args.pid)
+    else:
+        print(f"{len(index)} slices, {len(index.names)} processes, {index.cores} core(s), horizon {index.horizon}")
+        return 0
+    
+    for line in index.lines(found[:args.limit]):
+        print(line)
+    if len(found) > args.limit:
+        print(f"... {len(found) - args.limit} more")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
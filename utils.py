@@ -1,229 +1,557 @@
 import csv
+import datetime
+import heapq
 import os
+import numpy as np
+from process import PRIORITY_NUMS, ProcessTable
+from windows import windowed_metrics
 
-def read_csv(filename):
-    processes = []
-    print(f"Reading CSV file: {filename}")
+CSV_CHUNK_SIZE = 1 << 24
+# Varsayılan throughput anları; uzun izler için calculate_statistics'e başkaları verilebilir
+THROUGHPUT_TIME_POINTS = (50, 100, 150, 200)
+_MAX_DIGITS = 18
+_POW10 = 10 ** np.arange(_MAX_DIGITS + 1, dtype=np.int64)
+_PREFIX_MASKS = np.tri(256, 255, -1, dtype=np.uint8)
+_ROW_SEPARATORS = np.frombuffer(b',,,\n', dtype=np.uint8)
+
+def _priority_key(name):
+    # Küçük harfli etiketin ilk 8 baytını sayı olarak temsil et
+    return int.from_bytes(name.encode().ljust(8, b'\0'), 'little')
+
+_PRIORITY_KEYS = {_priority_key(name): num for name, num in PRIORITY_NUMS.items()}
+
+def _field_mask(lengths, width):
+    # mask[i, j] = j < lengths[i]; hazır üçgen tablodan satır seçilerek kurulur
+    return _PREFIX_MASKS[np.minimum(lengths, width), :width]
+
+def _fields(windows, starts, lengths, width):
+    # Her alanın ilk `width` baytını (n, width) matrisine topla; alan
+    # dışında kalan baytlar sıfırlanır.
+    raw = windows[starts, :width]
+    raw *= _field_mask(lengths, width)
+    return raw
+
+def _parse_ints(windows, starts, ends):
+    # Ondalık alanları Horner yöntemiyle sütun sütun vektörel çöz.
+    # Rakam dışı bir bayt görülürse None döner.
+    lengths = ends - starts
+    if len(lengths) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if lengths.min() < 1 or lengths.max() > _MAX_DIGITS:
+        return None
+    width = int(lengths.max())
+    mask = _field_mask(lengths, width)
+    digits = windows[starts, :width] - np.uint8(48)
+    if ((digits > 9) & mask).any():
+        return None
+    digits *= mask
+    # Sola yaslı okunan değer 10^(width - uzunluk) kadar büyüktür
+    values = np.zeros(len(starts), dtype=np.int64)
+    for column in np.ascontiguousarray(digits.T):
+        values *= 10
+        values += column
+    return values // _POW10[width - lengths]
+
+def _parse_chunk_fast(chunk):
+    # Her satırı tam 3 virgül, boşluksuz ASCII olan bloklar için numpy ayrıştırıcı.
+    # Uygun olmayan blokta None döner ve satır satır ayrıştırıcıya düşülür.
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    if len(buf) == 0 or buf.max() >= 128:
+        return None
+    # Alanlarda '0' altında bayt yoksa ayraçlar tam olarak ',' ',' ',' '\n' dizisidir
+    separators = np.flatnonzero(buf < 48)
+    if len(separators) % 4:
+        return None
+    separators = separators.reshape(-1, 4)
+    if not (buf[separators] == _ROW_SEPARATORS).all():
+        return None
+    commas = separators[:, :3]
+    newlines = separators[:, 3]
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
     
-    try:
-        # Dosyayı satır satır oku
-        with open(filename, 'r') as file:
-            lines = file.readlines()
+    # Her bayttan başlayan pencereler; alanlar tek bir gather ile alınır
+    pid_lengths = commas[:, 0] - line_starts
+    width = max(int(pid_lengths.max()), _MAX_DIGITS)
+    if width > 255:
+        return None
+    padded = np.concatenate((buf, np.zeros(width, dtype=np.uint8)))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, width)
+    
+    arrival = _parse_ints(windows, commas[:, 0] + 1, commas[:, 1])
+    burst = _parse_ints(windows, commas[:, 1] + 1, commas[:, 2])
+    if arrival is None or burst is None:
+        return None
+    
+    # Priority: küçük harfli ilk 8 bayt high/low anahtarıyla eşleşmezse normal
+    prio_starts = commas[:, 2] + 1
+    prio = _fields(windows, prio_starts, newlines - prio_starts, 8)
+    prio |= np.uint8(0x20) * (prio > 0)
+    keys = prio.view('<u8').ravel()
+    keys[newlines - prio_starts > 8] = 0
+    priority_num = np.full(len(newlines), PRIORITY_NUMS['normal'], dtype=np.int32)
+    for key, num in _PRIORITY_KEYS.items():
+        priority_num[keys == key] = num
+    
+    # PID'ler ASCII olduğundan baytlar doğrudan UCS-4 kod noktalarıdır
+    pid_width = max(int(pid_lengths.max()), 1)
+    raw = _fields(windows, line_starts, pid_lengths, pid_width)
+    pids = raw.astype(np.uint32).view(f'U{pid_width}').ravel()
+    return ProcessTable(pids, arrival, burst, priority_num)
+
+def _parse_chunk_slow(chunk):
+    # Satır satır ayrıştırma; geçersiz satırlar sayılır ve atlanır
+    pids, arrival, burst, priority_num = [], [], [], []
+    errors = 0
+    for line in chunk.decode('utf-8', errors='replace').split('\n'):
+        line = line.strip()
+        if not line:  # Boş satırları atla
+            continue
+        parts = line.split(',')
+        if len(parts) < 4:
+            errors += 1
+            continue
+        try:
+            a = int(parts[1])
+            b = int(parts[2])
+        except ValueError:
+            errors += 1
+            continue
+        pids.append(parts[0].strip())
+        arrival.append(a)
+        burst.append(b)
+        priority_num.append(PRIORITY_NUMS.get(parts[3].strip().lower(), PRIORITY_NUMS['normal']))
+    return ProcessTable(np.array(pids, dtype=str), arrival, burst, priority_num), errors
+
+class CsvReader:
+    # Dosyayı sabit boyutlu bloklar halinde okur ve her blok için bir
+    # ProcessTable üretir; dosyanın tamamı hiçbir zaman belleğe alınmaz.
+    def __init__(self, filename, chunk_size=CSV_CHUNK_SIZE):
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.errors = 0
+    
+    def __iter__(self):
+        self.rows = 0
+        self.errors = 0
+        with open(self.filename, 'rb') as file:
+            # Başlık satırını atla; geri sarılmaz, böylece stdin gibi akışlar da okunur
+            first_line = file.readline()
+            if b'process_id' in first_line.lower():
+                first_line = b''
             
-        print(f"Total lines in file: {len(lines)}")
-        
-        # İlk satır başlık mı kontrol et
-        first_line = lines[0].strip()
-        print(f"First line: '{first_line}'")
-        
-        # Başlık satırını atla
-        start_index = 0
-        if "Process_ID" in first_line or "process_id" in first_line.lower():
-            start_index = 1
-            print("Header detected, skipping first line")
-        
-        # Her satırı işle
-        for i in range(start_index, len(lines)):
-            line = lines[i].strip()
-            if not line:  # Boş satırları atla
-                continue
-                
-            # Virgülle ayır
-            parts = line.split(',')
-            if len(parts) >= 4:
-                pid = parts[0].strip()
+            while True:
+                chunk = first_line + file.read(self.chunk_size)
+                first_line = b''
+                if not chunk:
+                    break
+                if not chunk.endswith(b'\n'):
+                    chunk += file.readline()
+                if not chunk.endswith(b'\n'):
+                    chunk += b'\n'
+                if b'\r' in chunk:
+                    chunk = chunk.replace(b'\r', b'')
                 
-                try:
-                    arrival = int(parts[1].strip())
-                    burst = int(parts[2].strip())
-                    priority = parts[3].strip().lower()
-                    
-                    # Priority kontrolü
-                    if priority not in ['high', 'normal', 'low']:
-                        priority = 'normal'
-                    
-                    from process import Process
-                    process = Process(pid, arrival, burst, priority)
-                    processes.append(process)
-                    
-                except ValueError as e:
-                    print(f"Error parsing line {i+1}: {line}")
-                    print(f"Error: {e}")
-                    continue
-        
-        print(f"Successfully loaded {len(processes)} processes")
-        
+                table = _parse_chunk_fast(chunk)
+                if table is None:
+                    table, errors = _parse_chunk_slow(chunk)
+                    self.errors += errors
+                self.rows += len(table)
+                if len(table):
+                    yield table
+    
+    def read_table(self):
+        return ProcessTable.concat(list(self))
+
+def read_csv(filename):
+    reader = CsvReader(filename)
+    try:
+        processes = reader.read_table()
     except FileNotFoundError:
         print(f"ERROR: File '{filename}' not found!")
         print("Make sure the file exists in the data folder")
+        return ProcessTable.concat([])
     except Exception as e:
         print(f"ERROR reading CSV: {str(e)}")
+        return ProcessTable.concat([])
     
+    print(f"Loaded {len(processes)} processes from {filename} ({reader.errors} invalid rows skipped)")
     return processes
 
 def save_timeline(timeline, filename):
     try:
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         with open(filename, 'w') as f:
-            for line in timeline:
-                f.write(line + "\n")
+            # Timeline satırları toplu yazar; düz listeler de kabul edilir
+            if hasattr(timeline, 'write'):
+                timeline.write(f)
+            else:
+                for line in timeline:
+                    f.write(line + "\n")
         print(f"Timeline saved: {filename}")
     except Exception as e:
         print(f"Error saving timeline: {e}")
 
-def calculate_statistics(processes, algo_name, case_name):
+def _result_columns(processes):
+    # ProcessTable sütunlarını doğrudan, Process listesini bir kez dizilere çevirerek kullan
+    if isinstance(processes, ProcessTable):
+        return processes.arrival, processes.burst, processes.start, processes.completion, processes.slices
+    n = len(processes)
+    arrival = np.fromiter((p.arrival for p in processes), dtype=np.int64, count=n)
+    burst = np.fromiter((p.burst for p in processes), dtype=np.int64, count=n)
+    start = np.fromiter((p.start_time for p in processes), dtype=np.int64, count=n)
+    completion = np.fromiter((p.completion for p in processes), dtype=np.int64, count=n)
+    # Process nesneleri dilim sayısı taşımaz; başlamış her süreç tek dilim
+    slices = (start >= 0).astype(np.int32)
+    return arrival, burst, start, completion, slices
+
+def _histogram(values):
+    # Değer -> adet; birleştirilebilir ve yüzdelikler tam olarak hesaplanabilir
+    return np.unique(values, return_counts=True)
+    
+def _merge_histograms(a, b):
+    values, inverse = np.unique(np.concatenate((a[0], b[0])), return_inverse=True)
+    counts = np.zeros(len(values), dtype=np.int64)
+    np.add.at(counts, inverse, np.concatenate((a[1], b[1])))
+    return values, counts
+    
+def _hist_percentiles(histogram, percentiles):
+    # np.percentile'ın doğrusal yöntemiyle aynı sonuç, sıralı değer-adet çiftlerinden
+    values, counts = histogram
+    values = values.astype(np.float64)
+    cumulative = np.cumsum(counts)
+    n = int(cumulative[-1])
+    index = np.asarray(percentiles, dtype=np.float64) / 100 * (n - 1)
+    below = np.floor(index)
+    gamma = index - below
+    a = values[np.searchsorted(cumulative, below, side='right')]
+    b = values[np.searchsorted(cumulative, np.minimum(below + 1, n - 1), side='right')]
+    diff = b - a
+    return np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+
+def aggregate_statistics(processes, rows=None, time_points=THROUGHPUT_TIME_POINTS):
+    # Süreç bazlı metriklerin birleştirilebilir özeti (toplamlar, en
+    # büyükler, histogramlar). rows verilirse yalnızca o satırlar sayılır;
+    # artımlı çalışmada önceki çalıştırmanın özetiyle merge_statistics ile
+    # birleştirilir.
+    arrival, burst, start, completion, slices = _result_columns(processes)
+    if rows is not None:
+        arrival, burst, start, completion, slices = (column[rows] for column in
+                                                     (arrival, burst, start, completion, slices))
+    arrival = arrival.astype(np.int64)
+    done = completion > 0
+    
+    # Yanıt süresi ilk çalışmaya kadar, bekleme süresi hazır kuyruğunda
+    # geçen toplam süredir (turnaround - burst); kesmesiz algoritmalarda
+    # ikisi aynıdır. Bitmeyen süreçler 0 sayılır.
+    response = np.where(done, start - arrival, 0)
+    turnaround = np.where(done, completion - arrival, 0)
+    waiting = np.where(done, np.maximum(turnaround - burst, 0), 0)
+    
+    # Throughput: sıralı bitiş zamanlarında her T için <= T olanların sayısı
+    sorted_completion = np.sort(completion)
+    counts = np.searchsorted(sorted_completion, np.asarray(time_points), side='right')
+    return {
+        'count': len(arrival),
+        'total_burst': int(burst.sum(dtype=np.int64)),
+        'makespan': int(sorted_completion[-1]) if len(arrival) else 0,
+        'throughput': {t: int(c) for t, c in zip(time_points, counts)},
+        'dispatches': int(slices.sum(dtype=np.int64)),
+        'dispatched': int(np.count_nonzero(slices)),
+        'waiting': _histogram(waiting),
+        'turnaround': _histogram(turnaround),
+        'response': _histogram(response),
+    }
+
+def merge_statistics(a, b):
+    return {
+        'count': a['count'] + b['count'],
+        'total_burst': a['total_burst'] + b['total_burst'],
+        'makespan': max(a['makespan'], b['makespan']),
+        'throughput': {t: a['throughput'][t] + count for t, count in b['throughput'].items()},
+        'dispatches': a['dispatches'] + b['dispatches'],
+        'dispatched': a['dispatched'] + b['dispatched'],
+        'waiting': _merge_histograms(a['waiting'], b['waiting']),
+        'turnaround': _merge_histograms(a['turnaround'], b['turnaround']),
+        'response': _merge_histograms(a['response'], b['response']),
+    }
+
+def calculate_statistics(processes, algo_name, case_name, time_points=THROUGHPUT_TIME_POINTS,
+                         percentiles=(50, 95, 99), timeline=None, base=None, window=None, window_edges=None):
+    # base: (önceki özet, satırlar). Verilirse yalnızca bu satırlar yeniden
+    # özetlenir ve önceki özetle birleştirilir; diğer satırların sonuçları
+    # değişmemiş kabul edilir. window (genişlik) ya da window_edges
+    # (sınırlar) zaman pencerelerini belirler; verilmezse süre on eşit
+    # pencereye bölünür.
     if not processes:
         print("No processes to calculate statistics")
         return {}
     
     print(f"Calculating statistics for {algo_name}...")
     
-    # Her süreç için zamanları hesapla
-    for p in processes:
-        p.calculate_times()
+    if base is None:
+        summary = aggregate_statistics(processes, time_points=time_points)
+    else:
+        summary = merge_statistics(base[0], aggregate_statistics(processes, base[1], time_points))
+    n = summary['count']
+    throughput = summary['throughput']
     
-    # Bekleme süreleri
-    waiting_times = [p.waiting for p in processes]
-    avg_waiting = sum(waiting_times) / len(waiting_times)
-    max_waiting = max(waiting_times)
+    # CPU Verimliliği (çok çekirdekte tüm çekirdeklerin toplam kapasitesine göre)
+    cores = len(timeline.cores) if hasattr(timeline, 'cores') else 1
+    total_burst = summary['total_burst']
+    total_time = summary['makespan']
+    cpu_efficiency = (total_burst / (total_time * cores)) * 100 if total_time > 0 else 0
     
-    # Turnaround süreleri
-    turnaround_times = [p.turnaround for p in processes]
-    avg_turnaround = sum(turnaround_times) / len(turnaround_times)
-    max_turnaround = max(turnaround_times)
+    # Çekirdek başına kullanım ve yük dengesizliği (en yoğun çekirdeğin
+    # ortalamadan yüzde sapması)
+    if cores > 1:
+        core_busy = [core.busy_time for core in timeline.cores]
+        migrations = timeline.migrations
+    else:
+        core_busy = [total_burst]
+        migrations = 0
+    core_utilization = [round(b / total_time * 100, 2) if total_time > 0 else 0 for b in core_busy]
+    mean_busy = sum(core_busy) / cores
+    load_imbalance = round((max(core_busy) - mean_busy) / mean_busy * 100, 2) if mean_busy > 0 else 0
     
-    # Throughput (T=50,100,150,200 için)
-    throughput = {}
-    time_points = [50, 100, 150, 200]
-    for t in time_points:
-        completed = sum(1 for p in processes if p.completion <= t)
-        throughput[t] = completed
+    # Bağlam değiştirme: motorun saydığı gerçek dağıtımlardan. Art arda aynı
+    # sürece verilen dilimler birleştiği için tek dağıtım sayılır.
+    dispatches = summary['dispatches']
+    context_switches = timeline.context_switches if timeline is not None else max(dispatches - 1, 0)
+    preemptions = dispatches - summary['dispatched']
     
-    # CPU Verimliliği
-    total_burst = sum(p.burst for p in processes)
-    total_time = max(p.completion for p in processes)
-    cpu_efficiency = (total_burst / total_time) * 100 if total_time > 0 else 0
+    # Boşta kalma aralıkları ve geçiş maliyeti çizelge oluşturulurken
+    # sayılır; çizelge verilmemişse yalnızca boşta geçen toplam süre (geçişler
+    # dahil) hesaplanabilir.
+    if timeline is not None:
+        idle_intervals = timeline.idle_intervals
+        idle_time = timeline.idle_time
+        switch_time = timeline.switch_time
+    else:
+        idle_intervals = None
+        idle_time = max(total_time - total_burst, 0)
+        switch_time = None
     
-    # Bağlam değiştirme sayısı (basit hesaplama)
-    context_switches = len(processes) - 1
+    def pct(name):
+        return {q: round(float(v), 2) for q, v in zip(percentiles, _hist_percentiles(summary[name], percentiles))}
+    
+    def total(name):
+        values, counts = summary[name]
+        return int(np.dot(values.astype(np.int64), counts))
     
     results = {
         'algorithm': algo_name,
         'case': case_name,
-        'avg_waiting': round(avg_waiting, 2),
-        'max_waiting': max_waiting,
-        'avg_turnaround': round(avg_turnaround, 2),
-        'max_turnaround': max_turnaround,
+        'avg_waiting': round(total('waiting') / n, 2),
+        'max_waiting': int(summary['waiting'][0][-1]),
+        'avg_turnaround': round(total('turnaround') / n, 2),
+        'max_turnaround': int(summary['turnaround'][0][-1]),
+        'avg_response': round(total('response') / n, 2),
+        'max_response': int(summary['response'][0][-1]),
+        'waiting_percentiles': pct('waiting'),
+        'turnaround_percentiles': pct('turnaround'),
+        'response_percentiles': pct('response'),
         'throughput': throughput,
         'cpu_efficiency': round(cpu_efficiency, 2),
         'context_switches': context_switches,
+        'dispatches': dispatches,
+        'preemptions': preemptions,
+        'idle_intervals': idle_intervals,
+        'idle_time': idle_time,
+        'switch_time': switch_time,
+        'cores': cores,
+        'core_utilization': core_utilization,
+        'migrations': migrations,
+        'load_imbalance': load_imbalance,
+        'windows': [w._asdict() for w in windowed_metrics(processes, timeline, window, window_edges)],
         'processes': processes
     }
     
-    print(f"Statistics calculated for {len(processes)} processes")
+    print(f"Statistics calculated for {n} processes")
     return results
 
-def save_results(results, filename):
+def save_results(results, filename, sample=10):
+    # Metin özeti; satırlar listede toplanıp tek seferde yazılır. Tüm
+    # süreçlerin sonuçları için writer.write_process_results kullanılır.
     try:
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w') as f:
-            f.write(f"=== {results['algorithm']} RESULTS ===\n")
-            f.write(f"Case: {results['case']}\n")
-            f.write(f"Number of processes: {len(results['processes'])}\n\n")
-            
-            f.write("a) Waiting Times:\n")
-            f.write("-----------------\n")
-            f.write(f"Average Waiting Time: {results['avg_waiting']}\n")
-            f.write(f"Maximum Waiting Time: {results['max_waiting']}\n\n")
-            
-            f.write("b) Turnaround Times:\n")
-            f.write("--------------------\n")
-            f.write(f"Average Turnaround Time: {results['avg_turnaround']}\n")
-            f.write(f"Maximum Turnaround Time: {results['max_turnaround']}\n\n")
-            
-            f.write("c) Throughput:\n")
-            f.write("--------------\n")
-            for t, count in results['throughput'].items():
-                f.write(f"T={t}: {count} processes completed\n")
-            f.write("\n")
-            
-            f.write("d) CPU Efficiency:\n")
-            f.write("------------------\n")
-            f.write(f"CPU Efficiency: {results['cpu_efficiency']}%\n\n")
-            
-            f.write("e) Context Switches:\n")
-            f.write("--------------------\n")
-            f.write(f"Total Context Switches: {results['context_switches']}\n\n")
-            
-            # İlk 10 süreci göster
-            f.write("Sample Process Details (first 10):\n")
-            f.write("===================================\n")
-            f.write("PID\tArrival\tBurst\tPriority\tStart\tFinish\tWaiting\tTurnaround\n")
-            f.write("-" * 80 + "\n")
-            
-            sorted_procs = sorted(results['processes'], key=lambda x: x.pid)
-            for p in sorted_procs[:10]:
-                f.write(f"{p.pid}\t{p.arrival}\t{p.burst}\t{p.priority}\t"
-                       f"{p.start_time}\t{p.completion}\t{p.waiting}\t{p.turnaround}\n")
-            
-            if len(sorted_procs) > 10:
-                f.write(f"\n... and {len(sorted_procs) - 10} more processes\n")
+        lines = []
+        out = lines.append
+        out(f"=== {results['algorithm']} RESULTS ===\n")
+        out(f"Case: {results['case']}\n")
+        out(f"Number of processes: {len(results['processes'])}\n\n")
         
-        print(f"Results saved: {filename}")
+        out("a) Waiting Times:\n")
+        out("-----------------\n")
+        out(f"Average Waiting Time: {results['avg_waiting']}\n")
+        out(f"Maximum Waiting Time: {results['max_waiting']}\n")
+        if 'avg_response' in results:
+            # Yanıt: ilk çalışmaya kadar geçen süre (kesmesiz algoritmalarda beklemeyle aynı)
+            out(f"Average Response Time: {results['avg_response']}\n")
+        out("\n")
+        
+        out("b) Turnaround Times:\n")
+        out("--------------------\n")
+        out(f"Average Turnaround Time: {results['avg_turnaround']}\n")
+        out(f"Maximum Turnaround Time: {results['max_turnaround']}\n\n")
+        
+        out("c) Throughput:\n")
+        out("--------------\n")
+        for t, count in results['throughput'].items():
+            out(f"T={t}: {count} processes completed\n")
+        out("\n")
+        
+        out("d) CPU Efficiency:\n")
+        out("------------------\n")
+        out(f"CPU Efficiency: {results['cpu_efficiency']}%\n\n")
+        
+        out("e) Context Switches:\n")
+        out("--------------------\n")
+        out(f"Total Context Switches: {results['context_switches']}\n")
+        if 'dispatches' in results:
+            out(f"Dispatches: {results['dispatches']}\n")
+            out(f"Preemptions: {results['preemptions']}\n")
+            if results['idle_intervals'] is not None:
+                out(f"Idle Intervals: {results['idle_intervals']}\n")
+            out(f"Idle Time: {results['idle_time']}\n")
+            if results.get('switch_time'):
+                out(f"Switch Overhead: {results['switch_time']}\n")
+        out("\n")
+        
+        if 'waiting_percentiles' in results:
+            out("f) Percentiles:\n")
+            out("---------------\n")
+            for label, key in (("Waiting", 'waiting_percentiles'),
+                               ("Turnaround", 'turnaround_percentiles'),
+                               ("Response", 'response_percentiles')):
+                values = ", ".join(f"p{q}={v}" for q, v in results[key].items())
+                out(f"{label}: {values}\n")
+            out("\n")
+        
+        if results.get('cores', 1) > 1:
+            out("g) Multi-Core:\n")
+            out("--------------\n")
+            out(f"Cores: {results['cores']}\n")
+            out(f"Migrations: {results['migrations']}\n")
+            out(f"Load Imbalance: {results['load_imbalance']}%\n")
+            for k, utilization in enumerate(results['core_utilization']):
+                out(f"CPU {k} Utilization: {utilization}%\n")
+            out("\n")
+        
+        if results.get('windows'):
+            out("h) Windowed Metrics:\n")
+            out("--------------------\n")
+            out(f"{'Window':<25} {'Arrivals':>9} {'Done':>7} {'Done@End':>9} {'Util%':>7} {'Queue':>8} "
+                f"{'Avg Wait':>9}\n")
+            for w in results['windows']:
+                span = f"[{w['start']}, {w['end']})"
+                utilization = '-' if w['utilization'] is None else w['utilization']
+                queue = '-' if w['queue_length'] is None else w['queue_length']
+                out(f"{span:<25} {w['arrivals']:>9} {w['completed']:>7} {w['completed_total']:>9} "
+                    f"{utilization:>7} {queue:>8} {w['avg_waiting']:>9}\n")
+            out("\n")
+        
+        # PID sırasına göre ilk `sample` süreç; tüm tablo sıralanmaz
+        processes = results['processes']
+        if isinstance(processes, ProcessTable):
+            pids = processes.pids if isinstance(processes.pids, list) else processes.pids.tolist()
+            sample_procs = [processes[i] for i in heapq.nsmallest(sample, range(len(pids)), key=pids.__getitem__)]
+        else:
+            sample_procs = heapq.nsmallest(sample, processes, key=lambda x: x.pid)
+        out(f"Sample Process Details (first {sample}):\n")
+        out("===================================\n")
+        out("PID\tArrival\tBurst\tPriority\tStart\tFinish\tWaiting\tTurnaround\n")
+        out("-" * 80 + "\n")
+        
+        for p in sample_procs:
+            out(f"{p.pid}\t{p.arrival}\t{p.burst}\t{p.priority}\t"
+                f"{p.start_time}\t{p.completion}\t{p.waiting}\t{p.turnaround}\n")
+        
+        if len(processes) > sample:
+            out(f"\n... and {len(processes) - sample} more processes\n")
         
+        with open(filename, 'w') as f:
+            f.write("".join(lines))
+        print(f"Results saved: {filename}")
+    
     except Exception as e:
         print(f"Error saving results: {e}")
 
-def generate_report(all_results, case_name):
+def generate_report(all_results, case_name, report_dir="reports"):
     try:
-        os.makedirs("reports", exist_ok=True)
-        report_file = f"reports/{case_name}_report.txt"
+        os.makedirs(report_dir, exist_ok=True)
+        report_file = f"{report_dir}/{case_name}_report.txt"
         
-        with open(report_file, 'w') as f:
-            f.write(f"=== CPU SCHEDULING ALGORITHMS REPORT ===\n")
-            f.write(f"Case: {case_name}\n")
-            f.write(f"Generated on: 2024\n")
-            f.write("=" * 80 + "\n\n")
-            
-            f.write("PERFORMANCE COMPARISON:\n")
-            f.write("=" * 100 + "\n")
-            f.write(f"{'Algorithm':<25} {'Avg Wait':<12} {'Avg Turn':<12} "
-                   f"{'CPU Eff%':<10} {'Throughput@200':<15}\n")
-            f.write("-" * 100 + "\n")
-            
+        lines = []
+        out = lines.append
+        out(f"=== CPU SCHEDULING ALGORITHMS REPORT ===\n")
+        out(f"Case: {case_name}\n")
+        out(f"Generated on: {datetime.datetime.now():%Y-%m-%d %H:%M:%S}\n")
+        cores = max((result.get('cores', 1) for result in all_results), default=1)
+        if cores > 1:
+            out(f"Cores: {cores}\n")
+        out("=" * 80 + "\n\n")
+        
+        # Throughput sütunu istenen son an içindir (varsayılan 200)
+        point = max(all_results[0]['throughput'], default=None) if all_results else None
+        header = f"Throughput@{point}" if point is not None else "Throughput"
+        width = max(15, len(header) + 1)
+        out("PERFORMANCE COMPARISON:\n")
+        out("=" * 100 + "\n")
+        out(f"{'Algorithm':<25} {'Avg Wait':<12} {'Avg Turn':<12} "
+            f"{'CPU Eff%':<10} {header:<{width}} {'Ctx Switches':<13}\n")
+        out("-" * 100 + "\n")
+        
+        for result in all_results:
+            throughput = result['throughput'].get(point, 0)
+            out(f"{result['algorithm']:<25} "
+                f"{result['avg_waiting']:<12.2f} "
+                f"{result['avg_turnaround']:<12.2f} "
+                f"{result['cpu_efficiency']:<10.2f} "
+                f"{throughput:<{width}} "
+                f"{result['context_switches']:<13}\n")
+        
+        if cores > 1:
+            out("\n\nMULTI-CORE:\n")
+            out("=" * 100 + "\n")
+            out(f"{'Algorithm':<25} {'Migrations':<12} {'Imbalance%':<12} "
+                f"{'Min Util%':<10} {'Max Util%':<10}\n")
+            out("-" * 100 + "\n")
             for result in all_results:
-                throughput_200 = result['throughput'].get(200, 0)
-                f.write(f"{result['algorithm']:<25} "
-                       f"{result['avg_waiting']:<12.2f} "
-                       f"{result['avg_turnaround']:<12.2f} "
-                       f"{result['cpu_efficiency']:<10.2f} "
-                       f"{throughput_200:<15}\n")
+                utilization = result.get('core_utilization') or [0]
+                out(f"{result['algorithm']:<25} "
+                    f"{result.get('migrations', 0):<12} "
+                    f"{result.get('load_imbalance', 0):<12.2f} "
+                    f"{min(utilization):<10.2f} "
+                    f"{max(utilization):<10.2f}\n")
+        
+        out("\n\nANALYSIS:\n")
+        out("=" * 50 + "\n")
+        
+        if all_results:
+            # En iyi performans gösterenleri bul
+            best_waiting = min(all_results, key=lambda x: x['avg_waiting'])
+            best_turnaround = min(all_results, key=lambda x: x['avg_turnaround'])
+            best_efficiency = max(all_results, key=lambda x: x['cpu_efficiency'])
             
-            f.write("\n\nANALYSIS:\n")
-            f.write("=" * 50 + "\n")
+            out("Best Performers:\n")
+            out(f"• Best Average Waiting Time: {best_waiting['algorithm']} "
+                f"({best_waiting['avg_waiting']:.2f} time units)\n")
+            out(f"• Best Average Turnaround Time: {best_turnaround['algorithm']} "
+                f"({best_turnaround['avg_turnaround']:.2f} time units)\n")
+            out(f"• Highest CPU Efficiency: {best_efficiency['algorithm']} "
+                f"({best_efficiency['cpu_efficiency']:.2f}%)\n\n")
             
-            if all_results:
-                # En iyi performans gösterenleri bul
-                best_waiting = min(all_results, key=lambda x: x['avg_waiting'])
-                best_turnaround = min(all_results, key=lambda x: x['avg_turnaround'])
-                best_efficiency = max(all_results, key=lambda x: x['cpu_efficiency'])
-                
-                f.write("Best Performers:\n")
-                f.write(f"• Best Average Waiting Time: {best_waiting['algorithm']} "
-                       f"({best_waiting['avg_waiting']:.2f} time units)\n")
-                f.write(f"• Best Average Turnaround Time: {best_turnaround['algorithm']} "
-                       f"({best_turnaround['avg_turnaround']:.2f} time units)\n")
-                f.write(f"• Highest CPU Efficiency: {best_efficiency['algorithm']} "
-                       f"({best_efficiency['cpu_efficiency']:.2f}%)\n\n")
-                
-                f.write("Conclusion:\n")
-                f.write("• FCFS is simple but has higher waiting times\n")
-                f.write("• SJF algorithms provide better response times\n")
-                f.write("• Round Robin ensures fairness\n")
-                f.write("• Priority scheduling is useful for real-time systems\n")
+            out("Conclusion:\n")
+            out("• FCFS is simple but has higher waiting times\n")
+            out("• SJF algorithms provide better response times\n")
+            out("• Round Robin ensures fairness\n")
+            out("• Priority scheduling is useful for real-time systems\n")
         
+        with open(report_file, 'w') as f:
+            f.write("".join(lines))
         print(f"Report generated: {report_file}")
-        
+    
     except Exception as e:
         print(f"Error generating report: {e}")
\ No newline at end of file
@@ -0,0 +1,201 @@
+import bisect
+from collections import namedtuple
+import numpy as np
+from process import ProcessTable
+
+# Pencere belirtilmezse zaman ekseni bu kadar eşit parçaya bölünür
+DEFAULT_WINDOW_COUNT = 10
+
+# [start, end) aralığının metrikleri. completed_total pencere sonuna kadar
+# bitenlerin sayısıdır (istenen anlardaki throughput). queue_length hazır
+# kuyruğunun zaman ortalamasıdır (sistemdeki süreçler - çalışanlar);
+# avg_waiting pencerede biten süreçlerin ortalama beklemesidir (turnaround - burst).
+Window = namedtuple('Window', 'start end arrivals completed completed_total throughput utilization '
+                              'queue_length avg_waiting')
+
+def _window(start, end, arrivals, completed, completed_total, busy, area, wait_sum, cores):
+    # Tüm toplamlar tamsayıdır; akış ve toplu hesap aynı sonucu verir
+    start, end, completed = int(start), int(end), int(completed)
+    length = end - start
+    return Window(start, end, int(arrivals), completed, int(completed_total),
+                  round(completed / length, 4),
+                  round(busy * 100 / (length * cores), 2) if busy is not None else None,
+                  round((area - busy) / length, 2) if busy is not None else None,
+                  round(wait_sum / completed, 2) if completed else 0)
+
+def _busy_until(timeline, points):
+    # Her t için [0, t) aralığındaki toplam meşgul (süreç çalıştıran) süre.
+    # Dilimler sıralı ve örtüşmesiz olduğundan t'den önce başlayanların
+    # toplamından, son dilimin t'yi aşan kısmı düşülür.
+    starts, ends, owners = timeline.arrays()
+    if not len(starts):
+        return np.zeros(len(points), dtype=np.int64)
+    lengths = np.where(owners >= 0, ends - starts, 0)
+    prefix = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+    k = np.searchsorted(starts, points, side='left')
+    last = np.maximum(k - 1, 0)
+    overshoot = np.where((k > 0) & (owners[last] >= 0), np.maximum(ends[last] - points, 0), 0)
+    return prefix[k] - overshoot
+
+def _cumulative_area(sorted_times, prefix, points):
+    # F(t) = sum((t - x) for x < t): olay sayısının [0, t) üzerindeki integrali
+    k = np.searchsorted(sorted_times, points, side='left')
+    return k * points - prefix[k]
+
+def window_edges(horizon, width=None, edges=None):
+    # Kullanıcının sınırları ya da 0'dan horizon'u içeren son pencereye kadar sabit genişlik
+    if edges is not None:
+        edges = np.asarray(sorted(set(int(e) for e in edges)), dtype=np.int64)
+        if len(edges) < 2:
+            raise ValueError("at least two window edges are needed")
+        return edges
+    if width is None:
+        width = max(-(-(horizon + 1) // DEFAULT_WINDOW_COUNT), 1)
+    if width <= 0:
+        raise ValueError("window width must be positive")
+    return np.arange(0, (horizon // width + 2) * width, width, dtype=np.int64)
+
+def windowed_metrics(processes, timeline=None, width=None, edges=None):
+    # Pencere başına metrikleri tek geçişte hesaplar: varış ve bitiş olayları
+    # sıralanıp önek toplamlarıyla pencere sınırlarında okunur. timeline
+    # verilmezse (ya da dizi tabanlı değilse) kullanım ve kuyruk boyu None olur.
+    if isinstance(processes, ProcessTable):
+        arrival, start, completion = processes.arrival.astype(np.int64), processes.start, processes.completion
+        burst = processes.burst.astype(np.int64)
+    else:
+        n = len(processes)
+        arrival = np.fromiter((p.arrival for p in processes), dtype=np.int64, count=n)
+        start = np.fromiter((p.start_time for p in processes), dtype=np.int64, count=n)
+        completion = np.fromiter((p.completion for p in processes), dtype=np.int64, count=n)
+        burst = np.fromiter((p.burst for p in processes), dtype=np.int64, count=n)
+    ran = start >= 0
+    done = completion > 0
+    horizon = int(max(arrival.max(initial=0), completion.max(initial=0)))
+    bounds = window_edges(horizon, width, edges)
+    
+    sorted_arrival = np.sort(arrival)
+    order = np.argsort(completion[done], kind='stable')
+    done_completion = completion[done][order]
+    waits = np.maximum(completion[done] - arrival[done] - burst[done], 0)[order]
+    wait_prefix = np.concatenate(([0], np.cumsum(waits, dtype=np.int64)))
+    arrivals = np.diff(np.searchsorted(sorted_arrival, bounds, side='left'))
+    finished = np.searchsorted(done_completion, bounds, side='left')
+    waits = np.diff(wait_prefix[finished])
+    
+    # Sistemdeki süreç sayısının integrali: varışların rampası - bitişlerinkinin
+    in_arrival = np.sort(arrival[ran])
+    in_completion = np.sort(completion[ran])
+    area = (_cumulative_area(in_arrival, np.concatenate(([0], np.cumsum(in_arrival))), bounds)
+            - _cumulative_area(in_completion, np.concatenate(([0], np.cumsum(in_completion))), bounds))
+    area = np.diff(area)
+    
+    cores = 1
+    busy = None
+    if timeline is not None and hasattr(timeline, 'cores'):
+        cores = len(timeline.cores)
+        busy = np.diff(sum(_busy_until(core, bounds) for core in timeline.cores))
+    elif timeline is not None and hasattr(timeline, 'arrays'):
+        busy = np.diff(_busy_until(timeline, bounds))
+    
+    return [_window(bounds[k], bounds[k + 1], arrivals[k], finished[k + 1] - finished[k], finished[k + 1],
+                    int(busy[k]) if busy is not None else None, int(area[k]), int(waits[k]), cores)
+            for k in range(len(bounds) - 1)]
+
+class WindowMonitor:
+    # Akış motorları için artımlı sürüm. Motor varışları, meşgul dilimleri ve
+    # bitişleri bildirir; bir pencerenin tüm olayları kesinleşince (bkz.
+    # ready) Window kaydı üretilir. Her olay yalnızca kendi penceresine
+    # yazılır; pencere başındaki sistem doluluğu taşınan sayaçla eklenir.
+    def __init__(self, width=None, edges=None):
+        if edges is not None:
+            self.edges = window_edges(0, edges=edges).tolist()
+            self.width = None
+        else:
+            if width is None or width <= 0:
+                raise ValueError("window width must be positive")
+            self.edges = None
+            self.width = width
+        # pencere no -> [varış, bitiş, meşgul, alan rampası, sistem değişimi, bekleme toplamı]
+        self.windows = {}
+        self.next = 0
+        self.in_system = 0  # self.next penceresinin başında sistemdeki süreç sayısı
+        self.completed_total = 0
+        self.last = -1  # olay görülen en son pencere
+    
+    def _index(self, t):
+        if self.edges is None:
+            return t // self.width
+        k = bisect.bisect_right(self.edges, t) - 1
+        return k if k < len(self.edges) - 1 else None
+    
+    def _bounds(self, k):
+        if self.edges is None:
+            return k * self.width, (k + 1) * self.width
+        return self.edges[k], self.edges[k + 1]
+    
+    def _slot(self, t):
+        # Olayın penceresi; ilk sınırdan önceki olaylar yalnızca doluluğa,
+        # son sınırdan sonrakiler hiçbir yere sayılmaz
+        k = self._index(t)
+        if k is None:
+            return None, None
+        if k < 0:
+            return -1, None
+        if k > self.last:
+            self.last = k
+        slot = self.windows.get(k)
+        if slot is None:
+            slot = self.windows[k] = [0, 0, 0, 0, 0, 0]
+        return k, slot
+    
+    def arrive(self, t, queued=True):
+        k, slot = self._slot(t)
+        if k == -1:
+            self.in_system += queued
+        elif slot is not None:
+            slot[0] += 1
+            if queued:
+                slot[3] += self._bounds(k)[1] - t
+                slot[4] += 1
+    
+    def complete(self, arrival, burst, t):
+        k, slot = self._slot(t)
+        if k == -1:
+            self.in_system -= 1
+            self.completed_total += t > 0
+        elif slot is not None:
+            slot[3] -= self._bounds(k)[1] - t
+            slot[4] -= 1
+            if t > 0:
+                slot[1] += 1
+                slot[5] += max(t - arrival - burst, 0)
+    
+    def busy(self, start, end):
+        while start < end:
+            k, slot = self._slot(start)
+            if k is None:
+                return
+            if k == -1:
+                start = self.edges[0]
+                continue
+            upper = min(end, self._bounds(k)[1])
+            slot[2] += upper - start
+            start = upper
+    
+    def ready(self, limit):
+        # Bitişi limit'i geçmeyen pencereleri sırayla üretir; limit None ise
+        # olay görülen son pencereye kadar hepsini
+        count = None if self.edges is None else len(self.edges) - 1
+        while count is None or self.next < count:
+            k = self.next
+            begin, end = self._bounds(k)
+            if limit is None and k > self.last and count is None:
+                return
+            if limit is not None and end > limit:
+                return
+            arrivals, completed, busy, ramp, delta, wait_sum = self.windows.pop(k, (0, 0, 0, 0, 0, 0))
+            self.completed_total += completed
+            yield _window(begin, end, arrivals, completed, self.completed_total, busy,
+                          self.in_system * (end - begin) + ramp, wait_sum, 1)
+            self.in_system += delta
+            self.next += 1
@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from process import ProcessTable
+from utils import CSV_CHUNK_SIZE, CsvReader, read_csv
+
+# İkili iş yükü dosyası (.wl) düzeni:
+#   8 bayt sihirli değer, 4 bayt başlık uzunluğu, JSON başlık,
+#   ardından 64 bayta hizalanmış sütun blokları (arrival, burst, priority_num,
+#   pids). Sütunlar ProcessTable'ın kullandığı tiplerle yazılır; böylece dosya
+#   np.memmap ile açılıp ayrıştırma ya da kopyalama olmadan kullanılabilir.
+WORKLOAD_MAGIC = b'CPUWL\x00\x01\x00'
+WORKLOAD_SUFFIX = '.wl'
+_ALIGN = 64
+_INT_COLUMNS = ('arrival', 'burst', 'priority_num')
+
+def _aligned(offset):
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def _layout(count, pid_width):
+    # Başlık ve her sütunun dosyadaki konumu
+    columns = [(name, '<i4') for name in _INT_COLUMNS] + [('pids', f'<U{pid_width}')]
+    header = {'version': 1, 'count': count, 'pid_width': pid_width, 'columns': []}
+    # Başlık boyutu ofsetlere bağlı olduğundan geniş bir yer ayrılır
+    offset = _ALIGN * 8
+    for name, dtype in columns:
+        header['columns'].append({'name': name, 'dtype': dtype, 'offset': offset})
+        offset = _aligned(offset + np.dtype(dtype).itemsize * count)
+    return header
+
+def _write_header(file, header):
+    raw = json.dumps(header).encode()
+    if 12 + len(raw) > header['columns'][0]['offset']:
+        raise ValueError("workload header too large")
+    file.write(WORKLOAD_MAGIC)
+    file.write(len(raw).to_bytes(4, 'little'))
+    file.write(raw)
+
+def save_workload(table, filename):
+    pids = np.asarray(table.pids, dtype=str)
+    header = _layout(len(table), max(pids.dtype.itemsize // 4, 1))
+    with open(filename, 'wb') as f:
+        _write_header(f, header)
+        for column in header['columns']:
+            data = pids if column['name'] == 'pids' else getattr(table, column['name'])
+            f.seek(column['offset'])
+            f.write(np.ascontiguousarray(data, dtype=column['dtype']).tobytes())
+        f.truncate(_aligned(f.tell()))
+    return filename
+
+def convert_csv(csv_path, filename=None, chunk_size=CSV_CHUNK_SIZE):
+    # CSV'yi parça parça okuyup sütunları geçici dosyalara ekler; PID
+    # genişliği ancak sonda bilindiği için PID'ler son adımda yeniden yazılır.
+    if filename is None:
+        filename = os.path.splitext(csv_path)[0] + WORKLOAD_SUFFIX
+    reader = CsvReader(csv_path, chunk_size)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(filename))) as tmp:
+        parts = {name: open(os.path.join(tmp, name), 'wb') for name in _INT_COLUMNS + ('pids',)}
+        pid_batches = []
+        count = 0
+        try:
+            for batch in reader:
+                for name in _INT_COLUMNS:
+                    parts[name].write(np.ascontiguousarray(getattr(batch, name), dtype='<i4').tobytes())
+                pids = np.asarray(batch.pids, dtype=str)
+                parts['pids'].write(pids.tobytes())
+                pid_batches.append((len(pids), pids.dtype.itemsize // 4))
+                count += len(batch)
+        finally:
+            for part in parts.values():
+                part.close()
+        
+        pid_width = max([width for _, width in pid_batches] + [1])
+        header = _layout(count, pid_width)
+        with open(filename, 'wb') as f:
+            _write_header(f, header)
+            for column in header['columns']:
+                f.seek(column['offset'])
+                with open(os.path.join(tmp, column['name']), 'rb') as part:
+                    if column['name'] != 'pids':
+                        shutil.copyfileobj(part, f, 1 << 24)
+                        continue
+                    for n, width in pid_batches:
+                        batch = np.frombuffer(part.read(n * width * 4), dtype=f'<U{width}')
+                        f.write(batch.astype(column['dtype']).tobytes())
+            f.truncate(_aligned(f.tell()))
+    
+    print(f"Converted {count} processes: {csv_path} -> {filename} ({reader.errors} invalid rows skipped)")
+    return filename
+
+def load_workload(filename):
+    # Sütunlar salt okunur np.memmap görünümleridir; veriler ancak
+    # dokunuldukça diskten sayfa sayfa okunur.
+    with open(filename, 'rb') as f:
+        if f.read(len(WORKLOAD_MAGIC)) != WORKLOAD_MAGIC:
+            raise ValueError(f"'{filename}' is not a workload file")
+        header = json.loads(f.read(int.from_bytes(f.read(4), 'little')))
+    
+    count = header['count']
+    columns = {}
+    for column in header['columns']:
+        if count == 0:
+            columns[column['name']] = np.zeros(0, dtype=column['dtype'])
+        else:
+            columns[column['name']] = np.memmap(filename, dtype=column['dtype'], mode='r',
+                                                offset=column['offset'], shape=(count,))
+    return ProcessTable(columns['pids'], columns['arrival'], columns['burst'], columns['priority_num'])
+
+def load_processes(filename):
+    # Uzantıya göre CSV ya da ikili iş yükü yükle
+    if filename.endswith(WORKLOAD_SUFFIX):
+        return load_workload(filename)
+    return read_csv(filename)
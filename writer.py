@@ -0,0 +1,113 @@
+import json
+import os
+import queue
+import threading
+import numpy as np
+from process import PRIORITY_NAMES, ProcessTable
+
+# Biçim -> dosya uzantısı. csv ve jsonl satır satır, npz sütun sütun yazılır.
+RESULT_FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'npz': '.npz'}
+RESULT_COLUMNS = ('pid', 'arrival', 'burst', 'priority', 'start', 'completion', 'response', 'waiting', 'turnaround',
+                  'slices')
+WRITE_CHUNK_ROWS = 1 << 16
+WRITE_BUFFER = 1 << 20
+
+def process_columns(processes):
+    # Süreç başına tüm metrikler, tablo sırasıyla. response, waiting ve
+    # turnaround calculate_statistics ile aynı tanımlıdır (bitmemiş
+    # süreçler için 0).
+    table = ProcessTable.of(processes)
+    done = table.completion > 0
+    turnaround = np.where(done, table.completion - table.arrival, 0)
+    names = np.array(['low'] + [PRIORITY_NAMES[k] for k in (1, 2, 3)])
+    return {
+        'pid': np.asarray(table.pids, dtype=str),
+        'arrival': table.arrival,
+        'burst': table.burst,
+        'priority': names[table.priority_num],
+        'start': table.start,
+        'completion': table.completion,
+        'response': np.where(done, table.start - table.arrival, 0),
+        'waiting': np.where(done, np.maximum(turnaround - table.burst, 0), 0),
+        'turnaround': turnaround,
+        'slices': table.slices,
+    }
+
+def _text_rows(columns, fmt):
+    # Satır şablonu bir kez kurulur; her parça tek bir büyük write ile yazılır
+    if fmt == 'csv':
+        template = ",".join("%s" for _ in RESULT_COLUMNS) + "\n"
+        quote = None
+    else:
+        template = "{" + ", ".join(f'"{name}": %s' for name in RESULT_COLUMNS) + "}\n"
+        quote = json.dumps
+    n = len(columns['pid'])
+    for start in range(0, n, WRITE_CHUNK_ROWS):
+        end = start + WRITE_CHUNK_ROWS
+        parts = [columns[name][start:end].tolist() for name in RESULT_COLUMNS]
+        if quote is not None:
+            parts[0] = [quote(pid) for pid in parts[0]]
+            parts[3] = [quote(priority) for priority in parts[3]]
+        yield "".join([template % row for row in zip(*parts)])
+
+def write_process_results(processes, filename, fmt=None):
+    # Tüm süreçlerin sonuçlarını yazar; fmt verilmezse uzantıdan anlaşılır.
+    # Yarım dosya kalmaması için önce geçici dosyaya yazılır. Hata olursa
+    # None döner.
+    if fmt is None:
+        fmt = next((name for name, suffix in RESULT_FORMATS.items() if filename.endswith(suffix)), 'csv')
+    try:
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        columns = process_columns(processes)
+        temp_path = filename + '.tmp'
+        if fmt == 'npz':
+            with open(temp_path, 'wb', buffering=WRITE_BUFFER) as f:
+                np.savez(f, **columns)
+        else:
+            with open(temp_path, 'w', buffering=WRITE_BUFFER, newline='') as f:
+                if fmt == 'csv':
+                    f.write(",".join(RESULT_COLUMNS) + "\n")
+                for chunk in _text_rows(columns, fmt):
+                    f.write(chunk)
+        os.replace(temp_path, filename)
+        print(f"Process results saved: {filename}")
+        return filename
+    except Exception as e:
+        print(f"Error saving process results: {e}")
+        return None
+
+class ResultWriter:
+    # Yazma işlerini tek bir arka plan iş parçacığında sırayla çalıştırır;
+    # böylece disk G/Ç'si sonraki algoritmanın simülasyonuyla örtüşür. Kuyruk
+    # sınırlıdır: yazıcı geride kalırsa submit bekler ve bellek şişmez.
+    def __init__(self, max_pending=4):
+        self.jobs = queue.Queue(max_pending)
+        self.errors = []
+        self.thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            function, args = job
+            try:
+                function(*args)
+            except Exception as e:
+                self.errors.append(e)
+                print(f"Error in result writer: {e}")
+    
+    def submit(self, function, *args):
+        self.jobs.put((function, args))
+    
+    def close(self):
+        # Bekleyen tüm işler bitene kadar bekler
+        self.jobs.put(None)
+        self.thread.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()